@@ -0,0 +1,319 @@
+from swift_conductor.automation.polling_interval import AdaptivePollingInterval
+from swift_conductor.configuration import Configuration
+from swift_conductor.settings.metrics_settings import MetricsSettings
+from swift_conductor.settings.task_update_settings import TaskUpdateSettings
+from swift_conductor.http.async_api_client import AsyncApiClient
+from swift_conductor.http.api.async_task_resource_api import AsyncTaskResourceApi
+from swift_conductor.http.models.task import Task
+from swift_conductor.http.models.task_result import TaskResult
+from swift_conductor.http.models.task_exec_log import TaskExecLog
+from swift_conductor.http.rest import ApiException
+from swift_conductor.telemetry.metrics_collector import MetricsCollector
+from swift_conductor.worker.worker_abc import WorkerAbc
+from swift_conductor.automation.worker_process import BATCH_POLL_UNSUPPORTED_STATUSES
+from typing import List, Optional
+import asyncio
+import logging
+import time
+import traceback
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+
+class AsyncWorkerHost:
+    """Runs many workers on a single asyncio event loop.
+
+    Workers whose `execute_async` awaits I/O (e.g. a `WorkerImpl` wrapping an
+    `async def` function) share one thread and one HTTP transport. Each worker
+    keeps up to `thread_count` tasks in flight at the same time.
+    """
+
+    def __init__(
+            self,
+            workers: List[WorkerAbc] = None,
+            configuration: Configuration = None,
+            metrics_settings: MetricsSettings = None,
+            task_update_settings: TaskUpdateSettings = None,
+    ):
+        if workers is None:
+            workers = []
+        elif not isinstance(workers, list):
+            workers = [workers]
+
+        for worker in workers:
+            if not isinstance(worker, WorkerAbc):
+                raise Exception('Invalid worker type. Must be of type WorkerAbc.')
+
+        if not isinstance(configuration, Configuration):
+            configuration = Configuration()
+
+        self.workers = workers
+        self.configuration = configuration
+        self.task_update_settings = task_update_settings
+        self.metrics_collector = None
+
+        if metrics_settings is not None:
+            self.metrics_collector = MetricsCollector(metrics_settings)
+
+    def run(self) -> None:
+        asyncio.run(self.run_async())
+
+    async def run_async(self) -> None:
+        self.configuration.apply_logging_config()
+        self.__size_connection_pool()
+
+        async with AsyncApiClient(self.configuration) as api_client:
+            task_client = AsyncTaskResourceApi(api_client)
+            runners = [
+                AsyncWorkerRunner(worker, task_client, self.metrics_collector, self.task_update_settings)
+                for worker in self.workers
+            ]
+            logger.info(f'Running {len(runners)} workers on the event loop')
+            await asyncio.gather(*[runner.run() for runner in runners])
+
+    def __size_connection_pool(self) -> None:
+        # The poll of each worker and the update of each task in flight
+        # may all hold a connection at the same time
+        connections = sum(worker.get_thread_count() + 1 for worker in self.workers)
+        if self.configuration.pool_maxsize >= connections:
+            return
+        logger.info(f'Raising pool_maxsize from {self.configuration.pool_maxsize} to {connections} for {len(self.workers)} workers')
+        self.configuration.pool_maxsize = connections
+
+
+class AsyncWorkerRunner:
+    """Poll, execute and update loop of a single worker on the event loop."""
+
+    def __init__(
+            self,
+            worker: WorkerAbc,
+            task_client: AsyncTaskResourceApi,
+            metrics_collector: MetricsCollector = None,
+            task_update_settings: TaskUpdateSettings = None,
+    ):
+        self.worker = worker
+        self.task_client = task_client
+        self.metrics_collector = metrics_collector
+        if task_update_settings is None:
+            task_update_settings = TaskUpdateSettings()
+        self.task_update_settings = task_update_settings
+        self._running_tasks = set()
+        # Updates retried in the background, so they do not hold a slot
+        self._retrying_updates = set()
+        self._batch_poll_supported = True
+        self._polling_interval = None
+
+    async def run(self) -> None:
+        if self.metrics_collector is not None:
+            self.metrics_collector.bind_task_metrics(self.worker.task_definition_name)
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.error(f'Uncaught exception in worker loop, reason: {traceback.format_exc()}')
+
+    async def run_once(self) -> None:
+        task_definition_name = self.worker.get_task_definition_name()
+
+        free_slots = self.worker.get_thread_count() - len(self._running_tasks)
+        if free_slots <= 0:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_execution_queue_full(task_definition_name)
+            logger.debug(f'All slots are busy, skip polling task for: {task_definition_name}')
+            polled_tasks = None
+        else:
+            polled_tasks = 0
+            tasks = await self._poll_tasks(task_definition_name, free_slots)
+            for task in tasks[:free_slots]:
+                if task == None or task.task_id == None:
+                    continue
+                running_task = asyncio.ensure_future(
+                    self.__execute_and_update_task(task, task_definition_name)
+                )
+                self._running_tasks.add(running_task)
+                running_task.add_done_callback(self._running_tasks.discard)
+                polled_tasks += 1
+
+        polling_interval = self.__get_polling_interval(polled_tasks)
+
+        if self.metrics_collector is not None:
+            self.metrics_collector.record_task_poll_interval(task_definition_name, polling_interval)
+
+        await asyncio.sleep(polling_interval)
+        self.worker.clear_task_definition_name_cache()
+
+    def __get_polling_interval(self, polled_tasks: Optional[int]) -> float:
+        max_polling_interval = self.worker.get_max_polling_interval_in_seconds()
+        if max_polling_interval is None:
+            self._polling_interval = None
+            return self.worker.get_polling_interval_in_seconds()
+
+        if self._polling_interval is None:
+            self._polling_interval = AdaptivePollingInterval(
+                self.worker.get_polling_interval_in_seconds(),
+                max_polling_interval
+            )
+
+        if polled_tasks is None:
+            return self._polling_interval.on_busy()
+        if polled_tasks > 0:
+            return self._polling_interval.on_tasks_received()
+        return self._polling_interval.on_empty_poll()
+
+    async def _poll_tasks(self, task_definition_name: str, count: int) -> List[Task]:
+        if self.worker.paused():
+            logger.debug(f'Stop polling task for: {task_definition_name}')
+            return []
+
+        if self.metrics_collector is not None:
+            self.metrics_collector.increment_task_poll(task_definition_name)
+
+        params = {'workerid': self.worker.get_identity()}
+        domain = self.worker.get_domain()
+        if domain != None:
+            params['domain'] = domain
+
+        try:
+            start_time = time.time()
+
+            tasks = None
+            if count > 1 and self._batch_poll_supported:
+                tasks = await self.__batch_poll(task_definition_name, count, params)
+            if tasks is None:
+                tasks = [await self.task_client.poll(tasktype=task_definition_name, **params)]
+
+            time_spent = time.time() - start_time
+
+            if self.metrics_collector is not None:
+                self.metrics_collector.record_task_poll_time(task_definition_name, time_spent)
+        except Exception as e:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_poll_error(task_definition_name, type(e))
+
+            logger.error(f'Failed to poll task for: {task_definition_name}, reason: {traceback.format_exc()}')
+            return []
+
+        return [task for task in tasks if task != None]
+
+    async def __batch_poll(self, task_definition_name: str, count: int, params: dict) -> List[Task]:
+        try:
+            return await self.task_client.batch_poll(
+                tasktype=task_definition_name,
+                count=count,
+                timeout=self.worker.get_poll_timeout_in_milliseconds(),
+                **params
+            ) or []
+        except ApiException as e:
+            if e.status not in BATCH_POLL_UNSUPPORTED_STATUSES:
+                raise
+
+        logger.warning(f'Batch poll is not supported by the server, falling back to single task poll for: {task_definition_name}')
+        self._batch_poll_supported = False
+        return None
+
+    async def __execute_and_update_task(self, task: Task, task_definition_name: str) -> None:
+        try:
+            started_at = time.time()
+            task_result = await self._execute_task(task, task_definition_name)
+            await self._update_task(task_result, task_definition_name, started_at)
+        except Exception:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_uncaught_exception()
+
+            logger.error(f'Uncaught exception while processing task: {task.task_id}, reason: {traceback.format_exc()}')
+
+    async def _execute_task(self, task: Task, task_definition_name: str) -> TaskResult:
+        logger.debug(f'Executing task, id: {task.task_id}, workflow_instance_id: {task.workflow_instance_id}, task_definition_name: {task_definition_name}')
+
+        if self.metrics_collector is not None:
+            self.metrics_collector.measure_task_input_payload(task_definition_name, task.input_data, self.__serialize)
+
+        try:
+            start_time = time.time()
+
+            task_result = await self.worker.execute_async(task)
+
+            time_spent = time.time() - start_time
+
+            if self.metrics_collector is not None:
+                self.metrics_collector.record_task_execute_time(task_definition_name, time_spent)
+        except Exception as e:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_execution_error(task_definition_name, type(e))
+
+            task_result = TaskResult(
+                task_id=task.task_id,
+                workflow_instance_id=task.workflow_instance_id,
+                worker_id=self.worker.get_identity()
+            )
+
+            task_result.status = 'FAILED'
+            task_result.reason_for_incompletion = str(e)
+            task_result.logs = [
+                TaskExecLog(traceback.format_exc(), task_result.task_id, int(time.time()))
+            ]
+
+            logger.error(f'Failed to execute task, id: {task.task_id}, workflow_instance_id: {task.workflow_instance_id}, task_definition_name: {task_definition_name}, reason: {traceback.format_exc()}')
+
+        return task_result
+
+    async def _update_task(self, task_result: TaskResult, task_definition_name: str, started_at: float = None):
+        if not isinstance(task_result, TaskResult):
+            return None
+
+        body = task_result
+        if self.metrics_collector is not None:
+            body = self.metrics_collector.measure_task_result_payload(task_definition_name, task_result, self.__serialize)
+
+        sent, response = await self.__send_update(task_result, task_definition_name, 0, started_at, body)
+        if not sent and self.task_update_settings.max_retries > 0:
+            retry = asyncio.ensure_future(
+                self.__retry_update(task_result, task_definition_name, started_at, body)
+            )
+            self._retrying_updates.add(retry)
+            retry.add_done_callback(self._retrying_updates.discard)
+        return response
+
+    async def __retry_update(self, task_result: TaskResult, task_definition_name: str, started_at: float, body) -> None:
+        for attempt in range(1, self.task_update_settings.max_retries + 1):
+            backoff = min(
+                self.task_update_settings.retry_backoff * (2 ** (attempt - 1)),
+                self.task_update_settings.max_retry_backoff
+            )
+            await asyncio.sleep(backoff)
+            sent, _ = await self.__send_update(task_result, task_definition_name, attempt, started_at, body)
+            if sent:
+                return
+
+        logger.error(f'Gave up updating task, id: {task_result.task_id}, workflow_instance_id: {task_result.workflow_instance_id}, task_definition_name: {task_definition_name}')
+
+    async def __send_update(self, task_result: TaskResult, task_definition_name: str, attempt: int, started_at: float, body) -> tuple:
+        """:return: whether the update was accepted, and the response"""
+        try:
+            start_time = time.time()
+
+            response = await self.task_client.update_task(body=body)
+
+            finish_time = time.time()
+
+            if self.metrics_collector is not None:
+                self.metrics_collector.record_task_update_time(task_definition_name, finish_time - start_time)
+                if started_at is not None:
+                    self.metrics_collector.record_task_end_to_end_time(task_definition_name, finish_time - started_at)
+
+            logger.debug(f'Updated task, id: {task_result.task_id}, workflow_instance_id: {task_result.workflow_instance_id}, task_definition_name: {task_definition_name}, response: {response}')
+
+            return True, response
+        except Exception as e:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_update_error(task_definition_name, type(e))
+
+            logger.error(f'Failed to update task, id: {task_result.task_id}, workflow_instance_id: {task_result.workflow_instance_id}, task_definition_name: {task_definition_name}, attempt: {attempt + 1}, reason: {traceback.format_exc()}')
+            return False, None
+
+    def __serialize(self, obj) -> bytes:
+        return self.task_client.api_client.api_client.serialize(obj)
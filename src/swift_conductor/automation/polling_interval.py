@@ -0,0 +1,40 @@
+import random
+
+
+class AdaptivePollingInterval:
+    """Computes how long a worker waits before its next poll.
+
+    While polls keep returning tasks the worker polls again right away. Every
+    empty poll doubles the wait, starting from the worker polling interval, up
+    to `max_interval`. A random jitter spreads the polls of idle workers so
+    they do not hit the server at the same moment.
+
+    All values are in seconds.
+    """
+
+    def __init__(self, min_interval: float, max_interval: float, multiplier: float = 2.0, jitter: float = 0.1):
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self._backoff = 0.0
+        self.current = min_interval
+
+    def on_tasks_received(self) -> float:
+        self._backoff = 0.0
+        self.current = 0.0
+        return self.current
+
+    def on_empty_poll(self) -> float:
+        if self._backoff == 0.0:
+            self._backoff = self.min_interval
+        else:
+            self._backoff = min(self._backoff * self.multiplier, self.max_interval)
+        jitter = random.uniform(-self.jitter, self.jitter) * self._backoff
+        self.current = min(max(self._backoff + jitter, 0.0), self.max_interval)
+        return self.current
+
+    def on_busy(self) -> float:
+        # Nothing was polled because all threads are busy, wait for one to finish
+        self.current = self.min_interval
+        return self.current
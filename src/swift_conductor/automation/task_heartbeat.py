@@ -0,0 +1,138 @@
+from swift_conductor.configuration import Configuration
+from swift_conductor.http.api.task_resource_api import TaskResourceApi
+from swift_conductor.http.models.task import Task
+from swift_conductor.http.models.task_result import TaskResult
+from swift_conductor.http.models.task_result_status import TaskResultStatus
+from swift_conductor.telemetry.metrics_collector import MetricsCollector
+import heapq
+import itertools
+import logging
+import math
+import threading
+import time
+import traceback
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+# Heartbeats a task may miss before the server hands it to another worker
+MISSED_HEARTBEATS = 2
+
+
+class TaskHeartbeat:
+    """Keeps the server from timing out or requeueing tasks while they execute.
+
+    Every `interval` seconds, each task added with `add` is updated as
+    IN_PROGRESS with `callback_after_seconds` set to MISSED_HEARTBEATS
+    intervals, which resets the response timeout of the task and postpones
+    it in the task queue. A single background thread sends the heartbeats of
+    all the tasks in flight. Heartbeats of a task stop when it is removed,
+    once its execution finishes; if the worker dies instead, the task is
+    polled again after `callback_after_seconds`.
+    """
+
+    def __init__(
+            self,
+            task_client: TaskResourceApi,
+            interval: float,
+            metrics_collector: MetricsCollector = None,
+    ):
+        self.task_client = task_client
+        self.interval = interval
+        self.callback_after_seconds = max(math.ceil(interval * MISSED_HEARTBEATS), 1)
+        self.metrics_collector = metrics_collector
+
+        self._condition = threading.Condition()
+        # task id -> (task, task definition name, worker id)
+        self._tasks = {}
+        # (due time, sequence, task id, entry) of the next heartbeat of each task
+        self._schedule = []
+        self._sequence = itertools.count()
+        self._stopped = False
+        self._thread = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self.__run, name='task-heartbeat', daemon=True)
+        self._thread.start()
+
+    def add(self, task: Task, task_definition_name: str, worker_id: str) -> None:
+        """Sends heartbeats for a task, starting one interval from now."""
+        entry = (task, task_definition_name, worker_id)
+        with self._condition:
+            self._tasks[task.task_id] = entry
+            self.__schedule(task.task_id, entry, time.monotonic() + self.interval)
+            self._condition.notify_all()
+
+    def remove(self, task_id: str) -> None:
+        """Stops the heartbeats of a task. A heartbeat already being sent may
+        still reach the server, which ignores it if the task has completed."""
+        with self._condition:
+            # The schedule entry is skipped when it comes due
+            self._tasks.pop(task_id, None)
+
+    def stop(self, timeout: float = None) -> None:
+        """Stops sending heartbeats, waiting up to timeout seconds for one
+        being sent."""
+        with self._condition:
+            self._stopped = True
+            self._tasks.clear()
+            self._schedule.clear()
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def __schedule(self, task_id: str, entry: tuple, due: float) -> None:
+        heapq.heappush(self._schedule, (due, next(self._sequence), task_id, entry))
+
+    def __run(self) -> None:
+        while True:
+            entry = self.__next_due()
+            if entry is None:
+                return
+            self.__send_heartbeat(*entry)
+
+    def __next_due(self) -> tuple:
+        """Waits until a heartbeat is due and schedules the following one.
+
+        :return: (task, task definition name, worker id), or None once stopped
+        """
+        with self._condition:
+            while not self._stopped:
+                if not self._schedule:
+                    self._condition.wait()
+                    continue
+                due, _, task_id, entry = self._schedule[0]
+                if self._tasks.get(task_id) is not entry:
+                    # Removed, or added again with a new schedule entry
+                    heapq.heappop(self._schedule)
+                    continue
+                now = time.monotonic()
+                if due > now:
+                    self._condition.wait(due - now)
+                    continue
+                heapq.heappop(self._schedule)
+                self.__schedule(task_id, entry, now + self.interval)
+                return entry
+            return None
+
+    def __send_heartbeat(self, task: Task, task_definition_name: str, worker_id: str) -> None:
+        task_result = TaskResult(
+            task_id=task.task_id,
+            workflow_instance_id=task.workflow_instance_id,
+            worker_id=worker_id,
+            status=TaskResultStatus.IN_PROGRESS,
+            callback_after_seconds=self.callback_after_seconds,
+        )
+        try:
+            self.task_client.update_task(body=task_result)
+            logger.debug(f'Sent heartbeat for task: {task.task_id}, task_definition_name: {task_definition_name}')
+        except Exception as e:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_heartbeat_error(task_definition_name, type(e))
+            # Sent again at the next interval
+            logger.warning(f'Failed to send heartbeat for task: {task.task_id}, task_definition_name: {task_definition_name}, reason: {traceback.format_exc()}')
@@ -0,0 +1,291 @@
+from swift_conductor.configuration import Configuration
+from swift_conductor.settings.task_update_settings import TaskUpdateSettings
+from swift_conductor.http.api.task_resource_api import TaskResourceApi
+from swift_conductor.http.models.task_result import TaskResult
+from swift_conductor.telemetry.metrics_collector import MetricsCollector
+from collections import deque
+from typing import List
+import heapq
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+import traceback
+import uuid
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+SPILL_FILE_PREFIX = 'task_results_'
+SPILL_FILE_SUFFIX = '.jsonl'
+
+
+class TaskUpdater:
+    """Sends task results to the server from background threads.
+
+    Results are handed over with `submit` and taken in order by
+    `thread_count` threads that send them, so as many updates can be in
+    flight as tasks are executed at the same time. Failed updates are retried with
+    exponential backoff without holding up the results queued behind them. Results that still fail after all retries are written to the
+    spill directory, if one is set, and sent again by `start`.
+    """
+
+    def __init__(
+            self,
+            task_client: TaskResourceApi,
+            settings: TaskUpdateSettings = None,
+            metrics_collector: MetricsCollector = None,
+            thread_count: int = 1,
+    ):
+        if settings is None:
+            settings = TaskUpdateSettings()
+        self.task_client = task_client
+        self.settings = settings
+        self.metrics_collector = metrics_collector
+        self.thread_count = max(thread_count, 1)
+
+        self._condition = threading.Condition()
+        self._pending = deque()
+        self._retries = []
+        self._sequence = itertools.count()
+        # Results submitted and not yet sent, given up on or spilled
+        self._size = 0
+        self._threads = []
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        for i in range(self.thread_count):
+            thread = threading.Thread(target=self.__run, name=f'task-updater-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        self.__replay_spilled_results()
+
+    def submit(self, task_result: TaskResult, task_definition_name: str, started_at: float = None) -> None:
+        """Queues a task result to be sent.
+
+        :param started_at: time.time() when the task execution started, to
+            record the end-to-end latency once the result is sent
+        """
+        # Measured once, by the submitting thread, and reused by the retries
+        body = self.__get_body(task_result, task_definition_name)
+        with self._condition:
+            if self._size >= self.settings.queue_size:
+                logger.warning(f'Task update queue is full, waiting to submit task: {task_result.task_id}')
+            while self._size >= self.settings.queue_size:
+                self._condition.wait()
+            self._size += 1
+            self._pending.append((task_result, task_definition_name, 0, started_at, body))
+            self._condition.notify_all()
+
+    def update(self, task_result: TaskResult, task_definition_name: str, started_at: float = None):
+        """Sends a task result once, from the calling thread, without retries.
+
+        :return: response of the server, or None if the update failed
+        """
+        body = self.__get_body(task_result, task_definition_name)
+        _, response = self.__send(task_result, task_definition_name, 0, started_at, body)
+        return response
+
+    def flush(self, timeout: float = None) -> bool:
+        """Waits until every submitted result has been sent or given up on.
+
+        :return: True if nothing is left to send
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._size > 0:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def stop(self, timeout: float = None) -> List[str]:
+        """Waits until every submitted result has been sent, or until the
+        timeout expires.
+
+        Results still queued or waiting for a retry after the timeout are
+        given up on, and written to the spill directory if one is set.
+
+        :return: task definition names of the results given up on
+        """
+        if self.flush(timeout):
+            return []
+
+        with self._condition:
+            abandoned = list(self._pending) + [retry[2] for retry in self._retries]
+            self._pending.clear()
+            self._retries.clear()
+            self._size -= len(abandoned)
+            self._condition.notify_all()
+
+        self.__spill([(task_result, task_definition_name) for task_result, task_definition_name, *_ in abandoned])
+        return [task_definition_name for _, task_definition_name, *_ in abandoned]
+
+    def __run(self) -> None:
+        while True:
+            task_result, task_definition_name, attempt, started_at, body = self.__next()
+            try:
+                self.__update_task(task_result, task_definition_name, attempt, started_at, body)
+            except Exception:
+                logger.error(f'Uncaught exception in task updater, reason: {traceback.format_exc()}')
+                self.__done()
+
+    def __next(self):
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                if self._retries and self._retries[0][0] <= now:
+                    return heapq.heappop(self._retries)[2]
+                if self._pending:
+                    return self._pending.popleft()
+                timeout = self._retries[0][0] - now if self._retries else None
+                self._condition.wait(timeout)
+
+    def __update_task(self, task_result: TaskResult, task_definition_name: str, attempt: int, started_at: float, body) -> None:
+        sent, _ = self.__send(task_result, task_definition_name, attempt, started_at, body)
+        if sent:
+            self.__done()
+            return
+
+        if attempt < self.settings.max_retries:
+            backoff = min(self.settings.retry_backoff * (2 ** attempt), self.settings.max_retry_backoff)
+            with self._condition:
+                heapq.heappush(
+                    self._retries,
+                    (time.monotonic() + backoff, next(self._sequence), (task_result, task_definition_name, attempt + 1, started_at, body))
+                )
+                self._condition.notify_all()
+            return
+
+        self.__spill([(task_result, task_definition_name)])
+        self.__done()
+
+    def __get_body(self, task_result: TaskResult, task_definition_name: str):
+        """:return: the task result, or its serialized bytes if its size was recorded"""
+        if self.metrics_collector is None:
+            return task_result
+        return self.metrics_collector.measure_task_result_payload(
+            task_definition_name, task_result, self.task_client.api_client.serialize)
+
+    def __send(self, task_result: TaskResult, task_definition_name: str, attempt: int, started_at: float, body) -> tuple:
+        """:return: whether the update was accepted, and the response"""
+        try:
+            start_time = time.time()
+
+            response = self.task_client.update_task(body=body)
+
+            finish_time = time.time()
+
+            if self.metrics_collector is not None:
+                self.metrics_collector.record_task_update_time(task_definition_name, finish_time - start_time)
+                if started_at is not None:
+                    self.metrics_collector.record_task_end_to_end_time(task_definition_name, finish_time - started_at)
+
+            logger.debug('Updated task, id: {task_id}, workflow_instance_id: {workflow_instance_id}, task_definition_name: {task_definition_name}, response: {response}'.format(
+                    task_id=task_result.task_id,
+                    workflow_instance_id=task_result.workflow_instance_id,
+                    task_definition_name=task_definition_name,
+                    response=response
+            ))
+
+            return True, response
+        except Exception as e:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_update_error(task_definition_name, type(e))
+
+            logger.error('Failed to update task, id: {task_id}, workflow_instance_id: {workflow_instance_id}, task_definition_name: {task_definition_name}, attempt: {attempt}, reason: {reason}'.format(
+                    task_id=task_result.task_id,
+                    workflow_instance_id=task_result.workflow_instance_id,
+                    task_definition_name=task_definition_name,
+                    attempt=attempt + 1,
+                    reason=traceback.format_exc()
+            ))
+            return False, None
+
+    def __done(self) -> None:
+        with self._condition:
+            self._size -= 1
+            self._condition.notify_all()
+
+    def __spill(self, results: list) -> None:
+        """Writes (task result, task definition name) pairs to a new spill file."""
+        if self.settings.spill_directory is None or not results:
+            return
+
+        path = os.path.join(
+            self.settings.spill_directory,
+            f'{SPILL_FILE_PREFIX}{os.getpid()}_{uuid.uuid4().hex}{SPILL_FILE_SUFFIX}'
+        )
+        # Written under another name and renamed once complete, so that
+        # replay never reads a file that is still being written
+        temp_path = f'{path}.tmp'
+        try:
+            with open(temp_path, 'w') as f:
+                for task_result, task_definition_name in results:
+                    f.write(json.dumps({
+                        'taskDefinitionName': task_definition_name,
+                        'taskResult': self.task_client.api_client.sanitize_for_serialization(task_result),
+                    }) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except Exception:
+            logger.error(f'Failed to spill {len(results)} task results, reason: {traceback.format_exc()}')
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+
+        for task_result, task_definition_name in results:
+            logger.warning(f'Spilled task result to {path}, id: {task_result.task_id}, task_definition_name: {task_definition_name}')
+
+    def __replay_spilled_results(self) -> None:
+        directory = self.settings.spill_directory
+        if directory is None or not os.path.isdir(directory):
+            return
+
+        for file_name in sorted(os.listdir(directory)):
+            if not (file_name.startswith(SPILL_FILE_PREFIX) and file_name.endswith(SPILL_FILE_SUFFIX)):
+                continue
+
+            # Claim the file first, so that it is replayed by a single process
+            path = os.path.join(directory, file_name)
+            claimed_path = f'{path}.{uuid.uuid4()}.replay'
+            try:
+                os.rename(path, claimed_path)
+            except OSError:
+                continue
+
+            try:
+                with open(claimed_path) as f:
+                    lines = f.readlines()
+            except Exception:
+                logger.error(f'Failed to read spilled task results from {claimed_path}, reason: {traceback.format_exc()}')
+                try:
+                    # Left for the next start to replay
+                    os.rename(claimed_path, path)
+                except OSError:
+                    pass
+                continue
+
+            results = []
+            for line_number, line in enumerate(lines, 1):
+                if not line.strip():
+                    continue
+                try:
+                    data = json.loads(line)
+                    task_result = self.task_client.api_client.deserialize_class(data['taskResult'], 'TaskResult')
+                    results.append((task_result, data['taskDefinitionName']))
+                except Exception:
+                    logger.error(f'Skipping invalid spilled task result at {path}:{line_number}, reason: {traceback.format_exc()}')
+
+            logger.info(f'Replaying {len(results)} spilled task results from {path}')
+            for task_result, task_definition_name in results:
+                self.submit(task_result, task_definition_name)
+            os.remove(claimed_path)
@@ -1,18 +1,26 @@
-from swift_conductor.automation.worker_process import WorkerProcess
+from swift_conductor.automation.worker_process import DEFAULT_SHUTDOWN_TIMEOUT, WorkerProcess
 from swift_conductor.configuration import Configuration
 from swift_conductor.settings.metrics_settings import MetricsSettings
+from swift_conductor.settings.task_update_settings import TaskUpdateSettings
 from swift_conductor.telemetry.metrics_collector import MetricsCollector
 from swift_conductor.worker.worker_impl import WorkerImpl
 from swift_conductor.worker.worker_abc import WorkerAbc
-from multiprocessing import Process, freeze_support
+from multiprocessing import Process, freeze_support, get_context
 from configparser import ConfigParser
 from typing import List
 import ast
 import astor
+import gc
+import importlib
 import inspect
 import logging
 import os
 import copy
+import signal
+import pkgutil
+import threading
+import time
+import traceback
 
 logger = logging.getLogger(
     Configuration.get_logging_formatted_name(
@@ -20,14 +28,57 @@ logger = logging.getLogger(
     )
 )
 
+# Seconds a task runner process is given to exit after its drain deadline
+# before it is killed
+SHUTDOWN_GRACE_PERIOD = 5.0
+
+# Seconds between liveness checks of the task runner processes
+SUPERVISOR_INTERVAL = 0.5
+
 class WorkerHost:
     def __init__(
             self,
             workers: List[WorkerAbc] = None,
             configuration: Configuration = None,
             metrics_settings: MetricsSettings = None,
+            task_update_settings: TaskUpdateSettings = None,
+            shutdown_timeout: float = DEFAULT_SHUTDOWN_TIMEOUT,
+            restart_backoff: float = 1.0,
+            max_restart_backoff: float = 60.0,
+            start_method: str = None,
+            prefork: bool = False,
     ):
+        # With prefork, the modules used by the task runners are imported
+        # once, and the task runner processes are forked with them loaded
+        self.prefork = prefork
+        # Whether the garbage collector was enabled before prefork disabled it
+        self._gc_enabled = True
+        if prefork:
+            if start_method not in (None, 'fork'):
+                raise ValueError(f'prefork requires the fork start method, not: {start_method}')
+            start_method = 'fork'
+        # multiprocessing start method of the task runner processes, e.g.
+        # 'spawn', the default of the platform when not set
+        self._process_class = Process if start_method is None else get_context(start_method).Process
+
         self.worker_config = load_worker_config()
+        self.task_update_settings = task_update_settings
+        # Seconds the task runners get to finish their tasks in flight when stopped
+        self.shutdown_timeout = shutdown_timeout
+        self._previous_sigterm_handler = None
+        # Wait in seconds before restarting a task runner process that exited,
+        # doubled on every restart in a row, up to max_restart_backoff. A
+        # process that ran for max_restart_backoff starts over at restart_backoff.
+        self.restart_backoff = restart_backoff
+        self.max_restart_backoff = max_restart_backoff
+        self._stopping = threading.Event()
+        # time.monotonic() after which task runners still running are killed
+        self._stop_deadline = None
+        self._supervisor = None
+
+        self.metrics_collector = None
+        if metrics_settings is not None:
+            self.metrics_collector = MetricsCollector(metrics_settings)
 
         if workers is None:
             workers = []
@@ -50,32 +101,94 @@ class WorkerHost:
         self.stop_processes()
 
     def stop_processes(self) -> None:
-        self.__stop_task_runner_processes()
+        """Stops the task runners gracefully.
+
+        Each task runner stops polling and gets shutdown_timeout seconds to
+        finish its tasks in flight. Task runners still running after that are
+        killed.
+        """
+        self._stopping.set()
+        if self._supervisor is not None and self._supervisor is not threading.current_thread():
+            self._supervisor.join()
+        self.__signal_task_runner_processes()
+        self.__join_task_runner_processes()
         self.__stop_metrics_provider_process()
+        self.__restore_stop_signal()
         logger.debug('stopped processes')
 
     def start_processes(self) -> None:
         logger.info('Starting worker processes...')
         freeze_support()
-        self.__start_task_runner_processes()
+        if self.prefork:
+            self._gc_enabled = gc.isenabled()
+            # Until the processes are forked, so that objects freed in the
+            # meantime do not leave holes in the memory pages they share
+            gc.disable()
+        try:
+            if self.prefork:
+                preload_modules()
+                self.__freeze()
+            self.__start_task_runner_processes()
+        finally:
+            self.__unfreeze()
         self.__start_metrics_provider_process()
+        # After the processes started, so that they do not inherit the handler
+        self.__handle_stop_signal()
+        self.__start_supervisor()
         logger.info('Started all processes')
 
     def join_processes(self) -> None:
+        """Waits until the task runners are stopped, e.g. after a SIGTERM,
+        and exit, and then stops the metrics provider.
+
+        As with stop_processes, task runners still running shutdown_timeout
+        seconds after the stop, plus a grace period, are killed.
+        """
+        if self._supervisor is not None:
+            self._supervisor.join()
         self.__join_task_runner_processes()
-        self.__join_metrics_provider_process()
+        self.__stop_metrics_provider_process()
+        self.__restore_stop_signal()
         logger.info('Joined all processes')
 
+    def __handle_stop_signal(self) -> None:
+        if threading.current_thread() is not threading.main_thread():
+            return
+        # Pass SIGTERM on to the task runners, so that they drain their tasks
+        # in flight and exit, which ends join_processes
+        self._previous_sigterm_handler = signal.signal(
+            signal.SIGTERM, lambda signum, frame: self.__stop_supervised_processes()
+        )
+
+    def __stop_supervised_processes(self) -> None:
+        self._stopping.set()
+        self.__signal_task_runner_processes()
+
+    def __restore_stop_signal(self) -> None:
+        if self._previous_sigterm_handler is None or threading.current_thread() is not threading.main_thread():
+            return
+        signal.signal(signal.SIGTERM, self._previous_sigterm_handler)
+        self._previous_sigterm_handler = None
+
+    def __signal_task_runner_processes(self) -> None:
+        if self._stop_deadline is None:
+            self._stop_deadline = time.monotonic() + self.shutdown_timeout + SHUTDOWN_GRACE_PERIOD
+        for task_runner_process in list(self.task_runner_processes):
+            if task_runner_process.is_alive():
+                task_runner_process.terminate()
+
     def __create_metrics_provider_process(self, metrics_settings: MetricsSettings) -> None:
         if metrics_settings == None:
             self.metrics_provider_process = None
             return
         
-        self.metrics_provider_process = Process(target=MetricsCollector.provide_metrics, args=(metrics_settings))
+        self.metrics_provider_process = Process(target=MetricsCollector.provide_metrics, args=(metrics_settings,))
         logger.info('Created MetricsProvider process')
 
     def __create_task_runner_processes(self, workers: List[WorkerAbc], configuration: Configuration, metrics_settings: MetricsSettings) -> None:
         self.task_runner_processes = []
+        # Task runner of each process, to start it again after it exited
+        self.task_runners = []
         
         for worker in workers:
             self.__create_task_runner_process(worker, configuration, metrics_settings)
@@ -83,9 +196,99 @@ class WorkerHost:
         logger.info('Created TaskRunner processes')
 
     def __create_task_runner_process(self, worker: WorkerAbc, configuration: Configuration, metrics_settings: MetricsSettings) -> None:
-        task_runner = WorkerProcess(worker, configuration, metrics_settings, self.worker_config)
-        process = Process(target=task_runner.run)
-        self.task_runner_processes.append(process)
+        task_runner = WorkerProcess(
+            worker, configuration, metrics_settings, self.worker_config, self.task_update_settings, self.shutdown_timeout
+        )
+        # The worker properties, including its process count, are set by WorkerProcess
+        for _ in range(worker.get_process_count()):
+            process = self.__create_process(task_runner)
+            self.task_runner_processes.append(process)
+            self.task_runners.append(task_runner)
+
+    def __create_process(self, task_runner: WorkerProcess) -> Process:
+        if self.prefork:
+            return self._process_class(target=self.__run_forked_task_runner, args=(task_runner,))
+        return self._process_class(target=task_runner.run, kwargs={'own_process': True})
+
+    def __run_forked_task_runner(self, task_runner: WorkerProcess) -> None:
+        # The host disabled the garbage collector while forking. The objects it
+        # froze stay out of reach of the collector of this process.
+        if self._gc_enabled:
+            gc.enable()
+        task_runner.run(own_process=True)
+
+    def __freeze(self) -> None:
+        if not self.prefork:
+            return
+        # Keeps the garbage collector of the forked processes from touching,
+        # and so copying, the objects loaded so far
+        gc.disable()
+        gc.freeze()
+
+    def __unfreeze(self) -> None:
+        if not self.prefork:
+            return
+        gc.unfreeze()
+        if self._gc_enabled:
+            gc.enable()
+
+    def __start_supervisor(self) -> None:
+        if self._supervisor is not None:
+            return
+        self._supervisor = threading.Thread(target=self.__supervise, name='worker-supervisor', daemon=True)
+        self._supervisor.start()
+
+    def __supervise(self) -> None:
+        """Restarts the task runner processes that exited, until the host is stopped."""
+        count = len(self.task_runner_processes)
+        restarts = [0] * count
+        started_at = [time.monotonic()] * count
+        restart_at = [None] * count
+
+        while not self._stopping.wait(SUPERVISOR_INTERVAL):
+            now = time.monotonic()
+            for index, process in enumerate(self.task_runner_processes):
+                if restart_at[index] is not None:
+                    if now >= restart_at[index]:
+                        restart_at[index] = None
+                        started_at[index] = now
+                        self.__restart_task_runner_process(index)
+                    continue
+
+                if process.exitcode is None:
+                    continue
+
+                if now - started_at[index] >= self.max_restart_backoff:
+                    restarts[index] = 0
+                backoff = min(self.restart_backoff * (2 ** restarts[index]), self.max_restart_backoff)
+                restarts[index] += 1
+                restart_at[index] = now + backoff
+                logger.warning(f'TaskRunner process {process.pid} for: {self.task_runners[index].worker.task_definition_name} exited with code {process.exitcode}, restarting in {backoff}s')
+
+    def __restart_task_runner_process(self, index: int) -> None:
+        task_runner = self.task_runners[index]
+        if self.metrics_collector is not None:
+            self.metrics_collector.mark_process_dead(self.task_runner_processes[index].pid)
+        process = self.__create_process(task_runner)
+        self.__freeze()
+        try:
+            process.start()
+        except Exception:
+            logger.error(f'Failed to restart TaskRunner process for: {task_runner.worker.task_definition_name}, reason: {traceback.format_exc()}')
+            return
+        finally:
+            self.__unfreeze()
+        self.task_runner_processes[index] = process
+        # The host may have been stopped while the process was starting
+        if self._stopping.is_set():
+            process.terminate()
+
+        task_definition_name = task_runner.worker.task_definition_name
+        if isinstance(task_definition_name, list):
+            task_definition_name = ','.join(task_definition_name)
+        if self.metrics_collector is not None:
+            self.metrics_collector.increment_worker_restart(task_definition_name)
+        logger.info(f'Restarted TaskRunner process {process.pid} for: {task_definition_name}')
 
     def __start_metrics_provider_process(self):
         if self.metrics_provider_process == None:
@@ -101,18 +304,20 @@ class WorkerHost:
         
         logger.info('Started TaskRunner processes')
 
-    def __join_metrics_provider_process(self):
-        if self.metrics_provider_process == None:
-            return
-        
-        self.metrics_provider_process.join()
-        
-        logger.info('Joined MetricsProvider processes')
-
     def __join_task_runner_processes(self):
         for task_runner_process in self.task_runner_processes:
-            task_runner_process.join()
-        
+            if self._stop_deadline is None:
+                task_runner_process.join()
+            elif task_runner_process.is_alive():
+                task_runner_process.join(max(self._stop_deadline - time.monotonic(), 0))
+        # Kills the task runners that did not drain in time
+        self.__stop_task_runner_processes()
+        for task_runner_process in self.task_runner_processes:
+            if task_runner_process.pid is not None:
+                task_runner_process.join(SHUTDOWN_GRACE_PERIOD)
+                if self.metrics_collector is not None and task_runner_process.exitcode is not None:
+                    self.metrics_collector.mark_process_dead(task_runner_process.pid)
+
         logger.info('Joined TaskRunner processes')
 
     def __stop_metrics_provider_process(self):
@@ -144,6 +349,15 @@ def __get_client_topmost_package_filepath():
     return None
 
 
+def preload_modules() -> None:
+    """Imports the swagger models and APIs, which task runner processes
+    otherwise import on first use."""
+    for package_name in ('swift_conductor.http.models', 'swift_conductor.http.api'):
+        package = importlib.import_module(package_name)
+        for module in pkgutil.iter_modules(package.__path__):
+            importlib.import_module(f'{package_name}.{module.name}')
+
+
 def load_worker_config():
     worker_config = ConfigParser()
 
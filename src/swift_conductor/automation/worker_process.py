@@ -1,15 +1,24 @@
+from concurrent.futures import ThreadPoolExecutor, wait
 from configparser import ConfigParser
+from typing import List, Optional
 import logging
-import sys
+import signal
+import threading
 import time
 import traceback
 import os
 
+from swift_conductor.automation.polling_interval import AdaptivePollingInterval
+from swift_conductor.automation.task_heartbeat import TaskHeartbeat
+from swift_conductor.automation.task_updater import TaskUpdater
 from swift_conductor.configuration import Configuration
 from swift_conductor.settings.metrics_settings import MetricsSettings
+from swift_conductor.settings.task_update_settings import TaskUpdateSettings
 
 from swift_conductor.http.api_client import ApiClient
+from swift_conductor.http.api_client_registry import acquire_api_client
 from swift_conductor.http.api.task_resource_api import TaskResourceApi
+from swift_conductor.http.rest import ApiException
 
 from swift_conductor.http.models.task import Task
 from swift_conductor.http.models.task_result import TaskResult
@@ -21,10 +30,18 @@ from swift_conductor.worker.worker_abc import WorkerAbc
 logger_name = Configuration.get_logging_formatted_name(__name__)
 logger = logging.getLogger(logger_name)
 
+# Status codes returned by servers that do not expose the batch poll endpoint
+BATCH_POLL_UNSUPPORTED_STATUSES = (404, 405, 501)
+
+# Seconds to finish in-flight tasks and updates after a stop signal
+DEFAULT_SHUTDOWN_TIMEOUT = 30.0
+
 class WorkerProcess:
     def __init__(self, worker: WorkerAbc, 
                  configuration: Configuration = None, 
-                 metrics_settings: MetricsSettings = None, worker_config: ConfigParser =  None
+                 metrics_settings: MetricsSettings = None, worker_config: ConfigParser =  None,
+                 task_update_settings: TaskUpdateSettings = None,
+                 shutdown_timeout: float = DEFAULT_SHUTDOWN_TIMEOUT
     ):
         if not isinstance(worker, WorkerAbc):
             raise Exception('Invalid worker type. Must be of type WorkerAbc.')
@@ -43,28 +60,238 @@ class WorkerProcess:
         if metrics_settings is not None:
             self.metrics_collector = MetricsCollector(metrics_settings)
         
-        self.api_client = ApiClient(configuration=self.configuration)
-        self.task_client = TaskResourceApi(self.api_client)
+        self.task_update_settings = task_update_settings
+        self.shutdown_timeout = shutdown_timeout
+
+        self._batch_poll_supported = True
+        self._polling_interval = None
+        self.__reset_process_state()
+
+    def __reset_process_state(self) -> None:
+        # Created on first use, so that they live in the process that runs the
+        # worker: a process forked or spawned from the one that created the
+        # WorkerProcess builds its own connection pool and threads
+        self._api_client = None
+        self._task_client = None
+        self.task_updater = None
+        self._heartbeat = None
+        self._executor = None
+        self._execution_slots = None
+        # Tasks executing in the thread pool, mapped to their task definition name
+        self._running_tasks = {}
+        self._stopping = threading.Event()
+        self._process_id = os.getpid()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in ('_api_client', '_task_client', 'task_updater', '_heartbeat', '_executor', '_execution_slots', '_running_tasks', '_stopping', '_process_id'):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.__reset_process_state()
+
+    @property
+    def api_client(self) -> ApiClient:
+        if self._api_client is None:
+            self.__size_connection_pool()
+            self._api_client = acquire_api_client(self.configuration)
+        return self._api_client
+
+    def __size_connection_pool(self) -> None:
+        # The poll loop, the heartbeat thread and the task update thread of
+        # each executing thread may all hold a connection at the same time
+        connections = self.worker.get_thread_count() + 2
+        if self.configuration.pool_maxsize >= connections:
+            return
+        if self.configuration.http_connection != None:
+            logger.warning(f'The connection pool of the provided http_connection may be smaller than the {connections} connections used by: {self.worker.get_task_definition_name()}')
+            return
+        logger.info(f'Raising pool_maxsize from {self.configuration.pool_maxsize} to {connections} for: {self.worker.get_task_definition_name()}')
+        self.configuration.pool_maxsize = connections
+
+    @property
+    def task_client(self) -> TaskResourceApi:
+        if self._task_client is None:
+            self._task_client = TaskResourceApi(self.api_client)
+        return self._task_client
+
+    def run(self, own_process: bool = False) -> None:
+        """Polls for and executes tasks until `stop` is called, and then
+        drains the tasks in flight.
+
+        :param own_process: set when the process exists only to run this
+            WorkerProcess, as in the processes of WorkerHost: SIGTERM and
+            SIGINT then stop it, and the process exits right after the drain
+            if executions given up on are still running.
+        """
+        if self._process_id != os.getpid():
+            # Forked from the process that created the WorkerProcess
+            self.__reset_process_state()
 
-    def run(self) -> None:
         if self.configuration != None:
             self.configuration.apply_logging_config()
 
-        while True:
+        if self.metrics_collector is not None:
+            self.metrics_collector.bind_task_metrics(self.worker.task_definition_name)
+        previous_handlers = self.__handle_stop_signals() if own_process else {}
+
+        # Send task results from background threads, so that failing updates do not hold up polling
+        self.task_updater = TaskUpdater(
+            self.task_client,
+            self.task_update_settings,
+            self.metrics_collector,
+            # As many updates in flight as tasks executing at the same time
+            thread_count=self.worker.get_thread_count(),
+        )
+        self.task_updater.start()
+
+        heartbeat_interval = self.worker.get_heartbeat_interval_in_seconds()
+        if heartbeat_interval is not None:
+            # Keeps long-running tasks from timing out on the server while they execute
+            self._heartbeat = TaskHeartbeat(self.task_client, heartbeat_interval, self.metrics_collector)
+            self._heartbeat.start()
+
+        while not self._stopping.is_set():
             try:
                 self.run_once()
             except Exception:
                 pass
 
+        running_executions = self.drain()
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+
+        if own_process and running_executions > 0:
+            # Abandoned executions are still running in the thread pool, and
+            # would keep the process alive until they finish
+            logging.shutdown()
+            os._exit(0)
+
+    def stop(self) -> None:
+        """Stops polling for tasks. `run` then drains the tasks in flight and returns."""
+        self._stopping.set()
+
+    def drain(self) -> int:
+        """Waits up to shutdown_timeout for the tasks in flight to be
+        executed and their results to be sent.
+
+        :return: number of executions still running after the timeout
+        """
+        start_time = time.monotonic()
+        deadline = start_time + self.shutdown_timeout
+        logger.info(f'Draining tasks in flight for: {self.worker.task_definition_name}')
+
+        abandoned = []
+        if self._executor is not None:
+            running_tasks = dict(self._running_tasks)
+            _, not_done = wait(running_tasks, timeout=self.shutdown_timeout)
+            abandoned.extend(running_tasks[future] for future in not_done)
+            self._executor.shutdown(wait=False)
+        running_executions = len(abandoned)
+
+        if self._heartbeat is not None:
+            # Tasks still executing are left to time out on the server
+            self._heartbeat.stop(max(deadline - time.monotonic(), 0))
+
+        if self.task_updater is not None:
+            abandoned.extend(self.task_updater.stop(max(deadline - time.monotonic(), 0)))
+
+        time_spent = time.monotonic() - start_time
+        if self.metrics_collector is not None:
+            self.metrics_collector.record_worker_drain_time(time_spent)
+            for task_definition_name in abandoned:
+                self.metrics_collector.increment_task_abandoned(task_definition_name)
+
+        if abandoned:
+            logger.warning(f'Drained tasks in {time_spent:.3f}s, abandoned {len(abandoned)} tasks for: {self.worker.task_definition_name}')
+        else:
+            logger.info(f'Drained tasks in {time_spent:.3f}s for: {self.worker.task_definition_name}')
+        return running_executions
+
+    def __handle_stop_signals(self) -> dict:
+        """:return: signal number mapped to the handler it replaced"""
+        if threading.current_thread() is not threading.main_thread():
+            return {}
+        return {
+            signum: signal.signal(signum, lambda signum, frame: self.stop())
+            for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+
     def run_once(self) -> None:
-        task = self._poll_task()
-        if task != None and task.task_id != None:
-            task_result = self._execute_task(task)
-            self._update_task(task_result)
+        if self.worker.get_thread_count() > 1:
+            polled_tasks = self._run_once_in_thread_pool()
+        else:
+            polled_tasks = 0
+            task = self._poll_task()
+            if task != None and task.task_id != None:
+                polled_tasks = 1
+                started_at = time.time()
+                task_result = self._execute_task(task)
+                self.__submit_task_result(task_result, started_at=started_at)
         
+        self.__update_polling_interval(polled_tasks)
         self._wait_for_polling_interval()
         self.worker.clear_task_definition_name_cache()
 
+    def _run_once_in_thread_pool(self) -> Optional[int]:
+        """Polls for as many tasks as there are free threads and hands them to the thread pool.
+
+        :return: number of tasks submitted, or None when all threads are busy
+        """
+        if self._executor is None:
+            thread_count = self.worker.get_thread_count()
+            self._executor = ThreadPoolExecutor(max_workers=thread_count, thread_name_prefix='worker')
+            self._execution_slots = threading.BoundedSemaphore(thread_count)
+
+        task_definition_name = self.worker.get_task_definition_name()
+
+        # Do not poll for more tasks than there are free threads to execute them
+        free_slots = 0
+        while self._execution_slots.acquire(blocking=False):
+            free_slots += 1
+
+        if free_slots == 0:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_task_execution_queue_full(task_definition_name)
+
+            logger.debug(f'All threads are busy, skip polling task for: {task_definition_name}')
+            return None
+
+        polled_tasks = 0
+        try:
+            tasks = self._batch_poll_tasks(free_slots)
+            for task in tasks[:free_slots]:
+                if task == None or task.task_id == None:
+                    continue
+                future = self._executor.submit(self.__execute_and_update_task, task, task_definition_name)
+                self._running_tasks[future] = task_definition_name
+                future.add_done_callback(self.__remove_running_task)
+                free_slots -= 1
+                polled_tasks += 1
+        finally:
+            for _ in range(free_slots):
+                self._execution_slots.release()
+
+        return polled_tasks
+
+    def __remove_running_task(self, future) -> None:
+        self._running_tasks.pop(future, None)
+
+    def __execute_and_update_task(self, task: Task, task_definition_name: str) -> None:
+        try:
+            started_at = time.time()
+            task_result = self._execute_task(task, task_definition_name)
+            self.__submit_task_result(task_result, task_definition_name, started_at)
+        except Exception:
+            if self.metrics_collector is not None:
+                self.metrics_collector.increment_uncaught_exception()
+
+            logger.error(f'Uncaught exception while processing task: {task.task_id}, reason: {traceback.format_exc()}')
+        finally:
+            self._execution_slots.release()
+
 
     def _poll_task(self) -> Task:
         task_definition_name = self.worker.get_task_definition_name()
@@ -81,11 +308,7 @@ class WorkerProcess:
         try:
             start_time = time.time()
             
-            params = {'workerid': self.worker.get_identity()}
-            
-            domain = self.worker.get_domain()
-            if domain != None:
-                params['domain'] = domain
+            params = self.__get_poll_params()
             
             task = self.task_client.poll(tasktype=task_definition_name, **params)
             
@@ -106,12 +329,76 @@ class WorkerProcess:
 
         return task
 
+    def _batch_poll_tasks(self, count: int) -> List[Task]:
+        if not self._batch_poll_supported:
+            task = self._poll_task()
+            return [task] if task != None else []
+
+        task_definition_name = self.worker.get_task_definition_name()
+
+        if self.worker.paused():
+            logger.debug(f'Stop polling task for: {task_definition_name}')
+            return []
+
+        if self.metrics_collector is not None:
+            self.metrics_collector.increment_task_poll(task_definition_name)
+
+        logger.debug(f'Batch polling {count} tasks for: {task_definition_name}')
+
+        try:
+            start_time = time.time()
+
+            params = self.__get_poll_params()
+            params['count'] = count
+            params['timeout'] = self.worker.get_poll_timeout_in_milliseconds()
+
+            tasks = self.task_client.batch_poll(tasktype=task_definition_name, **params)
+
+            finish_time = time.time()
+            time_spent = finish_time - start_time
+
+            if self.metrics_collector is not None:
+                self.metrics_collector.record_task_poll_time(task_definition_name, time_spent)
+        except ApiException as e:
+            if e.status not in BATCH_POLL_UNSUPPORTED_STATUSES:
+                return self.__handle_batch_poll_error(task_definition_name, e)
+
+            logger.warning(f'Batch poll is not supported by the server, falling back to single task poll for: {task_definition_name}')
+            self._batch_poll_supported = False
+            task = self._poll_task()
+            return [task] if task != None else []
+        except Exception as e:
+            return self.__handle_batch_poll_error(task_definition_name, e)
 
-    def _execute_task(self, task: Task) -> TaskResult:
+        if tasks == None:
+            return []
+
+        logger.debug(f'Polled {len(tasks)} tasks: {task_definition_name}, worker_id: {self.worker.get_identity()}, domain: {self.worker.get_domain()}')
+
+        return tasks
+
+    def __handle_batch_poll_error(self, task_definition_name: str, e: Exception) -> List[Task]:
+        if self.metrics_collector is not None:
+            self.metrics_collector.increment_task_poll_error(task_definition_name, type(e))
+
+        logger.error(f'Failed to batch poll tasks for: {task_definition_name}, reason: {traceback.format_exc()}')
+        return []
+
+    def __get_poll_params(self) -> dict:
+        params = {'workerid': self.worker.get_identity()}
+
+        domain = self.worker.get_domain()
+        if domain != None:
+            params['domain'] = domain
+
+        return params
+
+    def _execute_task(self, task: Task, task_definition_name: str = None) -> TaskResult:
         if not isinstance(task, Task):
             return None
 
-        task_definition_name = self.worker.get_task_definition_name()
+        if task_definition_name is None:
+            task_definition_name = self.worker.get_task_definition_name()
 
         logger.debug('Executing task, id: {task_id}, workflow_instance_id: {workflow_instance_id}, task_definition_name: {task_definition_name}'.format(
                 task_id=task.task_id,
@@ -119,6 +406,12 @@ class WorkerProcess:
                 task_definition_name=task_definition_name
         ))
 
+        if self.metrics_collector is not None:
+            self.metrics_collector.measure_task_input_payload(task_definition_name, task.input_data, self.api_client.serialize)
+
+        if self._heartbeat is not None:
+            self._heartbeat.add(task, task_definition_name, self.worker.get_identity())
+
         try:
             start_time = time.time()
             
@@ -129,7 +422,6 @@ class WorkerProcess:
         
             if self.metrics_collector is not None:
                 self.metrics_collector.record_task_execute_time(task_definition_name, time_spent)
-                self.metrics_collector.record_task_result_payload_size(task_definition_name, sys.getsizeof(task_result))
         
             logger.debug('Executed task, id: {task_id}, workflow_instance_id: {workflow_instance_id}, task_definition_name: {task_definition_name}'.format(
                     task_id=task.task_id,
@@ -158,55 +450,72 @@ class WorkerProcess:
                     task_definition_name=task_definition_name,
                     reason=traceback.format_exc()
             ))
+        finally:
+            if self._heartbeat is not None:
+                self._heartbeat.remove(task.task_id)
 
         return task_result
 
-    def _update_task(self, task_result: TaskResult):
+    def __submit_task_result(self, task_result: TaskResult, task_definition_name: str = None, started_at: float = None) -> None:
+        if self.task_updater is None:
+            # Not running: send the result right away
+            self._update_task(task_result, task_definition_name, started_at)
+            return
+
         if not isinstance(task_result, TaskResult):
-            return None
-        
-        task_definition_name = self.worker.get_task_definition_name()
-        
-        logger.debug('Updating task, id: {task_id}, workflow_instance_id: {workflow_instance_id}, task_definition_name: {task_definition_name}'.format(
-                task_id=task_result.task_id,
-                workflow_instance_id=task_result.workflow_instance_id,
-                task_definition_name=task_definition_name
-        ))
+            return
 
-        for attempt in range(4):
-            if attempt > 0:
-                # Wait for [10s, 20s, 30s] before next attempt
-                time.sleep(attempt * 10)
+        if task_definition_name is None:
+            task_definition_name = self.worker.get_task_definition_name()
 
-            try:
-                response = self.task_client.update_task(body=task_result)
-                
-                logger.debug('Updated task, id: {task_id}, workflow_instance_id: {workflow_instance_id}, task_definition_name: {task_definition_name}, response: {response}'.format(
-                        task_id=task_result.task_id,
-                        workflow_instance_id=task_result.workflow_instance_id,
-                        task_definition_name=task_definition_name,
-                        response=response
-                ))
-
-                return response
-            except Exception as e:
-                if self.metrics_collector is not None:
-                    self.metrics_collector.increment_task_update_error(task_definition_name, type(e))
+        self.task_updater.submit(task_result, task_definition_name, started_at)
+
+    def _update_task(self, task_result: TaskResult, task_definition_name: str = None, started_at: float = None):
+        """Sends a task result once, from the calling thread.
+
+        :return: response of the server, or None if the update failed
+        """
+        if not isinstance(task_result, TaskResult):
+            return None
 
-                logger.error('Failed to update task, id: {task_id}, workflow_instance_id: {workflow_instance_id}, task_definition_name: {task_definition_name}, reason: {reason}'.format(
-                        task_id=task_result.task_id,
-                        workflow_instance_id=task_result.workflow_instance_id,
-                        task_definition_name=task_definition_name,
-                        reason=traceback.format_exc()
-                ))
+        if task_definition_name is None:
+            task_definition_name = self.worker.get_task_definition_name()
 
-        return None
+        task_updater = self.task_updater
+        if task_updater is None:
+            task_updater = TaskUpdater(self.task_client, self.task_update_settings, self.metrics_collector)
+        return task_updater.update(task_result, task_definition_name, started_at)
 
     def _wait_for_polling_interval(self) -> None:
         polling_interval = self.worker.get_polling_interval_in_seconds()
+        if self._polling_interval is not None:
+            polling_interval = self._polling_interval.current
+
+        if self.metrics_collector is not None:
+            self.metrics_collector.record_task_poll_interval(self.worker.get_task_definition_name(), polling_interval)
+
         logger.debug(f'Sleep for {polling_interval} seconds')
         time.sleep(polling_interval)
 
+    def __update_polling_interval(self, polled_tasks: Optional[int]) -> None:
+        max_polling_interval = self.worker.get_max_polling_interval_in_seconds()
+        if max_polling_interval is None:
+            self._polling_interval = None
+            return
+
+        if self._polling_interval is None:
+            self._polling_interval = AdaptivePollingInterval(
+                self.worker.get_polling_interval_in_seconds(),
+                max_polling_interval
+            )
+
+        if polled_tasks is None:
+            self._polling_interval.on_busy()
+        elif polled_tasks > 0:
+            self._polling_interval.on_tasks_received()
+        else:
+            self._polling_interval.on_empty_poll()
+
     def __set_worker_properties(self) -> None:
         task_type = self.worker.get_task_definition_name()
         
@@ -251,6 +560,32 @@ class WorkerProcess:
                     except Exception as e:
                         logger.error("Exception reading polling interval: {0}. Defaulting to {1} ms".format(str(e), default_polling_interval))
 
+        # ENV Variables override config for the concurrency of the worker
+        self.__set_worker_count_property("thread_count", task_type)
+        self.__set_worker_count_property("process_count", task_type)
+
+    def __set_worker_count_property(self, prop, task_type):
+        value = self.__get_property_value_from_env(prop, task_type)
+
+        config = self.worker_config
+        if not value and config:
+            if config.has_section(task_type):
+                section = config[task_type]
+            else:
+                section = config[config.default_section]
+            value = section.get(prop)
+
+        if not value:
+            return
+
+        try:
+            count = int(value)
+            if count < 1:
+                raise ValueError(f"{prop} must be at least 1, got {count}")
+            setattr(self.worker, prop, count)
+            logger.debug("Override {0} to {1}".format(prop, count))
+        except Exception as e:
+            logger.error("Exception reading {0}: {1}. Defaulting to {2}".format(prop, str(e), getattr(self.worker, prop)))
 
     def __get_property_value_from_env(self, prop, task_type):
         prefix = "conductor_worker"
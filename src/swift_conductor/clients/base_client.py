@@ -1,5 +1,5 @@
 from swift_conductor.configuration import Configuration
-from swift_conductor.http.api_client import ApiClient
+from swift_conductor.http.api_client_registry import acquire_api_client, release_api_client
 from swift_conductor.http.api.metadata_resource_api import MetadataResourceApi
 from swift_conductor.http.api.workflow_resource_api import WorkflowResourceApi
 from swift_conductor.http.api.task_resource_api import TaskResourceApi
@@ -8,11 +8,25 @@ import logging
 
 class BaseClient(object):
     def __init__(self, configuration: Configuration):
-        self.api_client = ApiClient(configuration)
+        # Clients created with the same configuration share one ApiClient and its connection pool
+        self.api_client = acquire_api_client(configuration)
+        self._closed = False
         self.logger = logging.getLogger(
             Configuration.get_logging_formatted_name(__name__)
         )
         self.metadataResourceApi = MetadataResourceApi(self.api_client)
         self.taskResourceApi = TaskResourceApi(self.api_client)
         self.workflowResourceApi = WorkflowResourceApi(self.api_client)
-    
\ No newline at end of file
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """Releases the shared ApiClient. Its connections are closed once no client uses it."""
+        if self._closed:
+            return
+        self._closed = True
+        release_api_client(self.api_client)
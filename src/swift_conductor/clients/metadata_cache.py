@@ -0,0 +1,59 @@
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+import copy
+import threading
+import time
+
+
+class MetadataCache:
+    """In-process cache of workflow and task definitions.
+
+    Entries expire `ttl` seconds after they were stored. When more than
+    `max_size` entries are stored, the least recently used one is evicted.
+    Callers get a copy of the cached definition, so changing it does not
+    change the cache.
+    """
+
+    def __init__(self, ttl: float = 60.0, max_size: int = 1000):
+        self.ttl = ttl
+        self.max_size = max_size
+        # key -> (expiry time, definition), least recently used first
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy.deepcopy(entry[1])
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if value is None:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *key_prefix: Hashable) -> None:
+        """Removes the entries whose key starts with key_prefix, e.g. all
+        versions of a workflow definition. Removes every entry when no
+        prefix is given."""
+        with self._lock:
+            for key in [key for key in self._entries if key[:len(key_prefix)] == key_prefix]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
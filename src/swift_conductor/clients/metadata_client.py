@@ -3,29 +3,44 @@ from swift_conductor.configuration import Configuration
 from swift_conductor.http.models.workflow_def import WorkflowDef
 from swift_conductor.http.models.task_def import TaskDef
 from swift_conductor.clients.base_client import BaseClient
+from swift_conductor.clients.metadata_cache import MetadataCache
 from swift_conductor.exceptions.api_exception_handler import api_exception_handler, for_all_methods
 
 @for_all_methods(api_exception_handler, ["__init__"])
 class MetadataClient(BaseClient):
-    def __init__(self, configuration: Configuration):
+    def __init__(self, configuration: Configuration, metadataCache: Optional[MetadataCache] = None):
         super(MetadataClient, self).__init__(configuration)
-        
+        # Definitions read through this client are cached when set, and
+        # invalidated by the changes made through this client
+        self.metadataCache = metadataCache
+
     def register_workflow_def(self, workflowDef: WorkflowDef):
         self.metadataResourceApi.create(workflowDef)
+        self.__invalidate_workflow_def(workflowDef.name)
 
     def update_workflow_def(self, workflowDef: WorkflowDef):
         self.metadataResourceApi.update1([workflowDef])
+        self.__invalidate_workflow_def(workflowDef.name)
 
     def unregister_workflow_def(self, name: str, version: int):
         self.metadataResourceApi.unregister_workflow_def(name, version)
+        self.__invalidate_workflow_def(name)
 
     def get_workflow_def(self, name: str, version: Optional[int] = None) -> WorkflowDef:
+        key = ('workflow', name, version or None)
+        if self.metadataCache is not None:
+            workflow = self.metadataCache.get(key)
+            if workflow is not None:
+                return workflow
+
         workflow = None
         if version:
             workflow = self.metadataResourceApi.get(name, version=version)
         else:
             workflow = self.metadataResourceApi.get(name)
 
+        if self.metadataCache is not None:
+            self.metadataCache.put(key, workflow)
         return workflow
 
     def get_all_workflow_defs(self) -> List[WorkflowDef]:
@@ -33,17 +48,36 @@ class MetadataClient(BaseClient):
 
     def register_task_def(self, taskDef: TaskDef):
         self.metadataResourceApi.register_task_def([taskDef])
+        self.__invalidate_task_def(taskDef.name)
 
     def update_task_def(self, taskDef: TaskDef):
         self.metadataResourceApi.update_task_def(taskDef)
+        self.__invalidate_task_def(taskDef.name)
 
     def unregister_task_def(self, taskType: str):
         self.metadataResourceApi.unregister_task_def(taskType)
+        self.__invalidate_task_def(taskType)
 
     def get_task_def(self, taskType: str) -> TaskDef:
-        return self.metadataResourceApi.get_task_def(taskType)
+        key = ('task', taskType)
+        if self.metadataCache is not None:
+            taskDef = self.metadataCache.get(key)
+            if taskDef is not None:
+                return taskDef
+
+        taskDef = self.metadataResourceApi.get_task_def(taskType)
+
+        if self.metadataCache is not None:
+            self.metadataCache.put(key, taskDef)
+        return taskDef
 
     def get_all_task_defs(self) -> List[TaskDef]:
         return self.metadataResourceApi.get_task_defs()
-        
-    
\ No newline at end of file
+
+    def __invalidate_workflow_def(self, name: str):
+        if self.metadataCache is not None:
+            self.metadataCache.invalidate('workflow', name)
+
+    def __invalidate_task_def(self, taskType: str):
+        if self.metadataCache is not None:
+            self.metadataCache.invalidate('task', taskType)
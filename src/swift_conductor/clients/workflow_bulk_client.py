@@ -0,0 +1,109 @@
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional
+from swift_conductor.configuration import Configuration
+from swift_conductor.http.api.workflow_bulk_resource_api import WorkflowBulkResourceApi
+from swift_conductor.http.models.bulk_response import BulkResponse
+from swift_conductor.clients.base_client import BaseClient
+from swift_conductor.exceptions.api_exception_handler import api_exception_handler, for_all_methods
+from swift_conductor.workflow.bounded_map import bounded_map
+
+DEFAULT_CHUNK_SIZE = 100
+DEFAULT_MAX_WORKERS = 4
+
+# Called after each chunk with the number of workflows processed and failed so far
+ProgressCallback = Callable[[int, int], None]
+
+@for_all_methods(api_exception_handler, ["__init__"])
+class WorkflowBulkClient(BaseClient):
+    """Runs bulk operations on any number of workflows.
+
+    Workflow ids are read from an iterable, e.g. a search stream, and sent in
+    chunks of chunkSize ids, up to maxWorkers chunks at a time. The responses
+    are merged into one BulkResponse. A chunk that fails as a whole reports
+    the error for each of its workflow ids.
+    """
+
+    def __init__(
+        self,
+        configuration: Configuration,
+        chunkSize: int = DEFAULT_CHUNK_SIZE,
+        maxWorkers: int = DEFAULT_MAX_WORKERS,
+        ):
+        super(WorkflowBulkClient, self).__init__(configuration)
+        self.workflowBulkResourceApi = WorkflowBulkResourceApi(self.api_client)
+        self.chunkSize = chunkSize
+        self.maxWorkers = maxWorkers
+
+    def pause_workflows(self, workflowIds: Iterable[str], onProgress: Optional[ProgressCallback] = None) -> BulkResponse:
+        return self.__run(self.workflowBulkResourceApi.pause_workflow, workflowIds, onProgress)
+
+    def resume_workflows(self, workflowIds: Iterable[str], onProgress: Optional[ProgressCallback] = None) -> BulkResponse:
+        return self.__run(self.workflowBulkResourceApi.resume_workflow, workflowIds, onProgress)
+
+    def restart_workflows(
+        self,
+        workflowIds: Iterable[str],
+        useLatestDef: Optional[bool] = False,
+        onProgress: Optional[ProgressCallback] = None
+    ) -> BulkResponse:
+        return self.__run(
+            lambda chunk: self.workflowBulkResourceApi.restart(chunk, use_latest_definitions=useLatestDef),
+            workflowIds,
+            onProgress
+        )
+
+    def retry_workflows(self, workflowIds: Iterable[str], onProgress: Optional[ProgressCallback] = None) -> BulkResponse:
+        return self.__run(self.workflowBulkResourceApi.retry, workflowIds, onProgress)
+
+    def terminate_workflows(
+        self,
+        workflowIds: Iterable[str],
+        reason: Optional[str] = None,
+        triggerFailureWorkflow: Optional[bool] = None,
+        onProgress: Optional[ProgressCallback] = None
+    ) -> BulkResponse:
+        kwargs = {}
+        if reason:
+            kwargs.update({"reason": reason})
+        if triggerFailureWorkflow is not None:
+            kwargs.update({"triggerFailureWorkflow": triggerFailureWorkflow})
+
+        return self.__run(
+            lambda chunk: self.workflowBulkResourceApi.terminate(chunk, **kwargs),
+            workflowIds,
+            onProgress
+        )
+
+    def __run(
+        self,
+        operation: Callable[[List[str]], BulkResponse],
+        workflowIds: Iterable[str],
+        onProgress: Optional[ProgressCallback]
+    ) -> BulkResponse:
+        merged = BulkResponse(bulk_error_results={}, bulk_successful_results=[])
+        processed = 0
+
+        def run_chunk(chunk: List[str]) -> BulkResponse:
+            try:
+                return operation(chunk)
+            except Exception as e:
+                self.logger.warning(f'Bulk operation failed for {len(chunk)} workflows, reason: {e}')
+                return BulkResponse(bulk_error_results={workflowId: str(e) for workflowId in chunk})
+
+        for chunk, response in bounded_map(run_chunk, self.__chunks(workflowIds), self.maxWorkers, 'workflow-bulk'):
+            if response is not None:
+                merged.bulk_successful_results.extend(response.bulk_successful_results or [])
+                merged.bulk_error_results.update(response.bulk_error_results or {})
+            processed += len(chunk)
+            if onProgress is not None:
+                onProgress(processed, len(merged.bulk_error_results))
+
+        return merged
+
+    def __chunks(self, workflowIds: Iterable[str]) -> Iterator[List[str]]:
+        iterator = iter(workflowIds)
+        while True:
+            chunk = list(islice(iterator, self.chunkSize))
+            if not chunk:
+                return
+            yield chunk
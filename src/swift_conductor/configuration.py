@@ -43,8 +43,42 @@ class Configuration:
         self.safe_chars_for_path_param = ''
 
         # Provide an alterative to requests.Session() for HTTP connection.
+        # When set, the connection pool options below are not applied.
         self.http_connection = None
 
+        # Number of per-host connection pools to keep
+        self.pool_connections = 10
+
+        # Maximum number of connections kept open per host.
+        # Raise it when many threads share one client.
+        self.pool_maxsize = 10
+
+        # Set this to True to wait for a free connection instead of opening
+        # a new one when all pool_maxsize connections to a host are in use.
+        self.pool_block = False
+
+        # Set this to True/False to enable/disable reusing connections
+        # between requests and TCP keep-alive probes on idle connections.
+        self.keep_alive = True
+
+        # Seconds to wait for a connection to be established
+        self.connect_timeout = 45
+
+        # Seconds to wait for the server to send a response
+        self.read_timeout = 45
+
+        # Set this to True to deserialize the attributes of response models
+        # only when they are first read. Saves time and memory when only a
+        # few attributes of large responses (e.g. workflows with tasks) are
+        # used. Must be set before the first request of the client.
+        self.lazy_deserialization = False
+
+        # Set this to True to deserialize Task, TaskResult, TaskSummary,
+        # Workflow and WorkflowSummary into their compact variants from
+        # swift_conductor.http.models.compact, which use less memory.
+        # Ignored when lazy_deserialization is set.
+        self.compact_models = False
+
     @property
     def debug(self):
         """Debug status
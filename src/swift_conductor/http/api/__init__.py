@@ -0,0 +1,32 @@
+"""Swagger APIs.
+
+As with the models, the API modules are imported on first use, e.g. by
+`from swift_conductor.http.api import TaskResourceApi`.
+"""
+import importlib
+
+# API class name -> module defining it
+_API_MODULES = {
+    'AsyncTaskResourceApi': 'async_task_resource_api',
+    'EventResourceApi': 'event_resource_api',
+    'MetadataResourceApi': 'metadata_resource_api',
+    'TaskResourceApi': 'task_resource_api',
+    'WorkflowBulkResourceApi': 'workflow_bulk_resource_api',
+    'WorkflowResourceApi': 'workflow_resource_api',
+}
+
+__all__ = list(_API_MODULES)
+
+
+def __getattr__(name):
+    module_name = _API_MODULES.get(name)
+    if module_name == None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(f'{__name__}.{module_name}'), name)
+    # Later lookups find the class without calling __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,73 @@
+from swift_conductor.http.async_api_client import AsyncApiClient
+
+
+class AsyncTaskResourceApi(object):
+    """Asynchronous subset of TaskResourceApi used by AsyncWorkerHost.
+
+    Parameters and return values match the TaskResourceApi methods of the
+    same name.
+    """
+
+    def __init__(self, api_client=None):
+        if api_client is None:
+            api_client = AsyncApiClient()
+        self.api_client = api_client
+
+    async def poll(self, tasktype, **kwargs):
+        """Poll for a task of a certain type
+
+        :param str tasktype: (required)
+        :param str workerid:
+        :param str domain:
+        :return: Task
+        """
+        query_params = self.__get_query_params(kwargs, ['workerid', 'domain'])
+        return await self.api_client.call_api(
+            '/task/poll/{tasktype}', 'GET',
+            path_params={'tasktype': tasktype},
+            query_params=query_params,
+            response_type='Task',
+            _request_timeout=kwargs.get('_request_timeout'),
+        )
+
+    async def batch_poll(self, tasktype, **kwargs):
+        """Batch poll for a task of a certain type
+
+        :param str tasktype: (required)
+        :param str workerid:
+        :param str domain:
+        :param int count:
+        :param int timeout:
+        :return: list[Task]
+        """
+        query_params = self.__get_query_params(kwargs, ['workerid', 'domain', 'count', 'timeout'])
+        return await self.api_client.call_api(
+            '/task/poll/batch/{tasktype}', 'GET',
+            path_params={'tasktype': tasktype},
+            query_params=query_params,
+            response_type='list[Task]',
+            _request_timeout=kwargs.get('_request_timeout'),
+        )
+
+    async def update_task(self, body, **kwargs):
+        """Update a task
+
+        :param TaskResult body: (required)
+        :return: str
+        """
+        return await self.api_client.call_api(
+            '/task', 'POST',
+            body=body,
+            response_type='str',
+            accept='text/plain',
+            _request_timeout=kwargs.get('_request_timeout'),
+        )
+
+    @staticmethod
+    def __get_query_params(kwargs, names):
+        for key in kwargs:
+            if key not in names and key != '_request_timeout':
+                raise TypeError(
+                    "Got an unexpected keyword argument '%s'" % key
+                )
+        return [(name, kwargs[name]) for name in names if name in kwargs]
@@ -1,6 +1,8 @@
 from requests.structures import CaseInsensitiveDict
 from swift_conductor.configuration import Configuration
 from swift_conductor.http.thread import AwaitableThread
+from swift_conductor.http import json_backend
+from swift_conductor.http.lazy_model import lazy_model_class
 from swift_conductor.http import rest
 from six.moves.urllib.parse import quote
 from typing import Dict
@@ -13,6 +15,7 @@ import os
 import re
 import six
 import tempfile
+import threading
 import traceback
 import urllib3
 
@@ -66,7 +69,10 @@ class ApiClient(object):
             configuration = Configuration()
         self.configuration = configuration
 
-        self.rest_client = rest.RESTClientObject(connection=configuration.http_connection)
+        self.rest_client = rest.RESTClientObject(
+            connection=configuration.http_connection,
+            configuration=configuration
+        )
 
         self.default_headers = self.__get_default_headers(
             header_name, header_value
@@ -74,6 +80,22 @@ class ApiClient(object):
 
         self.cookie = cookie
 
+        # (attribute name, json key) pairs of each serialized model class
+        self._serializers = {}
+        # Compiled deserializers, keyed by type string or class literal
+        self._deserializers = {}
+        self._deserializers_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """Closes the pooled connections of this client."""
+        self.rest_client.close()
+
     def __call_api(
             self, resource_path, method, path_params=None,
             query_params=None, header_params=None, body=None, post_params=None,
@@ -118,9 +140,9 @@ class ApiClient(object):
             post_params = self.parameters_to_tuples(post_params,
                                                     collection_formats)
 
-        # body
-        if body:
-            body = self.sanitize_for_serialization(body)
+        # body, bytes are sent as they are
+        if body and not isinstance(body, bytes):
+            body = self.serialize(body)
 
         # request url
         url = self.configuration.host + resource_path
@@ -183,13 +205,59 @@ class ApiClient(object):
             # and attributes which value is not None.
             # Convert attribute name to json key in
             # model definition for request.
-            obj_dict = {obj.attribute_map[attr]: getattr(obj, attr)
-                        for attr, _ in six.iteritems(obj.swagger_types)
-                        if getattr(obj, attr) is not None}
+            obj_dict = self.__model_to_dict(obj)
 
         return {key: self.sanitize_for_serialization(val)
                 for key, val in six.iteritems(obj_dict)}
 
+    def serialize(self, obj):
+        """Serializes an object to a JSON request body.
+
+        Swagger models are converted while the JSON is encoded, instead of
+        being sanitized into a separate structure first.
+
+        :param obj: The data to serialize.
+        :return: UTF-8 encoded JSON.
+        """
+        return json_backend.dumps(obj, default=self.__to_json_compatible)
+
+    def __to_json_compatible(self, obj):
+        """Converts a value the JSON backend cannot encode.
+
+        :param obj: datetime.datetime, datetime.date,
+            CaseInsensitiveDict or swagger model.
+        :return: str or dict.
+        """
+        if isinstance(obj, (datetime.datetime, datetime.date)):
+            return obj.isoformat()
+        if isinstance(obj, CaseInsensitiveDict):
+            return dict(obj)
+        if hasattr(obj, 'swagger_types'):
+            return self.__model_to_dict(obj)
+        raise TypeError(
+            f'Object of type {type(obj).__name__} is not JSON serializable')
+
+    def __model_to_dict(self, obj):
+        """Converts a swagger model to a dict of its attributes that are
+        not None, keyed by json key.
+
+        :param obj: swagger model.
+        :return: dict.
+        """
+        klass = type(obj)
+        fields = self._serializers.get(klass)
+        if fields is None:
+            fields = tuple((attr, obj.attribute_map[attr])
+                           for attr in obj.swagger_types)
+            self._serializers[klass] = fields
+
+        obj_dict = {}
+        for attr, key in fields:
+            value = getattr(obj, attr)
+            if value is not None:
+                obj_dict[key] = value
+        return obj_dict
+
     def deserialize(self, response, response_type):
         """Deserializes response into an object.
 
@@ -231,33 +299,75 @@ class ApiClient(object):
         if data is None:
             return None
 
+        deserializer = self._deserializers.get(klass)
+        if deserializer is None:
+            deserializer = self.__get_deserializer(klass)
+        return deserializer(data)
+
+    def __get_deserializer(self, klass):
+        """Returns the deserializer of a type, compiling it on first use.
+
+        Type strings are parsed and model attributes are resolved once per
+        type, instead of once per deserialized value.
+
+        :param klass: class literal, or string of class name.
+        :return: function turning dict, list or str into an object.
+        """
+        with self._deserializers_lock:
+            deserializer = self._deserializers.get(klass)
+            if deserializer is None:
+                # Deserializers are published once complete, so that other
+                # threads never see a model with unresolved attributes
+                compiled = {}
+                deserializer = self.__compile_deserializer(klass, compiled)
+                self._deserializers.update(compiled)
+            return deserializer
+
+    def __compile_deserializer(self, klass, compiled):
+        deserializer = self._deserializers.get(klass) or compiled.get(klass)
+        if deserializer is not None:
+            return deserializer
+
         if type(klass) == str:
             if klass.startswith('list['):
                 sub_kls = re.match(r'list\[(.*)\]', klass).group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
+                sub_deserializer = self.__compile_deserializer(sub_kls, compiled)
 
-            if klass.startswith('dict('):
+                def deserializer(data):
+                    return [None if sub_data is None else sub_deserializer(sub_data)
+                            for sub_data in data]
+            elif klass.startswith('dict('):
                 sub_kls = re.match(r'dict\(([^,]*), (.*)\)', klass).group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in six.iteritems(data)}
-
-            # convert str to class
-            if klass in self.NATIVE_TYPES_MAPPING:
-                klass = self.NATIVE_TYPES_MAPPING[klass]
+                sub_deserializer = self.__compile_deserializer(sub_kls, compiled)
+
+                def deserializer(data):
+                    return {k: None if v is None else sub_deserializer(v)
+                            for k, v in six.iteritems(data)}
+            elif klass in self.NATIVE_TYPES_MAPPING:
+                # convert str to class
+                deserializer = self.__compile_deserializer(
+                    self.NATIVE_TYPES_MAPPING[klass], compiled)
             else:
-                klass = getattr(http_models, klass)
-
-        if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
+                deserializer = self.__compile_deserializer(
+                    getattr(http_models, klass), compiled)
+        elif klass in self.PRIMITIVE_TYPES:
+            deserialize_primitive = self.__deserialize_primitive
+
+            def deserializer(data):
+                if type(data) is klass:
+                    return data
+                return deserialize_primitive(data, klass)
         elif klass == object:
-            return self.__deserialize_object(data)
+            deserializer = self.__deserialize_object
         elif klass == datetime.date:
-            return self.__deserialize_date(data)
+            deserializer = self.__deserialize_date
         elif klass == datetime.datetime:
-            return self.__deserialize_datatime(data)
+            deserializer = self.__deserialize_datatime
         else:
-            return self.__deserialize_model(data, klass)
+            deserializer = self.__compile_model_deserializer(klass, compiled)
+
+        compiled[klass] = deserializer
+        return deserializer
 
     def call_api(self, resource_path, method,
                  path_params=None, query_params=None, header_params=None,
@@ -568,43 +678,71 @@ class ApiClient(object):
                 )
             )
 
-    def __hasattr(self, object, name):
-        return name in object.__class__.__dict__
-
-    def __deserialize_model(self, data, klass):
-        """Deserializes list or dict to model.
+    def __compile_model_deserializer(self, klass, compiled):
+        """Compiles the deserializer of a model.
 
-        :param data: dict, list.
         :param klass: class literal.
-        :return: model object.
+        :param compiled: deserializers compiled so far.
+        :return: function turning dict into model object.
         """
-
-        if not klass.swagger_types and not self.__hasattr(klass, 'get_real_child_model'):
-            return data
-
-        kwargs = {}
+        has_real_child_model = 'get_real_child_model' in klass.__dict__
+        if not klass.swagger_types and not has_real_child_model:
+            return self.__deserialize_object
+
+        # (attribute name, json key, deserializer) of each model attribute
+        fields = []
+        is_dict = issubclass(klass, dict)
+        deserialize = self.__deserialize
+
+        if (self.configuration.lazy_deserialization and
+                not is_dict and not has_real_child_model):
+            # attribute storage name -> (json key, deserializer)
+            lazy_fields = {}
+            lazy_klass = lazy_model_class(klass)
+
+            def deserializer(data):
+                if not isinstance(data, dict):
+                    return klass()
+                return lazy_klass.from_json(data, lazy_fields)
+        else:
+            lazy_fields = None
+            instance_klass = klass
+            if self.configuration.compact_models:
+                # Imported here, as it imports the models it has variants of
+                from swift_conductor.http.models.compact import COMPACT_MODEL_CLASSES
+                instance_klass = COMPACT_MODEL_CLASSES.get(klass, klass)
+
+            def deserializer(data):
+                kwargs = {}
+                if isinstance(data, dict):
+                    for attr, key, attr_deserializer in fields:
+                        if key in data:
+                            value = data[key]
+                            kwargs[attr] = None if value is None else attr_deserializer(value)
+
+                instance = instance_klass(**kwargs)
+
+                if is_dict and isinstance(data, dict):
+                    for key, value in data.items():
+                        if key not in klass.swagger_types:
+                            instance[key] = value
+                if has_real_child_model:
+                    klass_name = instance.get_real_child_model(data)
+                    if klass_name:
+                        instance = deserialize(data, klass_name)
+                return instance
+
+        # Registered before its attributes are compiled, so that models
+        # referring to themselves (e.g. WorkflowTask) resolve to it
+        compiled[klass] = deserializer
         if klass.swagger_types is not None:
             for attr, attr_type in six.iteritems(klass.swagger_types):
-                if (data is not None and
-                        klass.attribute_map[attr] in data and
-                        isinstance(data, (list, dict))):
-                    value = data[klass.attribute_map[attr]]
-                    kwargs[attr] = self.__deserialize(value, attr_type)
-
-        instance = klass(**kwargs)
-
-        if (isinstance(instance, dict) and
-                klass.swagger_types is not None and
-                isinstance(data, dict)):
-            for key, value in data.items():
-                if key not in klass.swagger_types:
-                    instance[key] = value
-        if self.__hasattr(instance, 'get_real_child_model'):
-            klass_name = instance.get_real_child_model(data)
-            if klass_name:
-                instance = self.__deserialize(data, klass_name)
-        return instance
-
+                key = klass.attribute_map[attr]
+                attr_deserializer = self.__compile_deserializer(attr_type, compiled)
+                fields.append((attr, key, attr_deserializer))
+                if lazy_fields is not None:
+                    lazy_fields['_' + attr] = (key, attr_deserializer)
+        return deserializer
 
     def __get_default_headers(self, header_name: str, header_value: object) -> Dict[str, object]:
         headers = {
@@ -0,0 +1,88 @@
+from swift_conductor.configuration import Configuration
+from swift_conductor.http.api_client import ApiClient
+import logging
+import os
+import threading
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+
+class ApiClientRegistry:
+    """Shares one ApiClient, and so one connection pool, per Configuration.
+
+    Clients are looked up by the identity of the Configuration object and
+    counted: every `acquire` must be matched by a `release`, and the ApiClient
+    is closed when the last user releases it. A process forked from the one
+    that created an ApiClient gets its own, so that connections are never
+    shared across processes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._default_configuration = None
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self.__reset_lock)
+
+    def acquire(self, configuration: Configuration = None) -> ApiClient:
+        with self._lock:
+            if configuration is None:
+                if self._default_configuration is None:
+                    self._default_configuration = Configuration()
+                configuration = self._default_configuration
+
+            key = id(configuration)
+            entry = self._entries.get(key)
+            if entry is None or entry.pid != os.getpid():
+                entry = _ApiClientEntry(configuration)
+                self._entries[key] = entry
+                logger.debug(f'Created shared ApiClient for {configuration.host}')
+            entry.ref_count += 1
+            return entry.api_client
+
+    def release(self, api_client: ApiClient) -> None:
+        with self._lock:
+            key = id(api_client.configuration)
+            entry = self._entries.get(key)
+            if entry is None or entry.api_client is not api_client:
+                return
+            entry.ref_count -= 1
+            if entry.ref_count > 0:
+                return
+            del self._entries[key]
+        api_client.close()
+        logger.debug(f'Closed shared ApiClient for {api_client.configuration.host}')
+
+    def close_all(self) -> None:
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            entry.api_client.close()
+
+    def __reset_lock(self) -> None:
+        self._lock = threading.Lock()
+
+
+class _ApiClientEntry:
+    def __init__(self, configuration: Configuration):
+        # Keeps the configuration alive, so that its id is not reused
+        self.configuration = configuration
+        self.api_client = ApiClient(configuration)
+        self.pid = os.getpid()
+        self.ref_count = 0
+
+
+registry = ApiClientRegistry()
+
+
+def acquire_api_client(configuration: Configuration = None) -> ApiClient:
+    return registry.acquire(configuration)
+
+
+def release_api_client(api_client: ApiClient) -> None:
+    registry.release(api_client)
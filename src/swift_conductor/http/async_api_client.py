@@ -0,0 +1,180 @@
+from swift_conductor.configuration import Configuration
+from swift_conductor.http.api_client_registry import acquire_api_client, release_api_client
+from swift_conductor.http import rest
+from six.moves.urllib.parse import quote
+import asyncio
+import functools
+import json
+import logging
+import ssl
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+
+class AsyncApiClient(object):
+    """Asynchronous counterpart of ApiClient.
+
+    Requests are sent with aiohttp when it is installed. Otherwise they are
+    sent by the synchronous ApiClient in the default executor of the running
+    event loop, so the loop is never blocked by network calls.
+
+    Serialization and deserialization of swagger models are delegated to
+    ApiClient, so both clients produce the same objects.
+
+    :param configuration: .Configuration object for this client
+    """
+
+    def __init__(self, configuration=None):
+        if configuration is None:
+            configuration = Configuration()
+        self.configuration = configuration
+        self.api_client = acquire_api_client(configuration)
+        self._session = None
+        self._closed = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if not self._closed:
+            self._closed = True
+            release_api_client(self.api_client)
+
+    async def call_api(self, resource_path, method, path_params=None,
+                       query_params=None, body=None, response_type=None,
+                       accept='application/json', _request_timeout=None):
+        """Makes the HTTP request and returns deserialized data.
+
+        :param resource_path: Path to method endpoint.
+        :param method: Method to call.
+        :param path_params: Path parameters in the url.
+        :param query_params: Query parameters in the url, as list of tuples.
+        :param body: Request body.
+        :param response_type: Response data type.
+        :param accept: Media type of the response, sent as the Accept header.
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts. Defaults to the
+                                 connect_timeout and read_timeout of the
+                                 configuration.
+        :return: deserialized data.
+        """
+        if aiohttp is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, functools.partial(
+                self.api_client.call_api,
+                resource_path, method,
+                path_params=path_params,
+                query_params=query_params,
+                header_params={'Accept': accept},
+                body=body,
+                response_type=response_type,
+                _return_http_data_only=True,
+                _request_timeout=_request_timeout,
+            ))
+
+        for k, v in (path_params or {}).items():
+            resource_path = resource_path.replace(
+                '{%s}' % k,
+                quote(str(v), safe=self.configuration.safe_chars_for_path_param)
+            )
+        url = self.configuration.host + resource_path
+
+        headers = dict(self.api_client.default_headers)
+        headers['Accept'] = accept
+        headers['Content-Type'] = 'application/json'
+
+        data = body
+        if body is not None and not isinstance(body, bytes):
+            data = self.api_client.serialize(body)
+
+        session = self.__get_session()
+        try:
+            async with session.request(
+                method, url,
+                params=self.__to_query_params(query_params),
+                data=data,
+                headers=headers,
+                timeout=self.__get_timeout(_request_timeout),
+            ) as response:
+                status = response.status
+                reason = response.reason
+                text = await response.text()
+        except Exception as e:
+            msg = "{0}\n{1}".format(type(e).__name__, str(e))
+            raise rest.ApiException(status=0, reason=msg)
+
+        if not 200 <= status <= 299:
+            raise rest.ApiException(status=status, reason=reason, body=text)
+
+        if response_type is None or text == '':
+            return None
+
+        try:
+            response_data = json.loads(text)
+        except ValueError:
+            response_data = text
+
+        try:
+            return self.api_client.deserialize_class(response_data, response_type)
+        except ValueError as e:
+            logger.debug(
+                f'failed to deserialize data {response_data} into class {response_type}, reason: {e}')
+            return None
+
+    def __get_session(self):
+        if self._session is None:
+            # aiohttp waits for a free connection when all pool_maxsize
+            # connections to the host are in use, whatever pool_block is
+            connector = aiohttp.TCPConnector(
+                ssl=self.__get_ssl_context(),
+                limit_per_host=self.configuration.pool_maxsize,
+                force_close=not self.configuration.keep_alive,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    def __get_timeout(self, request_timeout):
+        if request_timeout is None:
+            return aiohttp.ClientTimeout(
+                connect=self.configuration.connect_timeout,
+                sock_read=self.configuration.read_timeout,
+            )
+        if isinstance(request_timeout, tuple):
+            connect_timeout, read_timeout = request_timeout
+            return aiohttp.ClientTimeout(connect=connect_timeout, sock_read=read_timeout)
+        return aiohttp.ClientTimeout(total=request_timeout)
+
+    def __get_ssl_context(self):
+        if not self.configuration.verify_ssl:
+            return False
+        if self.configuration.ssl_ca_cert is not None:
+            return ssl.create_default_context(cafile=self.configuration.ssl_ca_cert)
+        return True
+
+    @staticmethod
+    def __to_query_params(query_params):
+        if not query_params:
+            return None
+        params = []
+        for k, v in query_params:
+            if isinstance(v, bool):
+                v = 'true' if v else 'false'
+            params.append((k, str(v)))
+        return params
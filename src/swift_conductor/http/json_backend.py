@@ -0,0 +1,57 @@
+"""Encodes request bodies to JSON.
+
+orjson or ujson is used when installed, the json module of the standard
+library otherwise. Values the faster backends cannot encode (e.g. integers
+larger than 64 bits) are encoded with the json module instead.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def _dumps_json(obj, default=None) -> bytes:
+    return json.dumps(obj, default=default).encode('utf-8')
+
+
+if orjson is not None:
+    name = 'orjson'
+
+    def _dumps(obj, default=None) -> bytes:
+        return orjson.dumps(
+            obj,
+            default=default,
+            # datetime values are left to `default`, to be encoded like the json module does
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+elif ujson is not None:
+    name = 'ujson'
+
+    def _dumps(obj, default=None) -> bytes:
+        return ujson.dumps(obj, default=default, ensure_ascii=False).encode('utf-8')
+else:
+    name = 'json'
+    _dumps = _dumps_json
+
+
+def dumps(obj, default=None) -> bytes:
+    """Encodes an object to JSON.
+
+    :param obj: The object to encode.
+    :param default: Called with each value the backend cannot encode, returns
+        an encodable replacement.
+    :return: UTF-8 encoded JSON.
+    """
+    try:
+        return _dumps(obj, default)
+    except (TypeError, ValueError, OverflowError):
+        if _dumps is _dumps_json:
+            raise
+        return _dumps_json(obj, default)
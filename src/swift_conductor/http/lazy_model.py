@@ -0,0 +1,95 @@
+import threading
+
+
+class LazyModel(object):
+    """Base of lazily deserialized swagger models.
+
+    A lazy model keeps the JSON dict it was deserialized from, and only
+    deserializes an attribute the first time it is read. Values read this
+    way are not checked by the attribute setters of the model.
+    """
+
+    # swagger model the lazy model is derived from
+    model_class = None
+
+    @classmethod
+    def from_json(cls, data, fields):
+        """Creates a lazy model over a JSON dict.
+
+        :param data: dict.
+        :param fields: attribute storage name (e.g. `_status`) mapped to the
+            json key and deserializer of the attribute.
+        :return: lazy model object.
+        """
+        instance = cls.__new__(cls)
+        instance.__dict__.update(
+            _lazy_data=data,
+            _lazy_fields=fields,
+            discriminator=None,
+        )
+        return instance
+
+    def __getattr__(self, name):
+        # Only called for attributes that are not set on the instance yet
+        fields = self.__dict__.get('_lazy_fields')
+        if fields is None or name not in fields:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        key, deserializer = fields[name]
+        value = self.__dict__['_lazy_data'].get(key)
+        if value is not None:
+            value = deserializer(value)
+        self.__dict__[name] = value
+        return value
+
+    def __reduce__(self):
+        # Lazy classes are created at runtime and hold compiled deserializers,
+        # so a lazy model is pickled (and copied) as its eager model
+        state = {'discriminator': None}
+        for attr in self.swagger_types:
+            state['_' + attr] = getattr(self, attr)
+        return _eager_model, (self.model_class, state)
+
+    def __eq__(self, other):
+        """Returns true if both objects are equal"""
+        if not isinstance(other, self.model_class):
+            return False
+
+        return self.to_dict() == other.to_dict()
+
+    def __ne__(self, other):
+        """Returns true if both objects are not equal"""
+        return not self == other
+
+
+def _eager_model(klass, state):
+    """Creates a swagger model object without its attribute checks."""
+    instance = klass.__new__(klass)
+    instance.__dict__.update(state)
+    return instance
+
+
+_lazy_model_classes = {}
+_lazy_model_classes_lock = threading.Lock()
+
+
+def lazy_model_class(klass):
+    """Returns the lazy variant of a swagger model class.
+
+    The lazy variant is a subclass, so it passes `isinstance` checks against
+    the model class.
+
+    :param klass: class literal.
+    :return: class literal.
+    """
+    with _lazy_model_classes_lock:
+        lazy_klass = _lazy_model_classes.get(klass)
+        if lazy_klass is None:
+            lazy_klass = type(
+                'Lazy' + klass.__name__,
+                (LazyModel, klass),
+                {'model_class': klass, '__module__': __name__}
+            )
+            _lazy_model_classes[klass] = lazy_klass
+        return lazy_klass
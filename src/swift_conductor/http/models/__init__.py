@@ -1,28 +1,55 @@
-from swift_conductor.http.models.action import Action
-from swift_conductor.http.models.bulk_response import BulkResponse
-from swift_conductor.http.models.event_handler import EventHandler
-from swift_conductor.http.models.external_storage_location import ExternalStorageLocation
-from swift_conductor.http.models.poll_data import PollData
-from swift_conductor.http.models.rerun_workflow_request import RerunWorkflowRequest
-from swift_conductor.http.models.response import Response
-from swift_conductor.http.models.scrollable_search_result_workflow_summary import ScrollableSearchResultWorkflowSummary
-from swift_conductor.http.models.search_result_task import SearchResultTask
-from swift_conductor.http.models.search_result_task_summary import SearchResultTaskSummary
-from swift_conductor.http.models.search_result_workflow import SearchResultWorkflow
-from swift_conductor.http.models.search_result_workflow_summary import SearchResultWorkflowSummary
-from swift_conductor.http.models.skip_task_request import SkipTaskRequest
-from swift_conductor.http.models.start_workflow import StartWorkflow
-from swift_conductor.http.models.start_workflow_request import StartWorkflowRequest
-from swift_conductor.http.models.sub_workflow_params import SubWorkflowParams
-from swift_conductor.http.models.target_ref import TargetRef
-from swift_conductor.http.models.task import Task
-from swift_conductor.http.models.task_def import TaskDef
-from swift_conductor.http.models.task_details import TaskDetails
-from swift_conductor.http.models.task_exec_log import TaskExecLog
-from swift_conductor.http.models.task_result import TaskResult
-from swift_conductor.http.models.task_summary import TaskSummary
-from swift_conductor.http.models.workflow import Workflow
-from swift_conductor.http.models.workflow_def import WorkflowDef
-from swift_conductor.http.models.workflow_status import WorkflowStatus
-from swift_conductor.http.models.workflow_summary import WorkflowSummary
-from swift_conductor.http.models.workflow_task import WorkflowTask
+"""Swagger models.
+
+The model modules are imported on first use, e.g. by
+`from swift_conductor.http.models import Task` or when ApiClient looks up a
+model by its swagger type name, so importing the package stays cheap.
+"""
+import importlib
+
+# model class name -> module defining it
+_MODEL_MODULES = {
+    'Action': 'action',
+    'BulkResponse': 'bulk_response',
+    'EventHandler': 'event_handler',
+    'ExternalStorageLocation': 'external_storage_location',
+    'PollData': 'poll_data',
+    'RerunWorkflowRequest': 'rerun_workflow_request',
+    'Response': 'response',
+    'ScrollableSearchResultWorkflowSummary': 'scrollable_search_result_workflow_summary',
+    'SearchResultTask': 'search_result_task',
+    'SearchResultTaskSummary': 'search_result_task_summary',
+    'SearchResultWorkflow': 'search_result_workflow',
+    'SearchResultWorkflowSummary': 'search_result_workflow_summary',
+    'SkipTaskRequest': 'skip_task_request',
+    'StartWorkflow': 'start_workflow',
+    'StartWorkflowRequest': 'start_workflow_request',
+    'SubWorkflowParams': 'sub_workflow_params',
+    'TargetRef': 'target_ref',
+    'Task': 'task',
+    'TaskDef': 'task_def',
+    'TaskDetails': 'task_details',
+    'TaskExecLog': 'task_exec_log',
+    'TaskResult': 'task_result',
+    'TaskSummary': 'task_summary',
+    'Workflow': 'workflow',
+    'WorkflowDef': 'workflow_def',
+    'WorkflowStatus': 'workflow_status',
+    'WorkflowSummary': 'workflow_summary',
+    'WorkflowTask': 'workflow_task',
+}
+
+__all__ = list(_MODEL_MODULES)
+
+
+def __getattr__(name):
+    module_name = _MODEL_MODULES.get(name)
+    if module_name == None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(f'{__name__}.{module_name}'), name)
+    # Later lookups find the class without calling __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,59 @@
+from swift_conductor.http.models.task import Task
+from swift_conductor.http.models.task_result import TaskResult
+from swift_conductor.http.models.task_summary import TaskSummary
+from swift_conductor.http.models.workflow import Workflow
+from swift_conductor.http.models.workflow_summary import WorkflowSummary
+
+
+def _compact_eq(self, other):
+    """Returns true if both objects are equal"""
+    if not isinstance(other, self.model_class):
+        return False
+
+    return self.to_dict() == other.to_dict()
+
+
+def _compact_ne(self, other):
+    """Returns true if both objects are not equal"""
+    return not self == other
+
+
+def compact_model_class(klass):
+    """Creates a variant of a swagger model class that stores its attributes
+    in `__slots__` instead of a per-instance `__dict__`.
+
+    The variant is a subclass, so it passes `isinstance` checks against the
+    model class. Its instances still have the `__dict__` of the model class,
+    but every attribute is stored in a slot, so the dict is never filled.
+    Comparing a model with its variant uses the `__eq__` of the variant,
+    which compares attribute values, whichever side it is on.
+
+    :param klass: class literal.
+    :return: class literal.
+    """
+    namespace = dict(
+        __slots__=tuple('_' + attr for attr in klass.swagger_types) + ('discriminator',),
+        __module__=__name__,
+        __qualname__='Compact' + klass.__name__,
+        __eq__=_compact_eq,
+        __ne__=_compact_ne,
+        model_class=klass,
+    )
+    return type('Compact' + klass.__name__, (klass,), namespace)
+
+
+CompactTask = compact_model_class(Task)
+CompactTaskResult = compact_model_class(TaskResult)
+CompactTaskSummary = compact_model_class(TaskSummary)
+CompactWorkflow = compact_model_class(Workflow)
+CompactWorkflowSummary = compact_model_class(WorkflowSummary)
+
+# model class -> compact variant, used by ApiClient when
+# Configuration.compact_models is set
+COMPACT_MODEL_CLASSES = {
+    Task: CompactTask,
+    TaskResult: CompactTaskResult,
+    TaskSummary: CompactTaskSummary,
+    Workflow: CompactWorkflow,
+    WorkflowSummary: CompactWorkflowSummary,
+}
@@ -1,13 +1,16 @@
 from swift_conductor.configuration import Configuration
+from swift_conductor.http import json_backend
 from six.moves.urllib.parse import urlencode
 import certifi
 import io
-import json
 import logging
 import re
 import six
+import socket
 import ssl
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 
 
 class RESTResponse(io.IOBase):
@@ -22,9 +25,46 @@ class RESTResponse(io.IOBase):
         return self.headers
 
 
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that enables TCP keep-alive probes on pooled connections."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
+
 class RESTClientObject(object):
-    def __init__(self, connection = None):
-        self.connection = connection or requests.Session()
+    def __init__(self, connection = None, configuration: Configuration = None):
+        if configuration is None:
+            configuration = Configuration()
+        self.timeout = (configuration.connect_timeout, configuration.read_timeout)
+        # Connections provided by the caller are left for the caller to close
+        self._owns_connection = connection is None
+        self.connection = connection or self.__create_session(configuration)
+
+    def close(self) -> None:
+        if self._owns_connection:
+            self.connection.close()
+
+    @staticmethod
+    def __create_session(configuration: Configuration) -> requests.Session:
+        session = requests.Session()
+
+        adapter_class = KeepAliveHTTPAdapter if configuration.keep_alive else HTTPAdapter
+        adapter = adapter_class(
+            pool_connections=configuration.pool_connections,
+            pool_maxsize=configuration.pool_maxsize,
+            pool_block=configuration.pool_block,
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        if not configuration.keep_alive:
+            session.headers['Connection'] = 'close'
+
+        return session
 
 
     def request(self, method, url, query_params=None, headers=None,
@@ -46,7 +86,9 @@ class RESTClientObject(object):
         :param _request_timeout: timeout setting for this request. If one
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
-                                 (connection, read) timeouts.
+                                 (connection, read) timeouts. Defaults to the
+                                 connect_timeout and read_timeout of the
+                                 configuration.
         """
         method = method.upper()
         assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT',
@@ -60,7 +102,7 @@ class RESTClientObject(object):
         post_params = post_params or {}
         headers = headers or {}
 
-        timeout = _request_timeout if _request_timeout is not None else 45
+        timeout = _request_timeout if _request_timeout is not None else self.timeout
 
         if 'Content-Type' not in headers:
             headers['Content-Type'] = 'application/json'
@@ -72,8 +114,11 @@ class RESTClientObject(object):
                     url += '?' + urlencode(query_params)
                 if re.search('json', headers['Content-Type'], re.IGNORECASE) or isinstance(body, str):
                     request_body = '{}'
-                    if body is not None:
-                        request_body = json.dumps(body)
+                    if isinstance(body, bytes):
+                        # Already serialized by ApiClient
+                        request_body = body
+                    elif body is not None:
+                        request_body = json_backend.dumps(body)
                     r = self.connection.request(
                         method, url,
                         data=request_body,
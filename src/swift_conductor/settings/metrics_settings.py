@@ -1,5 +1,6 @@
 from swift_conductor.configuration import Configuration
 from pathlib import Path
+from typing import List
 import logging
 import os
 
@@ -10,6 +11,11 @@ logger = logging.getLogger(
 )
 
 
+# Histogram buckets in seconds
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DEFAULT_EXECUTE_LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0)
+
+
 def get_default_temporary_folder() -> str:
     return f'{str(Path.home())}/tmp/'
 
@@ -19,12 +25,32 @@ class MetricsSettings:
             self,
             directory: str = None,
             file_name: str = 'metrics.log',
-            update_interval: float = 0.1):
+            update_interval: float = 0.1,
+            latency_buckets: List[float] = DEFAULT_LATENCY_BUCKETS,
+            execute_latency_buckets: List[float] = DEFAULT_EXECUTE_LATENCY_BUCKETS,
+            http_port: int = None,
+            http_address: str = '0.0.0.0',
+            payload_size_sample_rate: float = 1.0,
+            input_size_sample_rate: float = 0.01):
         if directory == None:
             directory = get_default_temporary_folder()
         self.__set_dir(directory)
         self.file_name = file_name
         self.update_interval = update_interval
+        # Histogram buckets in seconds of the poll and update latency
+        self.latency_buckets = latency_buckets
+        # Histogram buckets in seconds of the execute and end-to-end latency
+        self.execute_latency_buckets = execute_latency_buckets
+        # When set, metrics are served at http://<http_address>:<http_port>/metrics
+        # on each scrape, instead of being written to file_name every update_interval
+        self.http_port = http_port
+        self.http_address = http_address
+        # Fraction of tasks to record the result payload size of, between 0.0
+        # and 1.0. The serialized result is reused to send it.
+        self.payload_size_sample_rate = payload_size_sample_rate
+        # Fraction of tasks to record the input payload size of. The input
+        # arrives deserialized, so measuring it serializes it again.
+        self.input_size_sample_rate = input_size_sample_rate
 
     def __set_dir(self, dir: str) -> None:
         if not os.path.isdir(dir):
@@ -0,0 +1,41 @@
+from swift_conductor.configuration import Configuration
+import logging
+import os
+
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
+
+class TaskUpdateSettings:
+    def __init__(
+            self,
+            queue_size: int = 1000,
+            max_retries: int = 3,
+            retry_backoff: float = 1.0,
+            max_retry_backoff: float = 30.0,
+            spill_directory: str = None):
+        # Maximum number of task results waiting to be sent or retried.
+        # Handing over more results blocks until some are sent.
+        self.queue_size = queue_size
+        # Retries after the first attempt before a result is given up on
+        self.max_retries = max_retries
+        # Wait in seconds before the first retry, doubled on every retry
+        self.retry_backoff = retry_backoff
+        self.max_retry_backoff = max_retry_backoff
+        # Results that still fail after all retries are written to this
+        # directory and sent again when the worker restarts
+        self.spill_directory = None
+        if spill_directory != None:
+            self.__set_spill_dir(spill_directory)
+
+    def __set_spill_dir(self, dir: str) -> None:
+        if not os.path.isdir(dir):
+            try:
+                os.makedirs(dir)
+            except Exception as e:
+                logger.warning(
+                    f'Failed to create task result spill folder, reason: {e}')
+        self.spill_directory = dir
@@ -3,14 +3,22 @@ from swift_conductor.settings.metrics_settings import MetricsSettings
 from swift_conductor.telemetry.model.metric_documentation import MetricDocumentation
 from swift_conductor.telemetry.model.metric_label import MetricLabel
 from swift_conductor.telemetry.model.metric_name import MetricName
+from swift_conductor.telemetry.task_metrics import TaskMetrics
 from prometheus_client import CollectorRegistry
 from prometheus_client import Counter
 from prometheus_client import Gauge
+from prometheus_client import Histogram
+from prometheus_client import make_wsgi_app
+from prometheus_client import values
 from prometheus_client import write_to_textfile
 from prometheus_client.multiprocess import MultiProcessCollector
-from typing import Any, Dict, List
+from prometheus_client.multiprocess import mark_process_dead
+from socketserver import ThreadingMixIn
+from typing import Any, Callable, Dict, List, Union
+from wsgiref.simple_server import make_server, WSGIRequestHandler, WSGIServer
 import logging
 import os
+import threading
 import time
 
 logger = logging.getLogger(
@@ -21,14 +29,24 @@ logger = logging.getLogger(
 
 
 class MetricsCollector:
+    # Metrics are shared by all collectors of the process: in multiprocess
+    # mode each process keeps a single value per metric and labels
     counters = {}
     gauges = {}
+    histograms = {}
     registry = CollectorRegistry()
+    lock = threading.RLock()
     must_collect_metrics = False
 
     def __init__(self, settings: MetricsSettings):
+        self.settings = settings
+        self.task_metrics = {}
         if settings != None:
             os.environ["PROMETHEUS_MULTIPROC_DIR"] = settings.directory
+            # prometheus_client picks the multiprocess value store when it is
+            # imported, which may be before the directory was set
+            if values.ValueClass is values.MutexValue:
+                values.ValueClass = values.get_value_class()
             MultiProcessCollector(self.registry)
             self.must_collect_metrics = True
 
@@ -36,6 +54,11 @@ class MetricsCollector:
     def provide_metrics(settings: MetricsSettings) -> None:
         if settings == None:
             return
+        if settings.http_port != None:
+            server = MetricsCollector.create_metrics_server(settings)
+            logger.info(f'Serving metrics at http://{settings.http_address}:{server.server_port}/metrics')
+            server.serve_forever()
+            return
         OUTPUT_FILE_PATH = os.path.join(
             settings.directory,
             settings.file_name
@@ -49,23 +72,59 @@ class MetricsCollector:
             )
             time.sleep(settings.update_interval)
 
-    def increment_task_poll(self, task_type: str) -> None:
-        self.__increment_counter(
-            name=MetricName.TASK_POLL,
-            documentation=MetricDocumentation.TASK_POLL,
-            labels={
-                MetricLabel.TASK_TYPE: task_type
-            }
+    @staticmethod
+    def create_metrics_server(settings: MetricsSettings) -> WSGIServer:
+        """Creates an HTTP server for the metrics of all worker processes.
+
+        The metrics files in settings.directory are only read when the
+        server is scraped.
+        """
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = settings.directory
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+        return make_server(
+            settings.http_address,
+            settings.http_port,
+            make_wsgi_app(registry),
+            server_class=_ThreadingWSGIServer,
+            handler_class=_SilentHandler,
         )
 
+    def mark_process_dead(self, pid: int) -> None:
+        """Removes the gauges of a worker process that exited, so that they
+        are not reported along with the ones of its replacement. The drain
+        time of the process is kept."""
+        if not self.must_collect_metrics or pid == None:
+            return
+        mark_process_dead(pid, self.settings.directory)
+
+    def get_task_metrics(self, task_type: str) -> TaskMetrics:
+        """Returns the metrics of a task type, bound to its label on first use.
+
+        Workers can call this once when they start, and record values on the
+        returned TaskMetrics without any label lookups.
+        """
+        task_metrics = self.task_metrics.get(task_type)
+        if task_metrics is None:
+            with self.lock:
+                task_metrics = self.task_metrics.get(task_type)
+                if task_metrics is None:
+                    task_metrics = self.__create_task_metrics(task_type)
+                    self.task_metrics[task_type] = task_metrics
+        return task_metrics
+
+    def bind_task_metrics(self, task_type: Union[str, List[str]]) -> None:
+        """Binds the metrics of one or more task types to their labels up
+        front, so that recording them takes no label lookups."""
+        task_types = task_type if isinstance(task_type, list) else [task_type]
+        for task_type in task_types:
+            self.get_task_metrics(task_type)
+
+    def increment_task_poll(self, task_type: str) -> None:
+        self.get_task_metrics(task_type).increment_task_poll()
+
     def increment_task_execution_queue_full(self, task_type: str) -> None:
-        self.__increment_counter(
-            name=MetricName.TASK_EXECUTION_QUEUE_FULL,
-            documentation=MetricDocumentation.TASK_EXECUTION_QUEUE_FULL,
-            labels={
-                MetricLabel.TASK_TYPE: task_type
-            }
-        )
+        self.get_task_metrics(task_type).increment_task_execution_queue_full()
 
     def increment_uncaught_exception(self):
         self.__increment_counter(
@@ -85,13 +144,7 @@ class MetricsCollector:
         )
 
     def increment_task_paused(self, task_type: str) -> None:
-        self.__increment_counter(
-            name=MetricName.TASK_PAUSED,
-            documentation=MetricDocumentation.TASK_PAUSED,
-            labels={
-                MetricLabel.TASK_TYPE: task_type
-            }
-        )
+        self.get_task_metrics(task_type).increment_task_paused()
 
     def increment_task_execution_error(self, task_type: str, exception: Exception) -> None:
         self.__increment_counter(
@@ -104,13 +157,7 @@ class MetricsCollector:
         )
 
     def increment_task_ack_failed(self, task_type: str) -> None:
-        self.__increment_counter(
-            name=MetricName.TASK_ACK_FAILED,
-            documentation=MetricDocumentation.TASK_ACK_FAILED,
-            labels={
-                MetricLabel.TASK_TYPE: task_type
-            }
-        )
+        self.get_task_metrics(task_type).increment_task_ack_failed()
 
     def increment_task_ack_error(self, task_type: str, exception: Exception) -> None:
         self.__increment_counter(
@@ -132,6 +179,34 @@ class MetricsCollector:
             }
         )
 
+    def increment_task_heartbeat_error(self, task_type: str, exception: Exception) -> None:
+        self.__increment_counter(
+            name=MetricName.TASK_HEARTBEAT_ERROR,
+            documentation=MetricDocumentation.TASK_HEARTBEAT_ERROR,
+            labels={
+                MetricLabel.TASK_TYPE: task_type,
+                MetricLabel.EXCEPTION: str(exception)
+            }
+        )
+
+    def increment_task_abandoned(self, task_type: str) -> None:
+        self.__increment_counter(
+            name=MetricName.TASK_ABANDONED,
+            documentation=MetricDocumentation.TASK_ABANDONED,
+            labels={
+                MetricLabel.TASK_TYPE: task_type
+            }
+        )
+
+    def increment_worker_restart(self, task_type: str) -> None:
+        self.__increment_counter(
+            name=MetricName.WORKER_RESTART,
+            documentation=MetricDocumentation.WORKER_RESTART,
+            labels={
+                MetricLabel.TASK_TYPE: task_type
+            }
+        )
+
     def increment_external_payload_used(self, entity_name: str, operation: str, payload_type: str) -> None:
         self.__increment_counter(
             name=MetricName.EXTERNAL_PAYLOAD_USED,
@@ -165,33 +240,90 @@ class MetricsCollector:
         )
 
     def record_task_result_payload_size(self, task_type: str, payload_size: int) -> None:
+        self.get_task_metrics(task_type).record_task_result_payload_size(payload_size)
+
+    def record_worker_drain_time(self, time_spent: float) -> None:
         self.__record_gauge(
-            name=MetricName.TASK_RESULT_SIZE,
-            documentation=MetricDocumentation.TASK_RESULT_SIZE,
-            labels={
-                MetricLabel.TASK_TYPE: task_type
-            },
-            value=payload_size
+            name=MetricName.WORKER_DRAIN_TIME,
+            documentation=MetricDocumentation.WORKER_DRAIN_TIME,
+            labels={},
+            value=time_spent,
+            # Recorded by a process right before it exits
+            multiprocess_mode='all'
         )
 
+    def record_task_input_payload_size(self, task_type: str, payload_size: int) -> None:
+        self.get_task_metrics(task_type).record_task_input_payload_size(payload_size)
+
+    def measure_task_input_payload(self, task_type: str, input_data: Any, serialize: Callable[[Any], bytes]) -> None:
+        self.get_task_metrics(task_type).measure_task_input_payload(input_data, serialize)
+
+    def measure_task_result_payload(self, task_type: str, task_result: Any, serialize: Callable[[Any], bytes]) -> Any:
+        return self.get_task_metrics(task_type).measure_task_result_payload(task_result, serialize)
+
     def record_task_poll_time(self, task_type: str, time_spent: float) -> None:
-        self.__record_gauge(
-            name=MetricName.TASK_POLL_TIME,
-            documentation=MetricDocumentation.TASK_POLL_TIME,
-            labels={
-                MetricLabel.TASK_TYPE: task_type
-            },
-            value=time_spent
-        )
+        self.get_task_metrics(task_type).record_task_poll_time(time_spent)
+
+    def record_task_poll_interval(self, task_type: str, interval: float) -> None:
+        self.get_task_metrics(task_type).record_task_poll_interval(interval)
 
     def record_task_execute_time(self, task_type: str, time_spent: float) -> None:
-        self.__record_gauge(
-            name=MetricName.TASK_EXECUTE_TIME,
-            documentation=MetricDocumentation.TASK_EXECUTE_TIME,
-            labels={
-                MetricLabel.TASK_TYPE: task_type
-            },
-            value=time_spent
+        self.get_task_metrics(task_type).record_task_execute_time(time_spent)
+
+    def record_task_update_time(self, task_type: str, time_spent: float) -> None:
+        self.get_task_metrics(task_type).record_task_update_time(time_spent)
+
+    def record_task_end_to_end_time(self, task_type: str, time_spent: float) -> None:
+        self.get_task_metrics(task_type).record_task_end_to_end_time(time_spent)
+
+    def __create_task_metrics(self, task_type: str) -> TaskMetrics:
+        if not self.must_collect_metrics:
+            return TaskMetrics()
+        labelnames = [MetricLabel.TASK_TYPE]
+        latency_buckets = self.settings.latency_buckets
+        execute_latency_buckets = self.settings.execute_latency_buckets
+        return TaskMetrics(
+            task_poll=self.__get_counter(
+                MetricName.TASK_POLL, MetricDocumentation.TASK_POLL, labelnames
+            ).labels(task_type),
+            task_execution_queue_full=self.__get_counter(
+                MetricName.TASK_EXECUTION_QUEUE_FULL, MetricDocumentation.TASK_EXECUTION_QUEUE_FULL, labelnames
+            ).labels(task_type),
+            task_paused=self.__get_counter(
+                MetricName.TASK_PAUSED, MetricDocumentation.TASK_PAUSED, labelnames
+            ).labels(task_type),
+            task_ack_failed=self.__get_counter(
+                MetricName.TASK_ACK_FAILED, MetricDocumentation.TASK_ACK_FAILED, labelnames
+            ).labels(task_type),
+            task_poll_time=self.__get_gauge(
+                MetricName.TASK_POLL_TIME, MetricDocumentation.TASK_POLL_TIME, labelnames
+            ).labels(task_type),
+            task_poll_latency=self.__get_histogram(
+                MetricName.TASK_POLL_LATENCY, MetricDocumentation.TASK_POLL_LATENCY, labelnames, latency_buckets
+            ).labels(task_type),
+            task_poll_interval=self.__get_gauge(
+                MetricName.TASK_POLL_INTERVAL, MetricDocumentation.TASK_POLL_INTERVAL, labelnames
+            ).labels(task_type),
+            task_execute_time=self.__get_gauge(
+                MetricName.TASK_EXECUTE_TIME, MetricDocumentation.TASK_EXECUTE_TIME, labelnames
+            ).labels(task_type),
+            task_execute_latency=self.__get_histogram(
+                MetricName.TASK_EXECUTE_LATENCY, MetricDocumentation.TASK_EXECUTE_LATENCY, labelnames, execute_latency_buckets
+            ).labels(task_type),
+            task_result_size=self.__get_gauge(
+                MetricName.TASK_RESULT_SIZE, MetricDocumentation.TASK_RESULT_SIZE, labelnames
+            ).labels(task_type),
+            task_input_size=self.__get_gauge(
+                MetricName.TASK_INPUT_SIZE, MetricDocumentation.TASK_INPUT_SIZE, labelnames
+            ).labels(task_type),
+            task_update_latency=self.__get_histogram(
+                MetricName.TASK_UPDATE_LATENCY, MetricDocumentation.TASK_UPDATE_LATENCY, labelnames, latency_buckets
+            ).labels(task_type),
+            task_end_to_end_latency=self.__get_histogram(
+                MetricName.TASK_END_TO_END_LATENCY, MetricDocumentation.TASK_END_TO_END_LATENCY, labelnames, execute_latency_buckets
+            ).labels(task_type),
+            payload_size_sample_rate=self.settings.payload_size_sample_rate,
+            input_size_sample_rate=self.settings.input_size_sample_rate,
         )
 
     def __increment_counter(
@@ -214,16 +346,20 @@ class MetricsCollector:
         name: MetricName,
         documentation: MetricDocumentation,
         labels: Dict[MetricLabel, str],
-        value: Any
+        value: Any,
+        multiprocess_mode: str = 'liveall'
     ) -> None:
         if not self.must_collect_metrics:
             return
         gauge = self.__get_gauge(
             name=name,
             documentation=documentation,
-            labelnames=labels.keys()
+            labelnames=labels.keys(),
+            multiprocess_mode=multiprocess_mode
         )
-        gauge.labels(*labels.values()).set(value)
+        if labels:
+            gauge = gauge.labels(*labels.values())
+        gauge.set(value)
 
     def __get_counter(
         self,
@@ -232,23 +368,43 @@ class MetricsCollector:
         labelnames: List[MetricLabel]
     ) -> Counter:
         if name not in self.counters:
-            self.counters[name] = self.__generate_counter(
-                name, documentation, labelnames
-            )
+            with self.lock:
+                if name not in self.counters:
+                    self.counters[name] = self.__generate_counter(
+                        name, documentation, labelnames
+                    )
         return self.counters[name]
 
     def __get_gauge(
         self,
         name: MetricName,
         documentation: MetricDocumentation,
-        labelnames: List[MetricLabel]
+        labelnames: List[MetricLabel],
+        multiprocess_mode: str = 'liveall'
     ) -> Gauge:
         if name not in self.gauges:
-            self.gauges[name] = self.__generate_gauge(
-                name, documentation, labelnames
-            )
+            with self.lock:
+                if name not in self.gauges:
+                    self.gauges[name] = self.__generate_gauge(
+                        name, documentation, labelnames, multiprocess_mode
+                    )
         return self.gauges[name]
 
+    def __get_histogram(
+        self,
+        name: MetricName,
+        documentation: MetricDocumentation,
+        labelnames: List[MetricLabel],
+        buckets: List[float]
+    ) -> Histogram:
+        if name not in self.histograms:
+            with self.lock:
+                if name not in self.histograms:
+                    self.histograms[name] = self.__generate_histogram(
+                        name, documentation, labelnames, buckets
+                    )
+        return self.histograms[name]
+
     def __generate_counter(
         self,
         name: MetricName,
@@ -266,11 +422,40 @@ class MetricsCollector:
         self,
         name: MetricName,
         documentation: MetricDocumentation,
-        labelnames: List[MetricLabel]
+        labelnames: List[MetricLabel],
+        multiprocess_mode: str
     ) -> Gauge:
+        # In a live mode, the values of a process are reported until it is
+        # marked dead
         return Gauge(
             name=name,
             documentation=documentation,
             labelnames=labelnames,
+            registry=self.registry,
+            multiprocess_mode=multiprocess_mode
+        )
+
+    def __generate_histogram(
+        self,
+        name: MetricName,
+        documentation: MetricDocumentation,
+        labelnames: List[MetricLabel],
+        buckets: List[float]
+    ) -> Histogram:
+        return Histogram(
+            name=name,
+            documentation=documentation,
+            labelnames=labelnames,
+            buckets=buckets or Histogram.DEFAULT_BUCKETS,
             registry=self.registry
         )
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class _SilentHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        # Scrapes are not logged
+        pass
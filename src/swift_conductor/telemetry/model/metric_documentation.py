@@ -3,17 +3,27 @@ from enum import Enum
 
 class MetricDocumentation(str, Enum):
     EXTERNAL_PAYLOAD_USED = "Incremented each time external payload storage is used"
+    TASK_ABANDONED = "Tasks that were not executed or updated before the worker stopped"
     TASK_ACK_ERROR = "Task ack has encountered an exception"
     TASK_ACK_FAILED = "Task ack failed"
     TASK_EXECUTE_ERROR = "Execution error"
+    TASK_END_TO_END_LATENCY = "Distribution of the time from the start of a task execution until its result is accepted by the server"
+    TASK_EXECUTE_LATENCY = "Distribution of the time to execute a task"
     TASK_EXECUTE_TIME = "Time to execute a task"
     TASK_EXECUTION_QUEUE_FULL = "Counter to record execution queue has saturated"
+    TASK_HEARTBEAT_ERROR = "Heartbeat of an executing task cannot be sent to server"
+    TASK_INPUT_SIZE = "Records input payload size of a task, in bytes of JSON"
     TASK_PAUSED = "Counter for number of times the task has been polled, when the worker has been paused"
     TASK_POLL = "Incremented each time polling is done"
     TASK_POLL_ERROR = "Client error when polling for a task queue"
+    TASK_POLL_INTERVAL = "Time to wait before the next poll"
+    TASK_POLL_LATENCY = "Distribution of the time to poll for a batch of tasks"
     TASK_POLL_TIME = "Time to poll for a batch of tasks"
-    TASK_RESULT_SIZE = "Records output payload size of a task"
+    TASK_RESULT_SIZE = "Records output payload size of a task, in bytes of JSON"
     TASK_UPDATE_ERROR = "Task status cannot be updated back to server"
+    TASK_UPDATE_LATENCY = "Distribution of the time to update a task result on the server"
     THREAD_UNCAUGHT_EXCEPTION = "thread_uncaught_exceptions"
+    WORKER_DRAIN_TIME = "Time to drain in-flight tasks when the worker stopped"
+    WORKER_RESTART = "Incremented each time a worker process that exited is restarted"
     WORKFLOW_START_ERROR = "Counter for workflow start errors"
     WORKFLOW_INPUT_SIZE = "Records input payload size of a workflow"
@@ -3,17 +3,27 @@ from enum import Enum
 
 class MetricName(str, Enum):
     EXTERNAL_PAYLOAD_USED = "external_payload_used"
+    TASK_ABANDONED = "task_abandoned"
     TASK_ACK_ERROR = "task_ack_error"
     TASK_ACK_FAILED = "task_ack_failed"
     TASK_EXECUTE_ERROR = "task_execute_error"
+    TASK_END_TO_END_LATENCY = "task_end_to_end_latency_seconds"
+    TASK_EXECUTE_LATENCY = "task_execute_latency_seconds"
     TASK_EXECUTE_TIME = "task_execute_time"
     TASK_EXECUTION_QUEUE_FULL = "task_execution_queue_full"
+    TASK_HEARTBEAT_ERROR = "task_heartbeat_error"
+    TASK_INPUT_SIZE = "task_input_size"
     TASK_PAUSED = "task_paused"
     TASK_POLL = "task_poll"
     TASK_POLL_ERROR = "task_poll_error"
+    TASK_POLL_INTERVAL = "task_poll_interval"
+    TASK_POLL_LATENCY = "task_poll_latency_seconds"
     TASK_POLL_TIME = "task_poll_time"
     TASK_RESULT_SIZE = "task_result_size"
     TASK_UPDATE_ERROR = "task_update_error"
+    TASK_UPDATE_LATENCY = "task_update_latency_seconds"
     THREAD_UNCAUGHT_EXCEPTION = "thread_uncaught_exceptions"
+    WORKER_DRAIN_TIME = "worker_drain_time"
+    WORKER_RESTART = "worker_restart"
     WORKFLOW_INPUT_SIZE = "workflow_input_size"
     WORKFLOW_START_ERROR = "workflow_start_error"
@@ -0,0 +1,124 @@
+from typing import Any, Callable
+import random
+
+
+class _DisabledMetric:
+    """Stands in for a labelled metric when metrics are not collected."""
+
+    def inc(self, amount: float = 1) -> None:
+        pass
+
+    def set(self, value: float) -> None:
+        pass
+
+    def observe(self, amount: float) -> None:
+        pass
+
+
+DISABLED_METRIC = _DisabledMetric()
+
+
+class TaskMetrics:
+    """Metrics of one task type.
+
+    The metrics are bound to the task type label once, when the TaskMetrics
+    is created by MetricsCollector.get_task_metrics, so recording a value is
+    a single call on the labelled metric.
+    """
+
+    def __init__(
+            self,
+            task_poll=DISABLED_METRIC,
+            task_execution_queue_full=DISABLED_METRIC,
+            task_paused=DISABLED_METRIC,
+            task_ack_failed=DISABLED_METRIC,
+            task_poll_time=DISABLED_METRIC,
+            task_poll_latency=DISABLED_METRIC,
+            task_poll_interval=DISABLED_METRIC,
+            task_execute_time=DISABLED_METRIC,
+            task_execute_latency=DISABLED_METRIC,
+            task_result_size=DISABLED_METRIC,
+            task_input_size=DISABLED_METRIC,
+            task_update_latency=DISABLED_METRIC,
+            task_end_to_end_latency=DISABLED_METRIC,
+            payload_size_sample_rate: float = 0.0,
+            input_size_sample_rate: float = 0.0,
+    ):
+        self._task_poll = task_poll
+        self._task_execution_queue_full = task_execution_queue_full
+        self._task_paused = task_paused
+        self._task_ack_failed = task_ack_failed
+        self._task_poll_time = task_poll_time
+        self._task_poll_latency = task_poll_latency
+        self._task_poll_interval = task_poll_interval
+        self._task_execute_time = task_execute_time
+        self._task_execute_latency = task_execute_latency
+        self._task_result_size = task_result_size
+        self._task_input_size = task_input_size
+        self._task_update_latency = task_update_latency
+        self._task_end_to_end_latency = task_end_to_end_latency
+        self._payload_size_sample_rate = payload_size_sample_rate
+        self._input_size_sample_rate = input_size_sample_rate
+
+    def increment_task_poll(self) -> None:
+        self._task_poll.inc()
+
+    def increment_task_execution_queue_full(self) -> None:
+        self._task_execution_queue_full.inc()
+
+    def increment_task_paused(self) -> None:
+        self._task_paused.inc()
+
+    def increment_task_ack_failed(self) -> None:
+        self._task_ack_failed.inc()
+
+    def record_task_poll_time(self, time_spent: float) -> None:
+        self._task_poll_time.set(time_spent)
+        self._task_poll_latency.observe(time_spent)
+
+    def record_task_poll_interval(self, interval: float) -> None:
+        self._task_poll_interval.set(interval)
+
+    def record_task_execute_time(self, time_spent: float) -> None:
+        self._task_execute_time.set(time_spent)
+        self._task_execute_latency.observe(time_spent)
+
+    def record_task_result_payload_size(self, payload_size: int) -> None:
+        self._task_result_size.set(payload_size)
+
+    def record_task_input_payload_size(self, payload_size: int) -> None:
+        self._task_input_size.set(payload_size)
+
+    def measure_task_input_payload(self, input_data: Any, serialize: Callable[[Any], bytes]) -> None:
+        """Records the serialized size of a task input, if the task is sampled."""
+        if input_data is None or not self.__sample(self._input_size_sample_rate):
+            return
+        self._task_input_size.set(len(serialize(input_data)))
+
+    def measure_task_result_payload(self, task_result: Any, serialize: Callable[[Any], bytes]) -> Any:
+        """Returns the body to send a task result with.
+
+        If the task is sampled, the result is serialized here to record its
+        size, and the serialized bytes are returned, so the result is not
+        serialized again when it is sent.
+        """
+        if not self.__sample(self._payload_size_sample_rate):
+            return task_result
+        try:
+            body = serialize(task_result)
+        except Exception:
+            # Left to fail when the result is sent, as it would without metrics
+            return task_result
+        self._task_result_size.set(len(body))
+        return body
+
+    def record_task_update_time(self, time_spent: float) -> None:
+        self._task_update_latency.observe(time_spent)
+
+    def record_task_end_to_end_time(self, time_spent: float) -> None:
+        self._task_end_to_end_latency.observe(time_spent)
+
+    def __sample(self, sample_rate: float) -> bool:
+        if sample_rate >= 1.0:
+            return True
+        return random.random() < sample_rate
@@ -2,10 +2,14 @@ from swift_conductor.http.models.task import Task
 from swift_conductor.http.models.task_result import TaskResult
 
 import abc
+import asyncio
 import socket
 from typing import Union
 
 DEFAULT_POLLING_INTERVAL = 100 # ms
+DEFAULT_THREAD_COUNT = 1
+DEFAULT_PROCESS_COUNT = 1
+DEFAULT_POLL_TIMEOUT = 100 # ms
 
 class WorkerAbc(abc.ABC):
     def __init__(self, task_definition_name: Union[str, list]):
@@ -14,6 +18,11 @@ class WorkerAbc(abc.ABC):
         self._task_definition_name_cache = None
         self._domain = None
         self._poll_interval = DEFAULT_POLLING_INTERVAL
+        self._thread_count = DEFAULT_THREAD_COUNT
+        self._process_count = DEFAULT_PROCESS_COUNT
+        self._poll_timeout = DEFAULT_POLL_TIMEOUT
+        self._max_poll_interval = None
+        self._heartbeat_interval = None
 
     @abc.abstractmethod
     def execute(self, task: Task) -> TaskResult:
@@ -26,6 +35,17 @@ class WorkerAbc(abc.ABC):
         """
         pass
 
+    async def execute_async(self, task: Task) -> TaskResult:
+        """
+        Executes a task without blocking the event loop of an AsyncWorkerHost.
+        By default `execute` runs in the default executor of the running loop.
+
+        :param Task: (required)
+        :return: TaskResult
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.execute, task)
+
     def get_identity(self) -> str:
         """
         Retrieve the hostname of the instance that the worker is running.
@@ -43,6 +63,53 @@ class WorkerAbc(abc.ABC):
         """
         return (self.poll_interval if self.poll_interval else DEFAULT_POLLING_INTERVAL) / 1000
 
+    def get_max_polling_interval_in_seconds(self) -> float:
+        """
+        Retrieve the longest interval in seconds the worker backs off to while polls return no tasks.
+        Adaptive polling is disabled when it is not set.
+
+        :return: float
+                 Default: None
+        """
+        return self.max_poll_interval / 1000 if self.max_poll_interval else None
+
+    def get_heartbeat_interval_in_seconds(self) -> float:
+        """
+        Retrieve the interval in seconds at which heartbeats are sent for the tasks the worker is executing.
+        Heartbeats are disabled when it is not set.
+
+        :return: float
+                 Default: None
+        """
+        return self.heartbeat_interval / 1000 if self.heartbeat_interval else None
+
+    def get_thread_count(self) -> int:
+        """
+        Retrieve the number of tasks the worker process may execute at the same time.
+
+        :return: int
+                 Default: 1
+        """
+        return self.thread_count if self.thread_count else DEFAULT_THREAD_COUNT
+
+    def get_process_count(self) -> int:
+        """
+        Retrieve the number of processes WorkerHost runs the worker in.
+
+        :return: int
+                 Default: 1
+        """
+        return self.process_count if self.process_count else DEFAULT_PROCESS_COUNT
+
+    def get_poll_timeout_in_milliseconds(self) -> int:
+        """
+        Retrieve how long the server may hold a batch poll request open while waiting for tasks.
+
+        :return: int
+                 Default: 100ms
+        """
+        return int(self.poll_timeout if self.poll_timeout else DEFAULT_POLL_TIMEOUT)
+
     def get_task_definition_name(self) -> str:
         """
         Retrieve the name of the task definition the worker is currently working on.
@@ -109,3 +176,43 @@ class WorkerAbc(abc.ABC):
     @poll_interval.setter
     def poll_interval(self, value):
         self._poll_interval = value
+
+    @property
+    def thread_count(self):
+        return self._thread_count
+
+    @thread_count.setter
+    def thread_count(self, value):
+        self._thread_count = value
+
+    @property
+    def process_count(self):
+        return self._process_count
+
+    @process_count.setter
+    def process_count(self, value):
+        self._process_count = value
+
+    @property
+    def poll_timeout(self):
+        return self._poll_timeout
+
+    @poll_timeout.setter
+    def poll_timeout(self, value):
+        self._poll_timeout = value
+
+    @property
+    def max_poll_interval(self):
+        return self._max_poll_interval
+
+    @max_poll_interval.setter
+    def max_poll_interval(self, value):
+        self._max_poll_interval = value
+
+    @property
+    def heartbeat_interval(self):
+        return self._heartbeat_interval
+
+    @heartbeat_interval.setter
+    def heartbeat_interval(self, value):
+        self._heartbeat_interval = value
@@ -2,12 +2,13 @@ from copy import deepcopy
 from swift_conductor.http.models.task import Task
 from swift_conductor.http.models.task_result import TaskResult
 from swift_conductor.http.models.task_result_status import TaskResultStatus
-from swift_conductor.worker.worker_abc import WorkerAbc, DEFAULT_POLLING_INTERVAL
-from typing import Any, Callable, Union
+from swift_conductor.worker.worker_abc import WorkerAbc, DEFAULT_POLLING_INTERVAL, DEFAULT_THREAD_COUNT, DEFAULT_PROCESS_COUNT, DEFAULT_POLL_TIMEOUT
+from typing import Any, Awaitable, Callable, Union
 from typing_extensions import Self
+import asyncio
 import inspect
 
-ExecuteTaskFunction = Callable[[ Union[Task, object] ], Union[TaskResult, object]]
+ExecuteTaskFunction = Callable[[ Union[Task, object] ], Union[TaskResult, object, Awaitable[Union[TaskResult, object]]]]
 
 
 def is_callable_input_parameter_a_task(callable: ExecuteTaskFunction, object_type: Any) -> bool:
@@ -30,6 +31,11 @@ class WorkerImpl(WorkerAbc):
                  poll_interval: float = None,
                  domain: str = None,
                  worker_id: str = None,
+                 thread_count: int = None,
+                 process_count: int = None,
+                 poll_timeout: int = None,
+                 max_poll_interval: float = None,
+                 heartbeat_interval: float = None,
                  ) -> Self:
         
         super().__init__(task_definition_name)
@@ -40,6 +46,24 @@ class WorkerImpl(WorkerAbc):
             self.poll_interval = deepcopy(poll_interval)
         
         self.domain = deepcopy(domain)
+
+        if thread_count == None:
+            self.thread_count = DEFAULT_THREAD_COUNT
+        else:
+            self.thread_count = deepcopy(thread_count)
+
+        if process_count == None:
+            self.process_count = DEFAULT_PROCESS_COUNT
+        else:
+            self.process_count = deepcopy(process_count)
+
+        if poll_timeout == None:
+            self.poll_timeout = DEFAULT_POLL_TIMEOUT
+        else:
+            self.poll_timeout = deepcopy(poll_timeout)
+
+        self.max_poll_interval = deepcopy(max_poll_interval)
+        self.heartbeat_interval = deepcopy(heartbeat_interval)
         
         if worker_id is None:
             self.worker_id = deepcopy(super().get_identity())
@@ -49,24 +73,42 @@ class WorkerImpl(WorkerAbc):
         self.execute_function = deepcopy(execute_function)
 
     def execute(self, task: Task) -> TaskResult:
-        execute_function_input = None
-        if self._is_execute_function_input_parameter_a_task:
-            execute_function_input = task
-        else:
-            execute_function_input = task.input_data
-        
+        if self._is_execute_function_a_coroutine:
+            return asyncio.run(self.execute_async(task))
+
         if self._is_execute_function_return_value_a_task_result:
             execute_function_output = self.execute_function(
-                execute_function_input)
-            if type(execute_function_output) == TaskResult:
-                execute_function_output.task_id = task.task_id
-                execute_function_output.workflow_instance_id = task.workflow_instance_id
-            return execute_function_output
+                self.__get_execute_function_input(task))
+            return self.__set_task_result_ids(task, execute_function_output)
         task_result = self.get_task_result_from_task(task)
         task_result.status = TaskResultStatus.COMPLETED
         task_result.output_data = self.execute_function(task)
         return task_result
 
+    async def execute_async(self, task: Task) -> TaskResult:
+        if not self._is_execute_function_a_coroutine:
+            return await super().execute_async(task)
+
+        if self._is_execute_function_return_value_a_task_result:
+            execute_function_output = await self.execute_function(
+                self.__get_execute_function_input(task))
+            return self.__set_task_result_ids(task, execute_function_output)
+        task_result = self.get_task_result_from_task(task)
+        task_result.status = TaskResultStatus.COMPLETED
+        task_result.output_data = await self.execute_function(task)
+        return task_result
+
+    def __get_execute_function_input(self, task: Task) -> Union[Task, object]:
+        if self._is_execute_function_input_parameter_a_task:
+            return task
+        return task.input_data
+
+    def __set_task_result_ids(self, task: Task, execute_function_output: Union[TaskResult, object]) -> Union[TaskResult, object]:
+        if type(execute_function_output) == TaskResult:
+            execute_function_output.task_id = task.task_id
+            execute_function_output.workflow_instance_id = task.workflow_instance_id
+        return execute_function_output
+
     def get_identity(self) -> str:
         return self.worker_id
 
@@ -77,6 +119,7 @@ class WorkerImpl(WorkerAbc):
     @execute_function.setter
     def execute_function(self, execute_function: ExecuteTaskFunction) -> None:
         self._execute_function = execute_function
+        self._is_execute_function_a_coroutine = inspect.iscoroutinefunction(execute_function)
         self._is_execute_function_input_parameter_a_task = is_callable_input_parameter_a_task(
             callable=execute_function,
             object_type=Task,
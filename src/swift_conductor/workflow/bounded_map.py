@@ -0,0 +1,31 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, Tuple, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def bounded_map(
+    function: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int,
+    thread_name_prefix: str = '',
+) -> Iterator[Tuple[T, R]]:
+    """Calls function on each item on up to max_workers threads.
+
+    Yields each item with its result, in the order of the items. Items are
+    read from the iterable as threads become free, and at most
+    max_workers * 2 calls are pending at a time, so a large iterable is not
+    read up front.
+    """
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix) as executor:
+        for item in items:
+            if len(pending) >= max_workers * 2:
+                item_done, future = pending.popleft()
+                yield item_done, future.result()
+            pending.append((item, executor.submit(function, item)))
+        while pending:
+            item_done, future = pending.popleft()
+            yield item_done, future.result()
@@ -0,0 +1,19 @@
+from swift_conductor.http.models.start_workflow_request import StartWorkflowRequest
+
+
+class StartWorkflowResult:
+    """Outcome of starting one workflow of a bulk start."""
+
+    def __init__(self, request: StartWorkflowRequest, workflow_id: str = None, error: Exception = None):
+        self.request = request
+        self.workflow_id = workflow_id
+        self.error = error
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error == None
+
+    def __repr__(self):
+        if self.succeeded:
+            return f'StartWorkflowResult(name={self.request.name}, workflow_id={self.workflow_id})'
+        return f'StartWorkflowResult(name={self.request.name}, error={self.error!r})'
@@ -2,7 +2,8 @@ from swift_conductor.task.fork_task import ForkTask
 from swift_conductor.task.join_task import JoinTask
 from swift_conductor.task.task import TaskInterface
 from swift_conductor.task.timeout_policy import TimeoutPolicy
-from swift_conductor.http.models import *
+from swift_conductor.http.models.workflow_def import WorkflowDef
+from swift_conductor.http.models.workflow_task import WorkflowTask
 from copy import deepcopy
 from typing import Any, Dict, List, Union
 from typing_extensions import Self
@@ -1,20 +1,52 @@
 from swift_conductor.configuration import Configuration
-from swift_conductor.http.api_client import ApiClient
+from swift_conductor.http.api_client_registry import acquire_api_client, release_api_client
 from swift_conductor.http.api.metadata_resource_api import MetadataResourceApi
 from swift_conductor.http.api.task_resource_api import TaskResourceApi
 from swift_conductor.http.api.workflow_resource_api import WorkflowResourceApi
 from swift_conductor.http.models.correlation_ids_search_request import CorrelationIdsSearchRequest
-from swift_conductor.http.models import *
-from typing import Any, Dict, List
+from swift_conductor.http.models.rerun_workflow_request import RerunWorkflowRequest
+from swift_conductor.http.models.scrollable_search_result_workflow_summary import ScrollableSearchResultWorkflowSummary
+from swift_conductor.http.models.skip_task_request import SkipTaskRequest
+from swift_conductor.http.models.start_workflow_request import StartWorkflowRequest
+from swift_conductor.http.models.task_result import TaskResult
+from swift_conductor.http.models.workflow import Workflow
+from swift_conductor.http.models.workflow_def import WorkflowDef
+from swift_conductor.http.models.workflow_summary import WorkflowSummary
+from swift_conductor.workflow.bounded_map import bounded_map
+from swift_conductor.workflow.rate_limiter import RateLimiter
+from swift_conductor.workflow.start_workflow_result import StartWorkflowResult
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List
 from typing_extensions import Self
+import logging
 import uuid
 
+logger = logging.getLogger(
+    Configuration.get_logging_formatted_name(
+        __name__
+    )
+)
+
 class WorkflowManager:
     def __init__(self, configuration: Configuration) -> Self:
-        api_client = ApiClient(configuration)
-        self.metadata_client = MetadataResourceApi(api_client)
-        self.task_client = TaskResourceApi(api_client)
-        self.workflow_client = WorkflowResourceApi(api_client)
+        self.api_client = acquire_api_client(configuration)
+        self._closed = False
+        self.metadata_client = MetadataResourceApi(self.api_client)
+        self.task_client = TaskResourceApi(self.api_client)
+        self.workflow_client = WorkflowResourceApi(self.api_client)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """Releases the shared ApiClient. Its connections are closed once no client uses it."""
+        if self._closed:
+            return
+        self._closed = True
+        release_api_client(self.api_client)
 
     def register_workflow(self, workflow: WorkflowDef) -> object:
         """Create a new workflow definition"""
@@ -30,8 +62,8 @@ class WorkflowManager:
         )
 
     def start_workflows(self, *start_workflow_request: StartWorkflowRequest) -> List[str]:
-        """Start multiple instances of workflows.  Note, there is no parallelism implemented in starting so giving a
-        very large number can impact the latencies and performance
+        """Start multiple instances of workflows, one after the other. Use bulk_start_workflows to start a large
+        number of workflows concurrently
         """
         workflow_id_list = [''] * len(start_workflow_request)
         for i in range(len(start_workflow_request)):
@@ -40,6 +72,35 @@ class WorkflowManager:
             )
         return workflow_id_list
 
+    def bulk_start_workflows(
+        self,
+        start_workflow_requests: Iterable[StartWorkflowRequest],
+        max_workers: int = 10,
+        rate_limit: float = None,
+    ) -> List[StartWorkflowResult]:
+        """Start workflows concurrently on up to max_workers threads, at most rate_limit per second when given.
+
+        Requests are read from the iterable as threads become free. A failure to start one workflow does not stop
+        the others: results are returned in the order of the requests, holding either the workflow id or the error.
+        """
+        rate_limiter = None
+        if rate_limit is not None:
+            rate_limiter = RateLimiter(rate_limit)
+
+        def start(start_workflow_request: StartWorkflowRequest) -> StartWorkflowResult:
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            try:
+                workflow_id = self.start_workflow(start_workflow_request=start_workflow_request)
+                return StartWorkflowResult(start_workflow_request, workflow_id=workflow_id)
+            except Exception as e:
+                logger.warning(f'Failed to start workflow: {start_workflow_request.name}, reason: {e}')
+                return StartWorkflowResult(start_workflow_request, error=e)
+
+        return [
+            result for _, result in bounded_map(start, start_workflow_requests, max_workers, 'workflow-start')
+        ]
+
     def remove_workflow(self, workflow_id: str, archive_workflow: bool = None) -> None:
         """Removes the workflow permanently from the system"""
         kwargs = {}
@@ -86,6 +147,72 @@ class WorkflowManager:
             kwargs['skip_cache'] = skip_cache
         return self.workflow_client.search(**kwargs)
 
+    def iter_search(
+        self,
+        query: str = None,
+        free_text: str = None,
+        sort: str = None,
+        page_size: int = 100,
+        skip_cache: bool = None,
+        prefetch: bool = True,
+    ) -> Iterator[WorkflowSummary]:
+        """Iterates over all workflows matching the search, one page at a time.
+
+        While a page is consumed, the next one is fetched on a background thread
+        (unless prefetch is False), so at most two pages are held in memory.
+        The query_id returned by the server is sent with the following requests,
+        so that they page through the same result set.
+
+        The server may return fewer results per page than page_size, so the
+        iteration only ends on an empty page, or on a page shorter than the
+        ones before it.
+        """
+        kwargs = {'size': page_size}
+        if sort is not None:
+            kwargs['sort'] = sort
+        if free_text is not None:
+            kwargs['free_text'] = free_text
+        if query is not None:
+            kwargs['query'] = query
+        if skip_cache is not None:
+            kwargs['skip_cache'] = skip_cache
+
+        def search_page(start: int, query_id: str) -> ScrollableSearchResultWorkflowSummary:
+            if query_id is not None:
+                return self.workflow_client.search(start=start, query_id=query_id, **kwargs)
+            return self.workflow_client.search(start=start, **kwargs)
+
+        executor = None
+        if prefetch:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='workflow-search')
+        try:
+            start = 0
+            # Largest page returned so far, the actual page size of the server
+            max_page_length = 0
+            page = search_page(start, None)
+            while True:
+                results = page.results or []
+                start += len(results)
+                query_id = page.query_id
+                has_next_page = len(results) > 0 and len(results) >= max_page_length
+                max_page_length = max(max_page_length, len(results))
+
+                next_page = None
+                if has_next_page and executor is not None:
+                    next_page = executor.submit(search_page, start, query_id)
+
+                yield from results
+
+                if not has_next_page:
+                    return
+                if next_page is not None:
+                    page = next_page.result()
+                else:
+                    page = search_page(start, query_id)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
     def get_by_correlation_ids(
         self,
         workflow_name: str,
@@ -0,0 +1,93 @@
+from swift_conductor.configuration import Configuration
+from swift_conductor.http.api_client import ApiClient
+from payloads import workflow
+import swift_conductor.http.models as http_models
+import argparse
+import datetime
+import re
+import six
+import timeit
+
+
+class LegacyDeserializer:
+    """Deserialization as done before compiled deserializers, for comparison."""
+
+    NATIVE_TYPES_MAPPING = ApiClient.NATIVE_TYPES_MAPPING
+    PRIMITIVE_TYPES = ApiClient.PRIMITIVE_TYPES
+
+    def deserialize(self, data, klass):
+        if data is None:
+            return None
+
+        if type(klass) == str:
+            if klass.startswith('list['):
+                sub_kls = re.match(r'list\[(.*)\]', klass).group(1)
+                return [self.deserialize(sub_data, sub_kls)
+                        for sub_data in data]
+
+            if klass.startswith('dict('):
+                sub_kls = re.match(r'dict\(([^,]*), (.*)\)', klass).group(2)
+                return {k: self.deserialize(v, sub_kls)
+                        for k, v in six.iteritems(data)}
+
+            if klass in self.NATIVE_TYPES_MAPPING:
+                klass = self.NATIVE_TYPES_MAPPING[klass]
+            else:
+                klass = getattr(http_models, klass)
+
+        if klass in self.PRIMITIVE_TYPES:
+            try:
+                return klass(data)
+            except TypeError:
+                return data
+        elif klass in (object, datetime.date, datetime.datetime):
+            return data
+        return self.deserialize_model(data, klass)
+
+    def deserialize_model(self, data, klass):
+        if not klass.swagger_types:
+            return data
+
+        kwargs = {}
+        for attr, attr_type in six.iteritems(klass.swagger_types):
+            if (data is not None and
+                    klass.attribute_map[attr] in data and
+                    isinstance(data, (list, dict))):
+                value = data[klass.attribute_map[attr]]
+                kwargs[attr] = self.deserialize(value, attr_type)
+        return klass(**kwargs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark deserialization of a Workflow with tasks')
+    parser.add_argument('--tasks', type=int, default=500, help='number of tasks in the workflow')
+    parser.add_argument('--repeat', type=int, default=20, help='number of deserializations to time')
+    args = parser.parse_args()
+
+    data = workflow(args.tasks)
+    api_client = ApiClient()
+    legacy = LegacyDeserializer()
+
+    if api_client.deserialize_class(data, 'Workflow') != legacy.deserialize(data, 'Workflow'):
+        raise AssertionError('compiled and legacy deserializers disagree')
+
+    legacy_time = timeit.timeit(lambda: legacy.deserialize(data, 'Workflow'), number=args.repeat)
+    compiled_time = timeit.timeit(lambda: api_client.deserialize_class(data, 'Workflow'), number=args.repeat)
+
+    configuration = Configuration()
+    configuration.lazy_deserialization = True
+    lazy_api_client = ApiClient(configuration)
+    lazy_time = timeit.timeit(
+        lambda: lazy_api_client.deserialize_class(data, 'Workflow').status,
+        number=args.repeat
+    )
+
+    print(f'Workflow with {args.tasks} tasks, {args.repeat} runs')
+    print(f'legacy:   {legacy_time / args.repeat * 1000:8.2f} ms per workflow')
+    print(f'compiled: {compiled_time / args.repeat * 1000:8.2f} ms per workflow')
+    print(f'speedup:  {legacy_time / compiled_time:8.2f}x')
+    print(f'lazy, reading status only: {lazy_time / args.repeat * 1000:8.3f} ms per workflow')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+import argparse
+import os
+import subprocess
+import sys
+
+SRC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'src')
+
+IMPORTS = [
+    ('models package', 'import swift_conductor.http.models'),
+    ('one model', 'from swift_conductor.http.models import Task'),
+    ('workflow builder', 'from swift_conductor.workflow.workflow_builder import WorkflowBuilder'),
+    ('task client', 'from swift_conductor.clients.task_client import TaskClient'),
+    # What importing the models package cost before the models were imported lazily
+    ('all models and APIs', 'from swift_conductor.automation.worker_host import preload_modules; preload_modules()'),
+]
+
+
+def import_time(statement: str) -> float:
+    """Returns the seconds a new interpreter takes to run the import statement."""
+    code = (
+        'import time\n'
+        'start = time.perf_counter()\n'
+        f'{statement}\n'
+        'print(time.perf_counter() - start)'
+    )
+    env = dict(os.environ, PYTHONPATH=SRC_PATH)
+    return float(subprocess.check_output([sys.executable, '-c', code], env=env))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the import time of the SDK')
+    parser.add_argument('--runs', type=int, default=10, help='number of interpreters to time each import in')
+    args = parser.parse_args()
+
+    print(f'best of {args.runs} runs, in a new interpreter each')
+    for name, statement in IMPORTS:
+        best = min(import_time(statement) for _ in range(args.runs))
+        print(f'{name:20} {best * 1e3:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
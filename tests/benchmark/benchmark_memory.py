@@ -0,0 +1,52 @@
+from swift_conductor.configuration import Configuration
+from swift_conductor.http.api_client import ApiClient
+from payloads import task, task_summary, workflow_summary
+import argparse
+import gc
+import json
+import tracemalloc
+
+
+def measure(api_client: ApiClient, data: list, response_type: str) -> int:
+    """Returns the bytes held by the deserialized response."""
+    gc.collect()
+    tracemalloc.start()
+    objects = api_client.deserialize_class(data, response_type)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark memory used by deserialized search results')
+    parser.add_argument('--count', type=int, default=10000, help='number of objects in the response')
+    args = parser.parse_args()
+
+    api_client = ApiClient()
+    configuration = Configuration()
+    configuration.compact_models = True
+    compact_api_client = ApiClient(configuration)
+
+    for response_type, payload in [
+        ('list[WorkflowSummary]', workflow_summary),
+        ('list[TaskSummary]', task_summary),
+        ('list[Task]', task),
+    ]:
+        data = [payload(i) for i in range(args.count)]
+        # Compile the deserializers outside of the measurement
+        api_client.deserialize_class(data[:1], response_type)
+        compact_api_client.deserialize_class(data[:1], response_type)
+
+        json_size = len(json.dumps(data))
+        model_size = measure(api_client, data, response_type)
+        compact_size = measure(compact_api_client, data, response_type)
+
+        print(f'{args.count} x {response_type}')
+        print(f'json:    {json_size / 1024 / 1024:8.2f} MiB')
+        print(f'models:  {model_size / 1024 / 1024:8.2f} MiB')
+        print(f'compact: {compact_size / 1024 / 1024:8.2f} MiB ({compact_size / model_size:.0%} of models)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+from swift_conductor.settings.metrics_settings import MetricsSettings
+from swift_conductor.telemetry.metrics_collector import MetricsCollector
+from swift_conductor.telemetry.model.metric_label import MetricLabel
+import argparse
+import tempfile
+import timeit
+
+
+def labelled(metrics: dict, name: str, task_type: str):
+    labels = {MetricLabel.TASK_TYPE: task_type}
+    return metrics[name].labels(*labels.values())
+
+
+def record_with_label_lookups(metrics_collector: MetricsCollector, task_type: str) -> None:
+    """Records the metrics of one task the way MetricsCollector did before
+    TaskMetrics: building the labels and resolving the labelled metric on
+    every call."""
+    labelled(metrics_collector.counters, 'task_poll', task_type).inc()
+    labelled(metrics_collector.gauges, 'task_poll_time', task_type).set(0.01)
+    labelled(metrics_collector.histograms, 'task_poll_latency_seconds', task_type).observe(0.01)
+    labelled(metrics_collector.gauges, 'task_execute_time', task_type).set(0.2)
+    labelled(metrics_collector.histograms, 'task_execute_latency_seconds', task_type).observe(0.2)
+    labelled(metrics_collector.histograms, 'task_update_latency_seconds', task_type).observe(0.01)
+    labelled(metrics_collector.histograms, 'task_end_to_end_latency_seconds', task_type).observe(0.25)
+
+
+def record_with_task_metrics(metrics_collector: MetricsCollector, task_type: str) -> None:
+    task_metrics = metrics_collector.get_task_metrics(task_type)
+    task_metrics.increment_task_poll()
+    task_metrics.record_task_poll_time(0.01)
+    task_metrics.record_task_execute_time(0.2)
+    task_metrics.record_task_update_time(0.01)
+    task_metrics.record_task_end_to_end_time(0.25)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark recording the metrics of a task')
+    parser.add_argument('--tasks', type=int, default=20000, help='number of tasks to record metrics for')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        metrics_collector = MetricsCollector(MetricsSettings(directory=directory))
+        # Create the metrics outside of the measurement
+        metrics_collector.get_task_metrics('task')
+
+        lookups = timeit.timeit(lambda: record_with_label_lookups(metrics_collector, 'task'), number=args.tasks)
+        bound = timeit.timeit(lambda: record_with_task_metrics(metrics_collector, 'task'), number=args.tasks)
+
+    print(f'{args.tasks} tasks, 7 poll/execute/update values each')
+    print(f'label lookups: {lookups / args.tasks * 1e6:8.2f} us per task')
+    print(f'task metrics:  {bound / args.tasks * 1e6:8.2f} us per task ({lookups / bound:.1f}x faster)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+from swift_conductor.http import json_backend
+from swift_conductor.http.api_client import ApiClient
+from swift_conductor.http.models.start_workflow_request import StartWorkflowRequest
+from swift_conductor.http.models.task_exec_log import TaskExecLog
+from swift_conductor.http.models.task_result import TaskResult
+import argparse
+import json
+import timeit
+
+
+def task_result(output_size: int) -> TaskResult:
+    return TaskResult(
+        workflow_instance_id='b1c9a6a4-7f7a-4a4e-8d7b-6c2b4b1f0a11',
+        task_id='3f1b6a2e-0001-4c55-9d0a-2b3c4d5e6f70',
+        worker_id='benchmark-worker',
+        status='COMPLETED',
+        output_data={
+            'items': [{'id': i, 'name': f'item_{i}', 'tags': ['a', 'b'], 'score': i / 3} for i in range(output_size)],
+        },
+        logs=[TaskExecLog(f'log line {i}', 'task_id', 1700000000 + i) for i in range(10)],
+    )
+
+
+def start_workflow_request(input_size: int) -> StartWorkflowRequest:
+    return StartWorkflowRequest(
+        name='benchmark_workflow',
+        version=1,
+        correlation_id='benchmark',
+        input={f'key_{i}': {'value': i, 'text': f'value {i}'} for i in range(input_size)},
+        task_to_domain={},
+        priority=0,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark serialization of request bodies')
+    parser.add_argument('--size', type=int, default=100, help='number of items in the payload')
+    parser.add_argument('--repeat', type=int, default=2000, help='number of serializations to time')
+    args = parser.parse_args()
+
+    api_client = ApiClient()
+    print(f'JSON backend: {json_backend.name}')
+
+    for name, body in [
+        ('TaskResult', task_result(args.size)),
+        ('StartWorkflowRequest', start_workflow_request(args.size)),
+    ]:
+        legacy_time = timeit.timeit(
+            lambda: json.dumps(api_client.sanitize_for_serialization(body)),
+            number=args.repeat
+        )
+        serialize_time = timeit.timeit(lambda: api_client.serialize(body), number=args.repeat)
+
+        print(f'{name} with {args.size} items, {args.repeat} runs')
+        print(f'legacy:    {legacy_time / args.repeat * 1000000:8.1f} us per body')
+        print(f'serialize: {serialize_time / args.repeat * 1000000:8.1f} us per body')
+        print(f'speedup:   {legacy_time / serialize_time:8.2f}x')
+
+
+if __name__ == '__main__':
+    main()
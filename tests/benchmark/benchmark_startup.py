@@ -0,0 +1,70 @@
+from payloads import task
+from swift_conductor.automation.worker_host import WorkerHost
+from swift_conductor.configuration import Configuration
+from swift_conductor.http.api_client_registry import acquire_api_client
+from swift_conductor.worker.worker_abc import WorkerAbc
+import argparse
+import multiprocessing
+import time
+
+
+class ReadyWorker(WorkerAbc):
+    """Worker that reports, instead of its first poll, how long after the
+    start of the processes it was ready to execute a task."""
+
+    def __init__(self, processes: int, ready):
+        super().__init__('benchmark_startup')
+        self.process_count = processes
+        self.ready = ready
+        self.started_at = None
+        self.reported = False
+
+    def execute(self, task):
+        raise NotImplementedError
+
+    def paused(self) -> bool:
+        if not self.reported:
+            self.reported = True
+            acquire_api_client().deserialize_class([task(0)], 'list[Task]')
+            self.ready.put(time.time() - self.started_at)
+        return True
+
+
+def measure(processes: int, start_method: str, prefork: bool = False) -> list:
+    """Returns the seconds each process started by WorkerHost took to be ready."""
+    ready = multiprocessing.get_context(start_method).Queue()
+    worker = ReadyWorker(processes, ready)
+    worker_host = WorkerHost(
+        workers=[worker],
+        configuration=Configuration(),
+        shutdown_timeout=0.1,
+        start_method=start_method,
+        prefork=prefork,
+    )
+    worker.started_at = time.time()
+    worker_host.start_processes()
+    try:
+        return [ready.get() for _ in range(processes)]
+    finally:
+        worker_host.stop_processes()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the startup time of task runner processes')
+    parser.add_argument('--processes', type=int, default=8, help='number of processes to start')
+    args = parser.parse_args()
+
+    results = [
+        ('spawn', measure(args.processes, 'spawn')),
+        ('fork', measure(args.processes, 'fork')),
+        # Last, as the modules it preloads stay imported in this process
+        ('prefork', measure(args.processes, 'fork', prefork=True)),
+    ]
+
+    print(f'{args.processes} processes, seconds until ready')
+    for name, times in results:
+        print(f'{name:8} mean: {sum(times) / len(times):6.3f}  last: {max(times):6.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+def workflow_task(index: int) -> dict:
+    return {
+        'name': f'task_{index}',
+        'taskReferenceName': f'task_{index}_ref',
+        'type': 'SIMPLE',
+        'inputParameters': {'value': '${workflow.input.value}', 'index': index},
+        'startDelay': 0,
+        'optional': False,
+        'asyncComplete': False,
+        'joinOn': [],
+        'defaultExclusiveJoinTask': [],
+        'decisionCases': {},
+        'defaultCase': [],
+        'forkTasks': [],
+        'loopOver': [],
+        'taskDefinition': task_def(index),
+    }
+
+
+def task_def(index: int) -> dict:
+    return {
+        'name': f'task_{index}',
+        'description': f'Task number {index}',
+        'retryCount': 3,
+        'timeoutSeconds': 3600,
+        'inputKeys': ['value', 'index'],
+        'outputKeys': ['result'],
+        'timeoutPolicy': 'TIME_OUT_WF',
+        'retryLogic': 'FIXED',
+        'retryDelaySeconds': 60,
+        'responseTimeoutSeconds': 600,
+        'inputTemplate': {},
+        'rateLimitPerFrequency': 0,
+        'rateLimitFrequencyInSeconds': 1,
+        'ownerEmail': 'owner@example.com',
+        'pollTimeoutSeconds': 3600,
+        'backoffScaleFactor': 1,
+    }
+
+
+def task(index: int) -> dict:
+    return {
+        'taskType': 'SIMPLE',
+        'status': 'COMPLETED',
+        'inputData': {'value': 'input', 'index': index},
+        'referenceTaskName': f'task_{index}_ref',
+        'retryCount': 0,
+        'seq': index,
+        'pollCount': 1,
+        'taskDefName': f'task_{index}',
+        'scheduledTime': 1700000000000 + index,
+        'startTime': 1700000000100 + index,
+        'endTime': 1700000000200 + index,
+        'updateTime': 1700000000200 + index,
+        'startDelayInSeconds': 0,
+        'retried': False,
+        'executed': True,
+        'callbackFromWorker': True,
+        'responseTimeoutSeconds': 600,
+        'workflowInstanceId': 'b1c9a6a4-7f7a-4a4e-8d7b-6c2b4b1f0a11',
+        'workflowType': 'benchmark_workflow',
+        'taskId': f'3f1b6a2e-{index:04d}-4c55-9d0a-2b3c4d5e6f70',
+        'callbackAfterSeconds': 0,
+        'workerId': 'benchmark-worker',
+        'outputData': {'result': index * 2, 'values': list(range(10))},
+        'workflowTask': workflow_task(index),
+        'rateLimitPerFrequency': 0,
+        'rateLimitFrequencyInSeconds': 1,
+        'workflowPriority': 0,
+        'iteration': 0,
+        'subworkflowChanged': False,
+        'taskDefinition': task_def(index),
+        'loopOverTask': False,
+        'queueWaitTime': 100,
+    }
+
+
+def workflow(task_count: int) -> dict:
+    return {
+        'workflowId': 'b1c9a6a4-7f7a-4a4e-8d7b-6c2b4b1f0a11',
+        'workflowName': 'benchmark_workflow',
+        'workflowVersion': 1,
+        'status': 'COMPLETED',
+        'createTime': 1700000000000,
+        'updateTime': 1700000100000,
+        'startTime': 1700000000000,
+        'endTime': 1700000100000,
+        'correlationId': 'benchmark',
+        'input': {'value': 'input'},
+        'output': {'result': task_count},
+        'taskToDomain': {},
+        'failedReferenceTaskNames': [],
+        'priority': 0,
+        'variables': {},
+        'lastRetriedTime': 0,
+        'tasks': [task(i) for i in range(task_count)],
+        'workflowDefinition': {
+            'name': 'benchmark_workflow',
+            'version': 1,
+            'tasks': [workflow_task(i) for i in range(task_count)],
+            'inputParameters': ['value'],
+            'outputParameters': {'result': '${workflow.output.result}'},
+            'schemaVersion': 2,
+            'restartable': True,
+            'workflowStatusListenerEnabled': False,
+            'ownerEmail': 'owner@example.com',
+            'timeoutPolicy': 'ALERT_ONLY',
+            'timeoutSeconds': 0,
+            'variables': {},
+            'inputTemplate': {},
+        },
+    }
+
+
+def workflow_summary(index: int) -> dict:
+    return {
+        'workflowType': 'benchmark_workflow',
+        'version': 1,
+        'workflowId': f'b1c9a6a4-{index:04d}-4a4e-8d7b-6c2b4b1f0a11',
+        'correlationId': 'benchmark',
+        'startTime': '2023-11-14T22:13:20.000Z',
+        'updateTime': '2023-11-14T22:15:00.000Z',
+        'endTime': '2023-11-14T22:15:00.000Z',
+        'status': 'COMPLETED',
+        'input': '{value=input}',
+        'output': f'{{result={index}}}',
+        'executionTime': 100000,
+        'failedReferenceTaskNames': '',
+        'priority': 0,
+        'outputSize': 16,
+        'inputSize': 13,
+    }
+
+
+def task_summary(index: int) -> dict:
+    return {
+        'workflowId': 'b1c9a6a4-7f7a-4a4e-8d7b-6c2b4b1f0a11',
+        'workflowType': 'benchmark_workflow',
+        'correlationId': 'benchmark',
+        'scheduledTime': '2023-11-14T22:13:20.000Z',
+        'startTime': '2023-11-14T22:13:20.100Z',
+        'updateTime': '2023-11-14T22:13:20.200Z',
+        'endTime': '2023-11-14T22:13:20.200Z',
+        'status': 'COMPLETED',
+        'executionTime': 100,
+        'queueWaitTime': 100,
+        'taskDefName': f'task_{index}',
+        'taskType': 'SIMPLE',
+        'input': '{value=input}',
+        'output': f'{{result={index}}}',
+        'taskId': f'3f1b6a2e-{index:04d}-4c55-9d0a-2b3c4d5e6f70',
+        'workflowPriority': 0,
+    }
@@ -0,0 +1,131 @@
+from swift_conductor.automation.async_worker_host import AsyncWorkerHost, AsyncWorkerRunner
+from swift_conductor.configuration import Configuration
+from swift_conductor.http.api.async_task_resource_api import AsyncTaskResourceApi
+from swift_conductor.http.async_api_client import AsyncApiClient
+from swift_conductor.http.api_client import ApiClient
+from swift_conductor.http.models.task import Task
+from swift_conductor.http.models.task_result import TaskResult
+from swift_conductor.http.models.task_result_status import TaskResultStatus
+from swift_conductor.http.rest import ApiException
+from swift_conductor.settings.task_update_settings import TaskUpdateSettings
+from swift_conductor.worker.worker_impl import WorkerImpl
+from unittest.mock import AsyncMock, Mock, patch
+import asyncio
+import logging
+import unittest
+
+TASK_ID = 'VALID_TASK_ID'
+WORKFLOW_INSTANCE_ID = 'VALID_WORKFLOW_INSTANCE_ID'
+WORKER_ID = 'VALID_WORKER_ID'
+
+
+async def async_execute(task: Task) -> TaskResult:
+    await asyncio.sleep(0)
+    task_result = TaskResult(worker_id=WORKER_ID, status=TaskResultStatus.COMPLETED)
+    task_result.add_output_data('worker_style', 'coroutine')
+    return task_result
+
+
+class TestAsyncWorkerHost(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_initialization_with_invalid_workers(self):
+        with self.assertRaises(Exception):
+            AsyncWorkerHost(workers=[object()])
+
+    def test_worker_impl_executes_coroutine_synchronously(self):
+        task_result = self.__get_worker().execute(self.__get_task())
+        self.assertEqual(task_result, self.__get_expected_task_result())
+
+    def test_run_once(self):
+        task_client = AsyncTaskResourceApi(AsyncApiClient())
+        with patch.object(AsyncTaskResourceApi, 'poll', AsyncMock(return_value=self.__get_task())):
+            with patch.object(AsyncTaskResourceApi, 'update_task', AsyncMock(return_value='OK')) as mock_update_task:
+                runner = AsyncWorkerRunner(self.__get_worker(), task_client)
+                asyncio.run(self.__run_once_and_wait(runner))
+                mock_update_task.assert_awaited_once_with(body=self.__get_expected_task_result())
+
+    def test_run_once_with_batch_poll_not_supported(self):
+        task_client = AsyncTaskResourceApi(AsyncApiClient())
+        worker = self.__get_worker(thread_count=4)
+        with patch.object(AsyncTaskResourceApi, 'batch_poll', AsyncMock(side_effect=ApiException(status=405))) as mock_batch_poll:
+            with patch.object(AsyncTaskResourceApi, 'poll', AsyncMock(return_value=self.__get_task())) as mock_poll:
+                with patch.object(AsyncTaskResourceApi, 'update_task', AsyncMock(return_value='OK')):
+                    runner = AsyncWorkerRunner(worker, task_client)
+                    asyncio.run(self.__run_once_and_wait(runner))
+                    asyncio.run(self.__run_once_and_wait(runner))
+                    mock_batch_poll.assert_awaited_once()
+                    self.assertEqual(mock_poll.await_count, 2)
+
+    def test_failed_update_retried_without_holding_slot(self):
+        task_client = AsyncTaskResourceApi(AsyncApiClient())
+        task_update_settings = TaskUpdateSettings(retry_backoff=0.01)
+
+        async def run_once_and_retry(runner):
+            await self.__run_once_and_wait(runner)
+            self.assertEqual(len(runner._running_tasks), 0)
+            self.assertEqual(len(runner._retrying_updates), 1)
+            await asyncio.gather(*runner._retrying_updates)
+
+        with patch.object(AsyncTaskResourceApi, 'poll', AsyncMock(return_value=self.__get_task())):
+            with patch.object(AsyncTaskResourceApi, 'update_task', AsyncMock(side_effect=[Exception(), 'OK'])) as mock_update_task:
+                runner = AsyncWorkerRunner(self.__get_worker(), task_client, task_update_settings=task_update_settings)
+                asyncio.run(run_once_and_retry(runner))
+                self.assertEqual(mock_update_task.await_count, 2)
+                mock_update_task.assert_awaited_with(body=self.__get_expected_task_result())
+
+    def test_connection_pool_sized_from_thread_count(self):
+        configuration = Configuration()
+        worker_host = AsyncWorkerHost([self.__get_worker(thread_count=100), self.__get_worker(thread_count=4)], configuration)
+        with patch.object(AsyncWorkerRunner, 'run', AsyncMock(return_value=None)):
+            worker_host.run()
+        self.assertEqual(configuration.pool_maxsize, 106)
+
+    def test_run_once_with_all_slots_busy(self):
+        task_client = AsyncTaskResourceApi(AsyncApiClient())
+        metrics_collector = Mock()
+        runner = AsyncWorkerRunner(self.__get_worker(), task_client, metrics_collector)
+        runner._running_tasks.add(Mock())
+        with patch.object(AsyncTaskResourceApi, 'poll', AsyncMock()) as mock_poll:
+            asyncio.run(runner.run_once())
+            mock_poll.assert_not_awaited()
+            metrics_collector.increment_task_execution_queue_full.assert_called_once_with('task')
+
+    def test_api_client_falls_back_to_sync_transport(self):
+        with patch('swift_conductor.http.async_api_client.aiohttp', None):
+            with patch.object(ApiClient, 'call_api', return_value=self.__get_task()) as mock_call_api:
+                task_client = AsyncTaskResourceApi(AsyncApiClient())
+                task = asyncio.run(task_client.poll('task', workerid=WORKER_ID))
+                self.assertEqual(task, self.__get_task())
+                mock_call_api.assert_called_once()
+
+    async def __run_once_and_wait(self, runner):
+        await runner.run_once()
+        await asyncio.gather(*runner._running_tasks)
+
+    def __get_worker(self, thread_count=None):
+        return WorkerImpl(
+            task_definition_name='task',
+            execute_function=async_execute,
+            poll_interval=1,
+            thread_count=thread_count,
+        )
+
+    def __get_task(self):
+        return Task(
+            task_id=TASK_ID,
+            workflow_instance_id=WORKFLOW_INSTANCE_ID
+        )
+
+    def __get_expected_task_result(self):
+        return TaskResult(
+            task_id=TASK_ID,
+            workflow_instance_id=WORKFLOW_INSTANCE_ID,
+            worker_id=WORKER_ID,
+            status=TaskResultStatus.COMPLETED,
+            output_data={'worker_style': 'coroutine'}
+        )
@@ -0,0 +1,37 @@
+from swift_conductor.automation.polling_interval import AdaptivePollingInterval
+import unittest
+
+
+class TestAdaptivePollingInterval(unittest.TestCase):
+    def test_initial_interval(self):
+        polling_interval = AdaptivePollingInterval(0.1, 1.0)
+        self.assertEqual(polling_interval.current, 0.1)
+
+    def test_poll_right_away_while_tasks_arrive(self):
+        polling_interval = AdaptivePollingInterval(0.1, 1.0)
+        self.assertEqual(polling_interval.on_tasks_received(), 0.0)
+        self.assertEqual(polling_interval.current, 0.0)
+
+    def test_back_off_on_empty_polls_up_to_max_interval(self):
+        polling_interval = AdaptivePollingInterval(0.1, 1.0, jitter=0.0)
+        intervals = [polling_interval.on_empty_poll() for _ in range(6)]
+        self.assertEqual(intervals, [0.1, 0.2, 0.4, 0.8, 1.0, 1.0])
+
+    def test_back_off_restarts_after_tasks_arrive(self):
+        polling_interval = AdaptivePollingInterval(0.1, 1.0, jitter=0.0)
+        polling_interval.on_empty_poll()
+        polling_interval.on_empty_poll()
+        polling_interval.on_tasks_received()
+        self.assertEqual(polling_interval.on_empty_poll(), 0.1)
+
+    def test_jitter_stays_within_bounds(self):
+        polling_interval = AdaptivePollingInterval(0.1, 1.0, jitter=0.5)
+        for _ in range(100):
+            interval = polling_interval.on_empty_poll()
+            self.assertGreaterEqual(interval, 0.0)
+            self.assertLessEqual(interval, 1.0)
+
+    def test_wait_polling_interval_when_busy(self):
+        polling_interval = AdaptivePollingInterval(0.1, 1.0)
+        polling_interval.on_tasks_received()
+        self.assertEqual(polling_interval.on_busy(), 0.1)
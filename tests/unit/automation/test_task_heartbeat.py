@@ -0,0 +1,94 @@
+from swift_conductor.automation.task_heartbeat import TaskHeartbeat
+from swift_conductor.configuration import Configuration
+from swift_conductor.http.api.task_resource_api import TaskResourceApi
+from swift_conductor.http.api_client import ApiClient
+from swift_conductor.http.models.task import Task
+from swift_conductor.http.models.task_result_status import TaskResultStatus
+from unittest.mock import Mock, patch
+import logging
+import threading
+import time
+import unittest
+
+TASK_DEFINITION_NAME = 'task'
+WORKER_ID = 'worker'
+
+
+class TestTaskHeartbeat(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.task_client = TaskResourceApi(ApiClient(Configuration()))
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_send_heartbeats_while_task_executes(self):
+        heartbeats = []
+        sent = threading.Event()
+
+        def update_task(body):
+            heartbeats.append(body)
+            if len(heartbeats) == 2:
+                sent.set()
+
+        with patch.object(TaskResourceApi, 'update_task', side_effect=update_task):
+            task_heartbeat = TaskHeartbeat(self.task_client, 0.05)
+            task_heartbeat.start()
+            try:
+                task_heartbeat.add(self.__get_task('1'), TASK_DEFINITION_NAME, WORKER_ID)
+                self.assertTrue(sent.wait(5))
+            finally:
+                task_heartbeat.stop(5)
+
+        heartbeat = heartbeats[0]
+        self.assertEqual(heartbeat.task_id, '1')
+        self.assertEqual(heartbeat.workflow_instance_id, 'workflow-1')
+        self.assertEqual(heartbeat.worker_id, WORKER_ID)
+        self.assertEqual(heartbeat.status, TaskResultStatus.IN_PROGRESS)
+        self.assertEqual(heartbeat.callback_after_seconds, 1)
+
+    def test_callback_after_missed_heartbeats(self):
+        task_heartbeat = TaskHeartbeat(self.task_client, 30)
+        self.assertEqual(task_heartbeat.callback_after_seconds, 60)
+
+    def test_no_heartbeats_after_remove(self):
+        with patch.object(TaskResourceApi, 'update_task') as mock_update_task:
+            task_heartbeat = TaskHeartbeat(self.task_client, 0.05)
+            task_heartbeat.start()
+            try:
+                task_heartbeat.add(self.__get_task('1'), TASK_DEFINITION_NAME, WORKER_ID)
+                task_heartbeat.remove('1')
+                time.sleep(0.2)
+            finally:
+                task_heartbeat.stop(5)
+            mock_update_task.assert_not_called()
+
+    def test_failed_heartbeat_is_sent_again(self):
+        metrics_collector = Mock()
+        sent = threading.Event()
+        failures = [Exception('failed heartbeat')]
+
+        def update_task(body):
+            if failures:
+                raise failures.pop()
+            sent.set()
+
+        with patch.object(TaskResourceApi, 'update_task', side_effect=update_task):
+            task_heartbeat = TaskHeartbeat(self.task_client, 0.05, metrics_collector)
+            task_heartbeat.start()
+            try:
+                task_heartbeat.add(self.__get_task('1'), TASK_DEFINITION_NAME, WORKER_ID)
+                self.assertTrue(sent.wait(5))
+            finally:
+                task_heartbeat.stop(5)
+        metrics_collector.increment_task_heartbeat_error.assert_called_once_with(TASK_DEFINITION_NAME, Exception)
+
+    def test_stop(self):
+        task_heartbeat = TaskHeartbeat(self.task_client, 0.05)
+        task_heartbeat.start()
+        task_heartbeat.add(self.__get_task('1'), TASK_DEFINITION_NAME, WORKER_ID)
+        task_heartbeat.stop(5)
+        self.assertFalse(task_heartbeat._thread.is_alive())
+
+    def __get_task(self, task_id: str) -> Task:
+        return Task(task_id=task_id, workflow_instance_id='workflow-' + task_id)
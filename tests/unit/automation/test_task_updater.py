@@ -0,0 +1,191 @@
+from swift_conductor.automation.task_updater import TaskUpdater
+from swift_conductor.configuration import Configuration
+from swift_conductor.http.api.task_resource_api import TaskResourceApi
+from swift_conductor.http.api_client import ApiClient
+from swift_conductor.http.models.task_result import TaskResult
+from swift_conductor.http.models.task_result_status import TaskResultStatus
+from swift_conductor.settings.task_update_settings import TaskUpdateSettings
+from unittest.mock import ANY, Mock, call, patch
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+TASK_DEFINITION_NAME = 'task'
+UPDATE_TASK_RESPONSE = 'VALID_UPDATE_TASK_RESPONSE'
+
+
+class TestTaskUpdater(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.task_client = TaskResourceApi(ApiClient(Configuration()))
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_submit(self):
+        with patch.object(TaskResourceApi, 'update_task', return_value=UPDATE_TASK_RESPONSE) as mock_update_task:
+            task_updater = self.__get_task_updater()
+            task_updater.submit(self.__get_task_result('1'), TASK_DEFINITION_NAME)
+            self.assertTrue(task_updater.flush(timeout=5))
+            mock_update_task.assert_called_once_with(body=self.__get_task_result('1'))
+
+    def test_submit_records_latency(self):
+        metrics_collector = Mock()
+        with patch.object(TaskResourceApi, 'update_task', return_value=UPDATE_TASK_RESPONSE):
+            task_updater = self.__get_task_updater(metrics_collector=metrics_collector)
+            task_updater.submit(self.__get_task_result('1'), TASK_DEFINITION_NAME, started_at=time.time())
+            self.assertTrue(task_updater.flush(timeout=5))
+        metrics_collector.record_task_update_time.assert_called_once_with(TASK_DEFINITION_NAME, ANY)
+        metrics_collector.record_task_end_to_end_time.assert_called_once_with(TASK_DEFINITION_NAME, ANY)
+
+    def test_retry_failed_update(self):
+        with patch.object(TaskResourceApi, 'update_task', side_effect=[Exception(), UPDATE_TASK_RESPONSE]) as mock_update_task:
+            task_updater = self.__get_task_updater()
+            task_updater.submit(self.__get_task_result('1'), TASK_DEFINITION_NAME)
+            self.assertTrue(task_updater.flush(timeout=5))
+            self.assertEqual(mock_update_task.call_count, 2)
+
+    def test_retry_reuses_measured_payload(self):
+        metrics_collector = Mock()
+        metrics_collector.measure_task_result_payload.return_value = b'{}'
+        with patch.object(TaskResourceApi, 'update_task', side_effect=[Exception(), UPDATE_TASK_RESPONSE]) as mock_update_task:
+            task_updater = self.__get_task_updater(metrics_collector=metrics_collector)
+            task_updater.submit(self.__get_task_result('1'), TASK_DEFINITION_NAME)
+            self.assertTrue(task_updater.flush(timeout=5))
+        metrics_collector.measure_task_result_payload.assert_called_once()
+        self.assertEqual(mock_update_task.call_args_list[1], call(body=b'{}'))
+
+    def test_retry_does_not_block_other_updates(self):
+        updated = threading.Event()
+
+        def update_task(body):
+            if body.task_id == '1':
+                raise Exception('failed update')
+            updated.set()
+            return UPDATE_TASK_RESPONSE
+
+        with patch.object(TaskResourceApi, 'update_task', side_effect=update_task):
+            task_updater = self.__get_task_updater(retry_backoff=10.0)
+            task_updater.submit(self.__get_task_result('1'), TASK_DEFINITION_NAME)
+            task_updater.submit(self.__get_task_result('2'), TASK_DEFINITION_NAME)
+            self.assertTrue(updated.wait(timeout=5))
+            self.assertFalse(task_updater.flush(timeout=0.1))
+
+    def test_send_updates_in_parallel(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def update_task(body):
+            # Only returns once both updates are in flight
+            barrier.wait()
+            return UPDATE_TASK_RESPONSE
+
+        with patch.object(TaskResourceApi, 'update_task', side_effect=update_task):
+            task_updater = self.__get_task_updater(thread_count=2)
+            task_updater.submit(self.__get_task_result('1'), TASK_DEFINITION_NAME)
+            task_updater.submit(self.__get_task_result('2'), TASK_DEFINITION_NAME)
+            self.assertTrue(task_updater.flush(timeout=5))
+            self.assertFalse(barrier.broken)
+
+    def test_update_once(self):
+        with patch.object(TaskResourceApi, 'update_task', side_effect=Exception()) as mock_update_task:
+            task_updater = TaskUpdater(self.task_client)
+            self.assertIsNone(task_updater.update(self.__get_task_result('1'), TASK_DEFINITION_NAME))
+            mock_update_task.assert_called_once()
+
+    def test_spill_and_replay_failed_update(self):
+        with tempfile.TemporaryDirectory() as spill_directory:
+            with patch.object(TaskResourceApi, 'update_task', side_effect=Exception()) as mock_update_task:
+                task_updater = self.__get_task_updater(spill_directory=spill_directory)
+                task_updater.submit(self.__get_task_result('1'), TASK_DEFINITION_NAME)
+                self.assertTrue(task_updater.flush(timeout=5))
+                self.assertEqual(mock_update_task.call_count, 3)
+                self.assertEqual(len(os.listdir(spill_directory)), 1)
+
+            with patch.object(TaskResourceApi, 'update_task', return_value=UPDATE_TASK_RESPONSE) as mock_update_task:
+                task_updater = self.__get_task_updater(spill_directory=spill_directory)
+                self.assertTrue(task_updater.flush(timeout=5))
+                mock_update_task.assert_called_once_with(body=self.__get_task_result('1'))
+                self.assertEqual(os.listdir(spill_directory), [])
+
+    def test_replay_skips_invalid_lines(self):
+        with tempfile.TemporaryDirectory() as spill_directory:
+            lines = [
+                self.__get_spilled_line('1'),
+                # As written by a process killed in the middle of the write
+                self.__get_spilled_line('2')[:20],
+                self.__get_spilled_line('3'),
+            ]
+            with open(os.path.join(spill_directory, 'task_results_1.jsonl'), 'w') as f:
+                f.write('\n'.join(lines) + '\n')
+
+            with patch.object(TaskResourceApi, 'update_task', return_value=UPDATE_TASK_RESPONSE) as mock_update_task:
+                task_updater = self.__get_task_updater(spill_directory=spill_directory)
+                self.assertTrue(task_updater.flush(timeout=5))
+                self.assertEqual(
+                    sorted(c.kwargs['body'].task_id for c in mock_update_task.call_args_list),
+                    ['1', '3']
+                )
+                self.assertEqual(os.listdir(spill_directory), [])
+
+    def test_replay_leaves_files_being_written(self):
+        with tempfile.TemporaryDirectory() as spill_directory:
+            with open(os.path.join(spill_directory, 'task_results_1_a.jsonl.tmp'), 'w') as f:
+                f.write(self.__get_spilled_line('1') + '\n')
+
+            with patch.object(TaskResourceApi, 'update_task', return_value=UPDATE_TASK_RESPONSE) as mock_update_task:
+                task_updater = self.__get_task_updater(spill_directory=spill_directory)
+                self.assertTrue(task_updater.flush(timeout=5))
+                mock_update_task.assert_not_called()
+                self.assertEqual(os.listdir(spill_directory), ['task_results_1_a.jsonl.tmp'])
+
+    def test_replay_restores_unreadable_file(self):
+        with tempfile.TemporaryDirectory() as spill_directory:
+            # Claimed like a file, but fails to be read
+            os.mkdir(os.path.join(spill_directory, 'task_results_1.jsonl'))
+            task_updater = self.__get_task_updater(spill_directory=spill_directory)
+            self.assertTrue(task_updater.flush(timeout=5))
+            self.assertEqual(os.listdir(spill_directory), ['task_results_1.jsonl'])
+
+    def test_stop_spills_unsent_updates(self):
+        with tempfile.TemporaryDirectory() as spill_directory:
+            with patch.object(TaskResourceApi, 'update_task', side_effect=Exception()):
+                task_updater = self.__get_task_updater(retry_backoff=10.0, spill_directory=spill_directory)
+                task_updater.submit(self.__get_task_result('1'), TASK_DEFINITION_NAME)
+                self.assertEqual(task_updater.stop(timeout=0.1), [TASK_DEFINITION_NAME])
+                self.assertTrue(task_updater.flush(timeout=0))
+                self.assertEqual(len(os.listdir(spill_directory)), 1)
+
+    def test_stop_after_updates_sent(self):
+        with patch.object(TaskResourceApi, 'update_task', return_value=UPDATE_TASK_RESPONSE):
+            task_updater = self.__get_task_updater()
+            task_updater.submit(self.__get_task_result('1'), TASK_DEFINITION_NAME)
+            self.assertEqual(task_updater.stop(timeout=5), [])
+
+    def __get_task_updater(self, retry_backoff=0.01, spill_directory=None, metrics_collector=None, thread_count=1):
+        settings = TaskUpdateSettings(
+            max_retries=2,
+            retry_backoff=retry_backoff,
+            spill_directory=spill_directory,
+        )
+        task_updater = TaskUpdater(self.task_client, settings, metrics_collector=metrics_collector, thread_count=thread_count)
+        task_updater.start()
+        return task_updater
+
+    def __get_spilled_line(self, task_id):
+        return json.dumps({
+            'taskDefinitionName': TASK_DEFINITION_NAME,
+            'taskResult': self.task_client.api_client.sanitize_for_serialization(self.__get_task_result(task_id)),
+        })
+
+    def __get_task_result(self, task_id):
+        return TaskResult(
+            task_id=task_id,
+            workflow_instance_id='VALID_WORKFLOW_INSTANCE_ID',
+            worker_id='VALID_WORKER_ID',
+            status=TaskResultStatus.COMPLETED,
+            output_data={'secret_number': 1234},
+        )
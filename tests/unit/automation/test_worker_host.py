@@ -5,7 +5,12 @@ from tests.unit.resources.workers import ClassWorker
 from unittest.mock import Mock
 from unittest.mock import patch
 from configparser import ConfigParser
+import gc
 import multiprocessing
+import signal
+import sys
+import threading
+import time
 import unittest
 import tempfile
 
@@ -42,6 +47,137 @@ class TestWorkerHost(unittest.TestCase):
                         isinstance(process, multiprocessing.Process)
                     )
 
+    def test_create_processes_per_process_count(self):
+        worker = ClassWorker('task')
+        worker.process_count = 3
+        worker_host = WorkerHost(
+            configuration=Configuration(),
+            workers=[worker, ClassWorker('task2')]
+        )
+        self.assertEqual(len(worker_host.task_runner_processes), 4)
+
+    def test_stop_processes_gracefully(self):
+        worker = ClassWorker('task')
+        worker.poll_interval = 10
+        with patch.object(WorkerProcess, 'run_once', Mock(return_value=None)):
+            worker_host = WorkerHost(
+                configuration=Configuration(),
+                workers=[worker],
+                shutdown_timeout=1.0
+            )
+            worker_host.start_processes()
+            time.sleep(0.5)
+            worker_host.stop_processes()
+        for process in worker_host.task_runner_processes:
+            self.assertEqual(process.exitcode, 0)
+
+    @patch('swift_conductor.automation.worker_host.SUPERVISOR_INTERVAL', 0.01)
+    @patch('swift_conductor.automation.worker_host.SHUTDOWN_GRACE_PERIOD', 0.1)
+    def test_join_processes_kills_processes_after_shutdown_timeout(self):
+        if threading.current_thread() is not threading.main_thread():
+            self.skipTest('signal handlers are only set on the main thread')
+        running = multiprocessing.Event()
+        # Blocks the main thread of the process, as a long single-threaded execution does
+        with patch.object(WorkerProcess, 'run_once', Mock(side_effect=lambda: running.set() or time.sleep(60))):
+            worker_host = WorkerHost(
+                configuration=Configuration(),
+                workers=[ClassWorker('task')],
+                shutdown_timeout=0.1,
+            )
+            worker_host.start_processes()
+            self.assertTrue(running.wait(5))
+            # Calls the handler set by start_processes, as SIGTERM would,
+            # without signalling the test process
+            signal.getsignal(signal.SIGTERM)(signal.SIGTERM, None)
+            start_time = time.monotonic()
+            worker_host.join_processes()
+        self.assertLess(time.monotonic() - start_time, 5)
+        self.assertEqual(worker_host.task_runner_processes[0].exitcode, -signal.SIGKILL)
+
+    @patch('swift_conductor.automation.worker_host.SUPERVISOR_INTERVAL', 0.01)
+    def test_restart_exited_processes(self):
+        with patch.object(WorkerProcess, 'run', PickableMock(return_value=None)):
+            worker_host = WorkerHost(
+                configuration=Configuration(),
+                workers=[ClassWorker('task')],
+                restart_backoff=0.05,
+                max_restart_backoff=0.1,
+            )
+            worker_host.metrics_collector = Mock()
+            first_process = worker_host.task_runner_processes[0]
+            worker_host.start_processes()
+            try:
+                deadline = time.monotonic() + 5
+                while worker_host.metrics_collector.increment_worker_restart.call_count < 2 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+            finally:
+                worker_host.stop_processes()
+        self.assertGreaterEqual(worker_host.metrics_collector.increment_worker_restart.call_count, 2)
+        worker_host.metrics_collector.increment_worker_restart.assert_called_with('task')
+        worker_host.metrics_collector.mark_process_dead.assert_any_call(first_process.pid)
+        # Also once stopped
+        worker_host.metrics_collector.mark_process_dead.assert_any_call(worker_host.task_runner_processes[0].pid)
+        self.assertIsNot(worker_host.task_runner_processes[0], first_process)
+
+    def test_start_processes_with_spawn(self):
+        worker_host = WorkerHost(
+            configuration=Configuration(),
+            workers=[ClassWorker('task')],
+            shutdown_timeout=0.1,
+            start_method='spawn',
+        )
+        worker_host.start_processes()
+        try:
+            process = worker_host.task_runner_processes[0]
+            self.assertTrue(process.is_alive())
+        finally:
+            worker_host.stop_processes()
+        self.assertIsNotNone(process.exitcode)
+
+    def test_start_processes_with_prefork(self):
+        gc_states = multiprocessing.Queue()
+        with patch.object(WorkerProcess, 'run_once', Mock(side_effect=lambda: gc_states.put((gc.isenabled(), gc.get_freeze_count() > 0)))):
+            worker_host = WorkerHost(
+                configuration=Configuration(),
+                workers=[ClassWorker('task')],
+                shutdown_timeout=0.1,
+                prefork=True,
+            )
+            worker_host.start_processes()
+            try:
+                self.assertIn('swift_conductor.http.models.workflow_def', sys.modules)
+                self.assertTrue(gc.isenabled())
+                self.assertEqual(gc.get_freeze_count(), 0)
+                # The forked process collects garbage, but not the objects frozen before the fork
+                self.assertEqual(gc_states.get(timeout=5), (True, True))
+            finally:
+                worker_host.stop_processes()
+                gc.enable()
+                gc.unfreeze()
+        self.assertEqual(worker_host.task_runner_processes[0].exitcode, 0)
+
+    def test_prefork_with_other_start_method(self):
+        with self.assertRaises(ValueError):
+            WorkerHost(
+                configuration=Configuration(),
+                workers=[ClassWorker('task')],
+                start_method='spawn',
+                prefork=True,
+            )
+
+    @patch('swift_conductor.automation.worker_host.preload_modules', Mock(side_effect=ImportError()))
+    def test_gc_enabled_after_failed_prefork(self):
+        worker_host = WorkerHost(
+            configuration=Configuration(),
+            workers=[ClassWorker('task')],
+            prefork=True,
+        )
+        self.assertTrue(gc.isenabled())
+        with self.assertRaises(ImportError):
+            worker_host.start_processes()
+        self.assertTrue(gc.isenabled())
+        self.assertEqual(gc.get_freeze_count(), 0)
+
     @patch("multiprocessing.Process.kill", Mock(return_value=None))
     def test_initialize_with_no_worker_config(self):
         with _get_valid_worker_host() as worker_host:
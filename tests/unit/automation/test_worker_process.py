@@ -1,16 +1,21 @@
 from swift_conductor.automation.worker_process import WorkerProcess
 from swift_conductor.configuration import Configuration
 from swift_conductor.http.api.task_resource_api import TaskResourceApi
+from swift_conductor.http.models.compact import CompactTask, CompactTaskResult
 from swift_conductor.http.models.task import Task
 from swift_conductor.http.models.task_result import TaskResult
 from swift_conductor.http.models.task_result_status import TaskResultStatus
+from swift_conductor.http.rest import ApiException
 from tests.unit.resources.workers import ClassWorker
 from tests.unit.resources.workers import FaultyExecutionWorker
 from swift_conductor.worker.worker_abc import DEFAULT_POLLING_INTERVAL
 from configparser import ConfigParser
 from unittest.mock import patch, ANY, Mock
 import os
+import pickle
+import signal
 import logging
+import threading
 import time
 import unittest
 from requests.structures import CaseInsensitiveDict
@@ -132,6 +137,33 @@ class TestWorkerProcess(unittest.TestCase):
         task_runner = self.__get_valid_task_runner_with_worker_config_and_poll_interval(config, 3000)
         self.assertEqual(task_runner.worker.get_polling_interval_in_seconds(), 0.25)
 
+    def test_initialization_with_concurrency_in_worker_config(self):
+        config = ConfigParser()
+        config.set('DEFAULT', 'thread_count', '4')
+        config.add_section('task')
+        config.set('task', 'process_count', '3')
+        task_runner = self.__get_valid_task_runner_with_worker_config(config)
+        self.assertEqual(task_runner.worker.get_thread_count(), 4)
+        self.assertEqual(task_runner.worker.get_process_count(), 3)
+
+    @unittest.mock.patch.dict(os.environ, {"conductor_worker_thread_count": "8", "CONDUCTOR_WORKER_task_PROCESS_COUNT": "2"}, clear=True)
+    def test_initialization_with_concurrency_in_env_var(self):
+        config = ConfigParser()
+        config.add_section('task')
+        config.set('task', 'thread_count', '4')
+        config.set('task', 'process_count', '3')
+        task_runner = self.__get_valid_task_runner_with_worker_config(config)
+        self.assertEqual(task_runner.worker.get_thread_count(), 8)
+        self.assertEqual(task_runner.worker.get_process_count(), 2)
+
+    def test_initialization_with_invalid_concurrency_in_worker_config(self):
+        config = ConfigParser()
+        config.set('DEFAULT', 'thread_count', 'many')
+        config.set('DEFAULT', 'process_count', '0')
+        task_runner = self.__get_valid_task_runner_with_worker_config(config)
+        self.assertEqual(task_runner.worker.get_thread_count(), 1)
+        self.assertEqual(task_runner.worker.get_process_count(), 1)
+
     def test_run_once(self):
         expected_time = self.__get_valid_worker().get_polling_interval_in_seconds()
         with patch.object(
@@ -151,6 +183,19 @@ class TestWorkerProcess(unittest.TestCase):
                 spent_time = finish_time - start_time
                 self.assertGreater(spent_time, expected_time)
 
+    def test_run_once_with_task_updater(self):
+        with patch.object(
+            TaskResourceApi,
+            'poll',
+            return_value=self.__get_valid_task()
+        ):
+            with patch.object(TaskResourceApi, 'update_task') as mock_update_task:
+                task_runner = self.__get_valid_process()
+                task_runner.task_updater = Mock()
+                task_runner.run_once()
+                task_runner.task_updater.submit.assert_called_once_with(self.__get_valid_task_result(), 'task', ANY)
+                mock_update_task.assert_not_called()
+
     def test_run_once_roundrobin(self):
         with patch.object(
             TaskResourceApi,
@@ -168,6 +213,177 @@ class TestWorkerProcess(unittest.TestCase):
                     task_runner.run_once()
                     self.assertEqual(current_task_name, self.__shared_task_list[i])
 
+    def test_run_once_with_thread_pool(self):
+        with patch.object(
+            TaskResourceApi,
+            'batch_poll',
+            return_value=[self.__get_valid_task(), self.__get_valid_task()]
+        ) as mock_batch_poll:
+            with patch.object(
+                TaskResourceApi,
+                'update_task',
+                return_value=self.UPDATE_TASK_RESPONSE
+            ) as mock_update_task:
+                task_runner = self.__get_valid_process_with_thread_count(2)
+                task_runner.run_once()
+                task_runner._executor.shutdown(wait=True)
+                mock_batch_poll.assert_called_once_with(tasktype='task', workerid=ANY, count=2, timeout=100)
+                self.assertEqual(mock_update_task.call_count, 2)
+                mock_update_task.assert_called_with(body=self.__get_valid_task_result())
+
+    def test_run_once_with_thread_pool_and_batch_poll_not_supported(self):
+        with patch.object(
+            TaskResourceApi,
+            'batch_poll',
+            side_effect=ApiException(status=404)
+        ) as mock_batch_poll:
+            with patch.object(
+                TaskResourceApi,
+                'poll',
+                return_value=self.__get_valid_task()
+            ) as mock_poll:
+                with patch.object(
+                    TaskResourceApi,
+                    'update_task',
+                    return_value=self.UPDATE_TASK_RESPONSE
+                ) as mock_update_task:
+                    task_runner = self.__get_valid_process_with_thread_count(2)
+                    task_runner.run_once()
+                    task_runner.run_once()
+                    task_runner._executor.shutdown(wait=True)
+                    mock_batch_poll.assert_called_once()
+                    self.assertEqual(mock_poll.call_count, 2)
+                    self.assertEqual(mock_update_task.call_count, 2)
+
+    def test_batch_poll_tasks_with_faulty_task_api(self):
+        with patch.object(
+            TaskResourceApi,
+            'batch_poll',
+            side_effect=ApiException(status=500)
+        ):
+            task_runner = self.__get_valid_process_with_thread_count(2)
+            tasks = task_runner._batch_poll_tasks(2)
+            self.assertEqual(tasks, [])
+            self.assertTrue(task_runner._batch_poll_supported)
+
+    def test_run_once_with_all_threads_busy(self):
+        release_tasks = threading.Event()
+        execute = ClassWorker.execute
+
+        def blocking_execute(worker, task):
+            release_tasks.wait()
+            return execute(worker, task)
+
+        with patch.object(ClassWorker, 'execute', blocking_execute):
+            with patch.object(
+                TaskResourceApi,
+                'batch_poll',
+                return_value=[self.__get_valid_task()]
+            ) as mock_poll:
+                with patch.object(
+                    TaskResourceApi,
+                    'update_task',
+                    return_value=self.UPDATE_TASK_RESPONSE
+                ) as mock_update_task:
+                    task_runner = self.__get_valid_process_with_thread_count(2)
+                    task_runner.metrics_collector = Mock()
+                    for _ in range(3):
+                        task_runner.run_once()
+                    self.assertEqual(mock_poll.call_count, 2)
+                    task_runner.metrics_collector.increment_task_execution_queue_full.assert_called_once_with('task')
+                    release_tasks.set()
+                    task_runner._executor.shutdown(wait=True)
+                    self.assertEqual(mock_update_task.call_count, 2)
+
+    @patch('time.sleep')
+    def test_run_once_with_adaptive_polling(self, mock_sleep):
+        with patch.object(TaskResourceApi, 'poll', return_value=self.__get_valid_task()) as mock_poll:
+            with patch.object(TaskResourceApi, 'update_task', return_value=self.UPDATE_TASK_RESPONSE):
+                worker = self.__get_valid_worker()
+                worker.max_poll_interval = 1000
+                task_runner = WorkerProcess(
+                    configuration=Configuration(),
+                    worker=worker
+                )
+                task_runner.run_once()
+                mock_sleep.assert_called_with(0.0)
+                mock_poll.return_value = None
+                task_runner.run_once()
+                task_runner.run_once()
+                polling_interval = mock_sleep.call_args[0][0]
+                self.assertGreater(polling_interval, worker.get_polling_interval_in_seconds())
+                self.assertLessEqual(polling_interval, 1.0)
+
+    def test_pickle_without_process_state(self):
+        task_runner = self.__get_valid_process()
+        api_client = task_runner.api_client
+        unpickled_task_runner = pickle.loads(pickle.dumps(task_runner))
+        self.assertIsNone(unpickled_task_runner._api_client)
+        self.assertIsNot(unpickled_task_runner.api_client, api_client)
+        self.assertEqual(unpickled_task_runner.worker.get_task_definition_name(), 'task')
+
+    def test_connection_pool_sized_from_thread_count(self):
+        task_runner = self.__get_valid_process_with_thread_count(20)
+        adapter = task_runner.api_client.rest_client.connection.get_adapter(task_runner.configuration.host)
+        self.assertEqual(adapter._pool_maxsize, 22)
+
+    def test_connection_pool_large_enough(self):
+        task_runner = self.__get_valid_process_with_thread_count(2)
+        task_runner.configuration.pool_maxsize = 50
+        adapter = task_runner.api_client.rest_client.connection.get_adapter(task_runner.configuration.host)
+        self.assertEqual(adapter._pool_maxsize, 50)
+
+    def test_run_until_stopped(self):
+        with patch.object(TaskResourceApi, 'poll', return_value=None):
+            task_runner = self.__get_valid_process()
+            threading.Timer(0.2, task_runner.stop).start()
+            sigint_handler = signal.getsignal(signal.SIGINT)
+            task_runner.run()
+            self.assertTrue(task_runner.task_updater.flush(timeout=0))
+            self.assertIs(signal.getsignal(signal.SIGINT), sigint_handler)
+
+    def test_run_in_own_process_until_signalled(self):
+        if threading.current_thread() is not threading.main_thread():
+            self.skipTest('signal handlers are only set on the main thread')
+        with patch.object(TaskResourceApi, 'poll', return_value=None):
+            task_runner = self.__get_valid_process()
+            sigterm_handler = signal.getsignal(signal.SIGTERM)
+            # Calls the handler set by run, as SIGTERM would, without signalling the test process
+            threading.Timer(0.2, lambda: signal.getsignal(signal.SIGTERM)(signal.SIGTERM, None)).start()
+            task_runner.run(own_process=True)
+            self.assertTrue(task_runner._stopping.is_set())
+            self.assertIs(signal.getsignal(signal.SIGTERM), sigterm_handler)
+
+    def test_drain_abandons_running_tasks(self):
+        finish = threading.Event()
+        worker = self.__get_valid_worker()
+        worker.thread_count = 2
+        worker.execute = Mock(side_effect=lambda task: finish.wait(5))
+        with patch.object(TaskResourceApi, 'batch_poll', return_value=[self.__get_valid_task()]):
+            task_runner = WorkerProcess(configuration=Configuration(), worker=worker, shutdown_timeout=0.1)
+            task_runner.metrics_collector = Mock()
+            task_runner._run_once_in_thread_pool()
+            try:
+                self.assertEqual(task_runner.drain(), 1)
+            finally:
+                finish.set()
+        task_runner.metrics_collector.increment_task_abandoned.assert_called_once_with('task')
+        task_runner.metrics_collector.record_worker_drain_time.assert_called_once_with(ANY)
+
+    def test_execute_task_with_heartbeat(self):
+        worker = self.__get_valid_worker()
+        worker.heartbeat_interval = 50
+        execute = worker.execute
+        worker.execute = Mock(side_effect=lambda task: time.sleep(0.3) or execute(task))
+        with patch.object(TaskResourceApi, 'poll', side_effect=[self.__get_valid_task(), None]), \
+                patch.object(TaskResourceApi, 'update_task') as mock_update_task:
+            task_runner = WorkerProcess(configuration=Configuration(), worker=worker)
+            threading.Timer(0.5, task_runner.stop).start()
+            task_runner.run()
+        statuses = [call.kwargs['body'].status for call in mock_update_task.call_args_list]
+        self.assertGreater(statuses.count(TaskResultStatus.IN_PROGRESS), 1)
+        self.assertEqual(statuses[-1], TaskResultStatus.COMPLETED)
+
     def test_poll_task(self):
         expected_task = self.__get_valid_task()
         with patch.object(TaskResourceApi, 'poll', return_value=self.__get_valid_task()):
@@ -221,6 +437,19 @@ class TestWorkerProcess(unittest.TestCase):
         task_result = task_runner._execute_task(task)
         self.assertEqual(task_result, expected_task_result)
 
+    def test_execute_compact_task(self):
+        task_runner = self.__get_valid_process()
+        task = CompactTask(task_id=self.TASK_ID, workflow_instance_id=self.WORKFLOW_INSTANCE_ID)
+        task_result = task_runner._execute_task(task)
+        self.assertEqual(task_result, self.__get_valid_task_result())
+
+    def test_update_compact_task_result(self):
+        task_result = CompactTaskResult(task_id=self.TASK_ID, workflow_instance_id=self.WORKFLOW_INSTANCE_ID, status='COMPLETED')
+        with patch.object(TaskResourceApi, 'update_task', return_value=self.UPDATE_TASK_RESPONSE) as mock_update_task:
+            task_runner = self.__get_valid_process()
+            self.assertEqual(task_runner._update_task(task_result), self.UPDATE_TASK_RESPONSE)
+            mock_update_task.assert_called_once_with(body=task_result)
+
     def test_update_task_with_invalid_task_result(self):
         expected_response = None
         task_runner = self.__get_valid_process()
@@ -248,6 +477,21 @@ class TestWorkerProcess(unittest.TestCase):
             response = task_runner._update_task(task_result)
             self.assertEqual(response, expected_response)
 
+    def test_update_task_with_measured_payload(self):
+        with patch.object(
+            TaskResourceApi,
+            'update_task',
+            return_value=self.UPDATE_TASK_RESPONSE
+        ) as mock_update_task:
+            task_runner = self.__get_valid_process()
+            task_runner.metrics_collector = Mock()
+            task_runner.metrics_collector.measure_task_result_payload.side_effect = \
+                lambda task_definition_name, task_result, serialize: serialize(task_result)
+            task_result = self.__get_valid_task_result()
+            response = task_runner._update_task(task_result)
+            self.assertEqual(response, self.UPDATE_TASK_RESPONSE)
+            mock_update_task.assert_called_once_with(body=task_runner.api_client.serialize(task_result))
+
     def test_wait_for_polling_interval_with_faulty_worker(self):
         expected_exception = Exception(
             "Failed to get polling interval"
@@ -296,6 +540,14 @@ class TestWorkerProcess(unittest.TestCase):
             worker=self.__get_valid_worker()
         )
 
+    def __get_valid_process_with_thread_count(self, thread_count):
+        worker = self.__get_valid_worker()
+        worker.thread_count = thread_count
+        return WorkerProcess(
+            configuration=Configuration(),
+            worker=worker
+        )
+
     def __get_valid_roundrobin_process(self):
         return WorkerProcess(
             configuration=Configuration(),
@@ -0,0 +1,49 @@
+import unittest
+
+from unittest.mock import patch
+from swift_conductor.clients.metadata_cache import MetadataCache
+from swift_conductor.http.models.task_def import TaskDef
+
+
+class TestMetadataCache(unittest.TestCase):
+    def test_get_returns_copy(self):
+        cache = MetadataCache()
+        cache.put(('task', 'ut_task'), TaskDef('ut_task'))
+        taskDef = cache.get(('task', 'ut_task'))
+        self.assertEqual(taskDef, TaskDef('ut_task'))
+        taskDef.description = 'changed'
+        self.assertIsNone(cache.get(('task', 'ut_task')).description)
+        self.assertEqual((cache.hits, cache.misses), (2, 0))
+
+    def test_entry_expires(self):
+        cache = MetadataCache(ttl=10)
+        with patch('time.monotonic', return_value=100):
+            cache.put(('task', 'ut_task'), TaskDef('ut_task'))
+        with patch('time.monotonic', return_value=109):
+            self.assertIsNotNone(cache.get(('task', 'ut_task')))
+        with patch('time.monotonic', return_value=111):
+            self.assertIsNone(cache.get(('task', 'ut_task')))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(len(cache), 0)
+
+    def test_least_recently_used_evicted(self):
+        cache = MetadataCache(max_size=2)
+        cache.put(('task', 'a'), TaskDef('a'))
+        cache.put(('task', 'b'), TaskDef('b'))
+        cache.get(('task', 'a'))
+        cache.put(('task', 'c'), TaskDef('c'))
+        self.assertIsNotNone(cache.get(('task', 'a')))
+        self.assertIsNone(cache.get(('task', 'b')))
+        self.assertIsNotNone(cache.get(('task', 'c')))
+
+    def test_invalidate_prefix(self):
+        cache = MetadataCache()
+        cache.put(('workflow', 'ut_wf', None), 'latest')
+        cache.put(('workflow', 'ut_wf', 1), 'v1')
+        cache.put(('workflow', 'other_wf', 1), 'v1')
+        cache.invalidate('workflow', 'ut_wf')
+        self.assertIsNone(cache.get(('workflow', 'ut_wf', None)))
+        self.assertIsNone(cache.get(('workflow', 'ut_wf', 1)))
+        self.assertEqual(cache.get(('workflow', 'other_wf', 1)), 'v1')
+        cache.invalidate()
+        self.assertEqual(len(cache), 0)
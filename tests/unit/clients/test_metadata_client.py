@@ -5,6 +5,7 @@ import json
 from unittest.mock import Mock, patch, MagicMock
 from swift_conductor.http.rest import ApiException
 from swift_conductor.clients.metadata_client import MetadataClient
+from swift_conductor.clients.metadata_cache import MetadataCache
 from swift_conductor.http.api.metadata_resource_api import MetadataResourceApi
 from swift_conductor.configuration import Configuration
 from swift_conductor.http.models.workflow_def import WorkflowDef
@@ -112,3 +113,45 @@ class TestMetadataClient(unittest.TestCase):
         mock.return_value = [self.taskDef, taskDef2]
         tasks = self.metadata_client.get_all_task_defs()
         self.assertEqual(len(tasks), 2)
+
+
+class TestMetadataClientWithCache(unittest.TestCase):
+
+    def setUp(self):
+        configuration = Configuration("http://localhost:8080/api")
+        self.metadataCache = MetadataCache()
+        self.metadata_client = MetadataClient(configuration, metadataCache=self.metadataCache)
+        self.workflowDef = WorkflowDef(name=WORKFLOW_NAME, version=1)
+        self.taskDef = TaskDef(TASK_NAME)
+
+    @patch.object(MetadataResourceApi, 'get')
+    def test_getWorkflowDef_cached(self, mock):
+        mock.return_value = self.workflowDef
+        self.assertEqual(self.metadata_client.get_workflow_def(WORKFLOW_NAME, 1), self.workflowDef)
+        self.assertEqual(self.metadata_client.get_workflow_def(WORKFLOW_NAME, 1), self.workflowDef)
+        self.assertEqual(mock.call_count, 1)
+        self.metadata_client.get_workflow_def(WORKFLOW_NAME)
+        self.assertEqual(mock.call_count, 2)
+        self.assertEqual((self.metadataCache.hits, self.metadataCache.misses), (1, 2))
+
+    @patch.object(MetadataResourceApi, 'update1')
+    @patch.object(MetadataResourceApi, 'get')
+    def test_updateWorkflowDef_invalidates_cache(self, mockGet, mockUpdate):
+        mockGet.return_value = self.workflowDef
+        self.metadata_client.get_workflow_def(WORKFLOW_NAME)
+        self.metadata_client.get_workflow_def(WORKFLOW_NAME, 1)
+        self.metadata_client.update_workflow_def(self.workflowDef)
+        self.metadata_client.get_workflow_def(WORKFLOW_NAME)
+        self.metadata_client.get_workflow_def(WORKFLOW_NAME, 1)
+        self.assertEqual(mockGet.call_count, 4)
+
+    @patch.object(MetadataResourceApi, 'unregister_task_def')
+    @patch.object(MetadataResourceApi, 'get_task_def')
+    def test_getTaskDef_cached_until_unregistered(self, mockGet, mockUnregister):
+        mockGet.return_value = self.taskDef
+        self.assertEqual(self.metadata_client.get_task_def(TASK_NAME), self.taskDef)
+        self.assertEqual(self.metadata_client.get_task_def(TASK_NAME), self.taskDef)
+        self.assertEqual(mockGet.call_count, 1)
+        self.metadata_client.unregister_task_def(TASK_NAME)
+        self.metadata_client.get_task_def(TASK_NAME)
+        self.assertEqual(mockGet.call_count, 2)
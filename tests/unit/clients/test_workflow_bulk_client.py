@@ -0,0 +1,84 @@
+import logging
+import unittest
+
+from unittest.mock import patch
+from swift_conductor.clients.workflow_bulk_client import WorkflowBulkClient
+from swift_conductor.configuration import Configuration
+from swift_conductor.http.api.workflow_bulk_resource_api import WorkflowBulkResourceApi
+from swift_conductor.http.models.bulk_response import BulkResponse
+from swift_conductor.http.rest import ApiException
+
+WORKFLOW_IDS = [f'wf_{i}' for i in range(7)]
+
+
+def bulk_response(body, **kwargs):
+    return BulkResponse(
+        bulk_successful_results=[workflowId for workflowId in body if workflowId != 'wf_1'],
+        bulk_error_results={'wf_1': 'not running'} if 'wf_1' in body else {}
+    )
+
+
+class TestWorkflowBulkClient(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        configuration = Configuration("http://localhost:8080/api")
+        cls.bulk_client = WorkflowBulkClient(configuration, chunkSize=3, maxWorkers=2)
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_init(self):
+        message = "workflowBulkResourceApi is not of type WorkflowBulkResourceApi"
+        self.assertIsInstance(self.bulk_client.workflowBulkResourceApi, WorkflowBulkResourceApi, message)
+
+    @patch.object(WorkflowBulkResourceApi, 'pause_workflow')
+    def test_pause_workflows_in_chunks(self, mock):
+        mock.side_effect = bulk_response
+        progress = []
+        response = self.bulk_client.pause_workflows(
+            iter(WORKFLOW_IDS),
+            onProgress=lambda processed, failed: progress.append((processed, failed))
+        )
+        self.assertEqual(sorted(c.args[0] for c in mock.call_args_list), [
+            ['wf_0', 'wf_1', 'wf_2'], ['wf_3', 'wf_4', 'wf_5'], ['wf_6']
+        ])
+        self.assertEqual(response.bulk_successful_results, ['wf_0', 'wf_2', 'wf_3', 'wf_4', 'wf_5', 'wf_6'])
+        self.assertEqual(response.bulk_error_results, {'wf_1': 'not running'})
+        self.assertEqual(progress, [(3, 1), (6, 1), (7, 1)])
+
+    @patch.object(WorkflowBulkResourceApi, 'terminate')
+    def test_terminate_workflows(self, mock):
+        mock.side_effect = bulk_response
+        self.bulk_client.terminate_workflows(['wf_0'], reason='cleanup', triggerFailureWorkflow=True)
+        mock.assert_called_once_with(['wf_0'], reason='cleanup', triggerFailureWorkflow=True)
+
+    @patch.object(WorkflowBulkResourceApi, 'restart')
+    def test_restart_workflows(self, mock):
+        mock.side_effect = bulk_response
+        self.bulk_client.restart_workflows(['wf_0'], useLatestDef=True)
+        mock.assert_called_once_with(['wf_0'], use_latest_definitions=True)
+
+    @patch.object(WorkflowBulkResourceApi, 'retry')
+    def test_failed_chunk_reported_per_workflow(self, mock):
+        def retry(body):
+            if 'wf_4' in body:
+                raise ApiException(status=500, reason='Internal Server Error')
+            return bulk_response(body)
+        mock.side_effect = retry
+
+        response = self.bulk_client.retry_workflows(WORKFLOW_IDS)
+
+        self.assertEqual(response.bulk_successful_results, ['wf_0', 'wf_2', 'wf_6'])
+        self.assertEqual(sorted(response.bulk_error_results), ['wf_1', 'wf_3', 'wf_4', 'wf_5'])
+        self.assertIn('Internal Server Error', response.bulk_error_results['wf_3'])
+
+    @patch.object(WorkflowBulkResourceApi, 'resume_workflow')
+    def test_no_workflows(self, mock):
+        response = self.bulk_client.resume_workflows([])
+        mock.assert_not_called()
+        self.assertEqual(response.bulk_successful_results, [])
+        self.assertEqual(response.bulk_error_results, {})
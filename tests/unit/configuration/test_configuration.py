@@ -28,3 +28,12 @@ class TestConfiguration(unittest.TestCase):
             'http://localhost:8080/api'
         )
 
+    def test_initialization_connection_pool_defaults(self):
+        configuration = Configuration()
+        self.assertIsNone(configuration.http_connection)
+        self.assertEqual(configuration.pool_connections, 10)
+        self.assertEqual(configuration.pool_maxsize, 10)
+        self.assertFalse(configuration.pool_block)
+        self.assertTrue(configuration.keep_alive)
+        self.assertEqual(configuration.connect_timeout, 45)
+        self.assertEqual(configuration.read_timeout, 45)
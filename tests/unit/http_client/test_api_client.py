@@ -0,0 +1,234 @@
+from swift_conductor.http import json_backend
+from swift_conductor.configuration import Configuration
+from swift_conductor.http.api_client import ApiClient
+from swift_conductor.http.lazy_model import LazyModel
+from swift_conductor.http.models.compact import CompactTask, CompactWorkflow
+from swift_conductor.http.models.start_workflow_request import StartWorkflowRequest
+from swift_conductor.http.models.task import Task
+from swift_conductor.http.models.task_def import TaskDef
+from swift_conductor.http.models.task_exec_log import TaskExecLog
+from swift_conductor.http.models.task_result import TaskResult
+from swift_conductor.http.models.workflow import Workflow
+from swift_conductor.http.models.workflow_task import WorkflowTask
+from unittest.mock import Mock, patch
+import datetime
+import json
+import logging
+import pickle
+import unittest
+
+WORKFLOW_TASK = {
+    'name': 'decide',
+    'taskReferenceName': 'decide_ref',
+    'type': 'SWITCH',
+    'decisionCases': {
+        'yes': [{'name': 'yes_task', 'taskReferenceName': 'yes_ref', 'type': 'SIMPLE'}],
+    },
+    'defaultCase': [{'name': 'no_task', 'taskReferenceName': 'no_ref', 'type': 'SIMPLE'}],
+    'forkTasks': [[{'name': 'fork_task', 'taskReferenceName': 'fork_ref', 'type': 'SIMPLE'}]],
+    'taskDefinition': {'name': 'decide', 'retryCount': 3, 'inputKeys': ['value']},
+}
+
+
+class TestApiClientDeserialization(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.api_client = ApiClient()
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    def test_deserialize_nested_models(self):
+        workflow = self.api_client.deserialize_class(
+            {
+                'workflowId': 'workflow_id',
+                'status': 'RUNNING',
+                'input': {'value': 1},
+                'tasks': [
+                    {'taskId': 'task_id', 'status': 'COMPLETED', 'seq': '1', 'workflowTask': WORKFLOW_TASK},
+                    None,
+                ],
+            },
+            'Workflow'
+        )
+        self.assertIsInstance(workflow, Workflow)
+        self.assertEqual(workflow.workflow_id, 'workflow_id')
+        self.assertEqual(workflow.input, {'value': 1})
+        self.assertIsNone(workflow.tasks[1])
+
+        task = workflow.tasks[0]
+        self.assertIsInstance(task, Task)
+        self.assertEqual(task.seq, 1)
+
+        workflow_task = task.workflow_task
+        self.assertIsInstance(workflow_task, WorkflowTask)
+        self.assertIsInstance(workflow_task.decision_cases['yes'][0], WorkflowTask)
+        self.assertEqual(workflow_task.default_case[0].name, 'no_task')
+        self.assertEqual(workflow_task.fork_tasks[0][0].task_reference_name, 'fork_ref')
+        self.assertEqual(workflow_task.task_definition, TaskDef(name='decide', retry_count=3, input_keys=['value']))
+
+    def test_deserialize_native_types(self):
+        self.assertEqual(self.api_client.deserialize_class('5', 'int'), 5)
+        self.assertEqual(self.api_client.deserialize_class(b'value', 'str'), 'value')
+        self.assertEqual(self.api_client.deserialize_class({'a': '1'}, 'dict(str, int)'), {'a': 1})
+        self.assertEqual(self.api_client.deserialize_class([1, None], 'list[str]'), ['1', None])
+        self.assertEqual(self.api_client.deserialize_class({'a': [1]}, 'object'), {'a': [1]})
+        self.assertIsNone(self.api_client.deserialize_class(None, 'Task'))
+
+    def test_deserializer_compiled_once(self):
+        self.api_client.deserialize_class([{'taskId': 'task_id'}], 'list[Task]')
+        deserializer = self.api_client._deserializers['list[Task]']
+        self.assertIn(Task, self.api_client._deserializers)
+        self.assertIn('list[WorkflowTask]', self.api_client._deserializers)
+
+        self.api_client.deserialize_class([{'taskId': 'task_id'}], 'list[Task]')
+        self.assertIs(self.api_client._deserializers['list[Task]'], deserializer)
+
+    def test_deserialize_invalid_value(self):
+        response = Mock()
+        response.resp.json.return_value = {'taskId': 'task_id', 'status': 'UNKNOWN'}
+        self.assertIsNone(self.api_client.deserialize(response, 'Task'))
+
+
+
+class TestApiClientLazyDeserialization(unittest.TestCase):
+    def setUp(self):
+        configuration = Configuration()
+        configuration.lazy_deserialization = True
+        self.api_client = ApiClient(configuration)
+        self.data = {
+            'workflowId': 'workflow_id',
+            'status': 'RUNNING',
+            'tasks': [{'taskId': 'task_id', 'status': 'COMPLETED', 'workflowTask': WORKFLOW_TASK}],
+        }
+
+    def test_attributes_deserialized_when_read(self):
+        workflow = self.api_client.deserialize_class(self.data, 'Workflow')
+        self.assertIsInstance(workflow, Workflow)
+        self.assertIsInstance(workflow, LazyModel)
+        self.assertEqual(workflow.status, 'RUNNING')
+        self.assertNotIn('_tasks', workflow.__dict__)
+
+        task = workflow.tasks[0]
+        self.assertIsInstance(task, Task)
+        self.assertEqual(task.task_id, 'task_id')
+        self.assertIsInstance(task.workflow_task.decision_cases['yes'][0], WorkflowTask)
+        self.assertIs(workflow.tasks, workflow.tasks)
+        self.assertIsNone(workflow.correlation_id)
+
+    def test_lazy_model_equals_eager_model(self):
+        workflow = self.api_client.deserialize_class(self.data, 'Workflow')
+        eager_workflow = ApiClient().deserialize_class(self.data, 'Workflow')
+        self.assertEqual(workflow, eager_workflow)
+        self.assertEqual(eager_workflow, workflow)
+        self.assertEqual(workflow.to_dict(), eager_workflow.to_dict())
+
+        eager_workflow.status = 'COMPLETED'
+        self.assertNotEqual(workflow, eager_workflow)
+
+    def test_pickle_lazy_model(self):
+        workflow = self.api_client.deserialize_class(self.data, 'Workflow')
+        workflow.status = 'COMPLETED'
+        unpickled_workflow = pickle.loads(pickle.dumps(workflow))
+        self.assertIs(type(unpickled_workflow), Workflow)
+        self.assertIs(type(unpickled_workflow.tasks[0]), Task)
+        self.assertEqual(unpickled_workflow.status, 'COMPLETED')
+        self.assertEqual(unpickled_workflow, workflow)
+
+    def test_set_attribute(self):
+        workflow = self.api_client.deserialize_class(self.data, 'Workflow')
+        workflow.status = 'COMPLETED'
+        self.assertEqual(workflow.status, 'COMPLETED')
+        with self.assertRaises(ValueError):
+            workflow.status = 'UNKNOWN'
+
+    def test_unknown_attribute(self):
+        workflow = self.api_client.deserialize_class(self.data, 'Workflow')
+        with self.assertRaises(AttributeError):
+            workflow.unknown
+
+
+class TestApiClientCompactModels(unittest.TestCase):
+    def setUp(self):
+        configuration = Configuration()
+        configuration.compact_models = True
+        self.api_client = ApiClient(configuration)
+        self.data = {
+            'workflowId': 'workflow_id',
+            'status': 'RUNNING',
+            'tasks': [{'taskId': 'task_id', 'status': 'COMPLETED', 'workflowTask': WORKFLOW_TASK}],
+        }
+
+    def test_deserialize_compact_models(self):
+        workflow = self.api_client.deserialize_class(self.data, 'Workflow')
+        self.assertIsInstance(workflow, CompactWorkflow)
+        self.assertIsInstance(workflow.tasks[0], CompactTask)
+        self.assertIsInstance(workflow.tasks[0].workflow_task, WorkflowTask)
+        self.assertIsInstance(workflow, Workflow)
+        self.assertIsInstance(workflow.tasks[0], Task)
+        # Every attribute is stored in a slot
+        self.assertEqual(workflow.__dict__, {})
+        self.assertEqual(workflow.status, 'RUNNING')
+        self.assertEqual(workflow.to_dict(), ApiClient().deserialize_class(self.data, 'Workflow').to_dict())
+
+    def test_compact_model_attributes(self):
+        task = CompactTask(task_id='task_id', status='COMPLETED')
+        self.assertEqual(task, CompactTask(task_id='task_id', status='COMPLETED'))
+        self.assertEqual(task, Task(task_id='task_id', status='COMPLETED'))
+        self.assertEqual(Task(task_id='task_id', status='COMPLETED'), task)
+        self.assertNotEqual(task, CompactTask(task_id='task_id'))
+        self.assertNotEqual(Task(task_id='task_id'), task)
+        with self.assertRaises(ValueError):
+            task.status = 'UNKNOWN'
+
+    def test_serialize_compact_model(self):
+        task = CompactTask(task_id='task_id', status='COMPLETED')
+        self.assertEqual(
+            self.api_client.sanitize_for_serialization(task),
+            {'taskId': 'task_id', 'status': 'COMPLETED'}
+        )
+        self.assertEqual(json.loads(self.api_client.serialize(task)), {'taskId': 'task_id', 'status': 'COMPLETED'})
+
+class TestApiClientSerialization(unittest.TestCase):
+    def setUp(self):
+        self.api_client = ApiClient()
+
+    def test_serialize_task_result(self):
+        task_result = TaskResult(
+            workflow_instance_id='workflow_id',
+            task_id='task_id',
+            worker_id='worker_id',
+            status='COMPLETED',
+            output_data={'value': 1, 'items': [1, 'a', None], 'time': datetime.date(2023, 1, 2)},
+            logs=[TaskExecLog('log', 'task_id', 1)]
+        )
+        self.assertEqual(
+            json.loads(self.api_client.serialize(task_result)),
+            self.api_client.sanitize_for_serialization(task_result)
+        )
+
+    def test_serialize_start_workflow_request(self):
+        request = StartWorkflowRequest(name='workflow', version=1, input={'value': 'ü', 1: True})
+        expected = {'name': 'workflow', 'version': 1, 'input': {'value': 'ü', '1': True}}
+        self.assertEqual(json.loads(self.api_client.serialize(request)), expected)
+        with patch.object(json_backend, '_dumps', json_backend._dumps_json):
+            self.assertEqual(json.loads(self.api_client.serialize(request)), expected)
+
+    def test_serialized_body_sent_as_is(self):
+        body = b'{"taskId": "task_id"}'
+        with patch.object(ApiClient, 'request', return_value=Mock(status=200, data='')) as mock_request:
+            self.api_client.call_api('/tasks', 'POST', body=body, _preload_content=False)
+        self.assertIs(mock_request.call_args.kwargs['body'], body)
+
+    def test_serialize_unsupported_value(self):
+        with self.assertRaises(TypeError):
+            self.api_client.serialize({'value': object()})
+
+
+class TestJsonBackend(unittest.TestCase):
+    def test_dumps_returns_bytes(self):
+        self.assertEqual(json.loads(json_backend.dumps({'value': [1, 2]})), {'value': [1, 2]})
+        self.assertIsInstance(json_backend.dumps('value'), bytes)
+
+    def test_dumps_large_integer(self):
+        self.assertEqual(json.loads(json_backend.dumps({'value': 2 ** 70})), {'value': 2 ** 70})
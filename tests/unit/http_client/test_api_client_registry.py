@@ -0,0 +1,70 @@
+from swift_conductor.clients.metadata_client import MetadataClient
+from swift_conductor.clients.task_client import TaskClient
+from swift_conductor.configuration import Configuration
+from swift_conductor.http.api_client import ApiClient
+from swift_conductor.http.api_client_registry import ApiClientRegistry
+from swift_conductor.workflow.workflow_manager import WorkflowManager
+from unittest.mock import patch
+import unittest
+
+
+class TestApiClientRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = ApiClientRegistry()
+
+    def test_same_configuration_shares_api_client(self):
+        configuration = Configuration()
+        self.assertIs(
+            self.registry.acquire(configuration),
+            self.registry.acquire(configuration)
+        )
+
+    def test_different_configurations_do_not_share_api_client(self):
+        self.assertIsNot(
+            self.registry.acquire(Configuration()),
+            self.registry.acquire(Configuration())
+        )
+
+    def test_default_configuration_is_shared(self):
+        self.assertIs(
+            self.registry.acquire(),
+            self.registry.acquire()
+        )
+
+    def test_api_client_closed_after_last_release(self):
+        configuration = Configuration()
+        api_client = self.registry.acquire(configuration)
+        self.registry.acquire(configuration)
+        with patch.object(ApiClient, 'close') as mock_close:
+            self.registry.release(api_client)
+            mock_close.assert_not_called()
+            self.registry.release(api_client)
+            mock_close.assert_called_once()
+        self.assertIsNot(self.registry.acquire(configuration), api_client)
+
+    def test_forked_process_gets_own_api_client(self):
+        configuration = Configuration()
+        api_client = self.registry.acquire(configuration)
+        with patch('os.getpid', return_value=-1):
+            self.assertIsNot(self.registry.acquire(configuration), api_client)
+
+
+class TestSharedApiClient(unittest.TestCase):
+    def test_clients_share_api_client(self):
+        configuration = Configuration()
+        task_client = TaskClient(configuration)
+        metadata_client = MetadataClient(configuration)
+        workflow_manager = WorkflowManager(configuration)
+        self.assertIs(task_client.api_client, metadata_client.api_client)
+        self.assertIs(task_client.api_client, workflow_manager.api_client)
+        self.assertIs(task_client.api_client, task_client.taskResourceApi.api_client)
+
+    def test_clients_close_shared_api_client(self):
+        configuration = Configuration()
+        with patch.object(ApiClient, 'close') as mock_close:
+            with TaskClient(configuration) as task_client:
+                with MetadataClient(configuration):
+                    pass
+                mock_close.assert_not_called()
+            task_client.close()
+            mock_close.assert_called_once()
@@ -0,0 +1,129 @@
+from swift_conductor.configuration import Configuration
+from swift_conductor.http.api.async_task_resource_api import AsyncTaskResourceApi
+from swift_conductor.http.api_client import ApiClient
+from swift_conductor.http.async_api_client import AsyncApiClient
+from swift_conductor.http.models.task import Task
+from swift_conductor.http.models.task_result import TaskResult
+from swift_conductor.http.rest import ApiException
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+import asyncio
+import json
+import logging
+import unittest
+
+
+class TestAsyncApiClient(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.response = Mock(status=200, reason='OK')
+        self.response.text = AsyncMock(return_value='')
+        request_context = MagicMock()
+        request_context.__aenter__ = AsyncMock(return_value=self.response)
+        request_context.__aexit__ = AsyncMock(return_value=False)
+        self.session = Mock()
+        self.session.request = Mock(return_value=request_context)
+        self.session.close = AsyncMock()
+        self.aiohttp = Mock()
+        self.aiohttp.ClientSession.return_value = self.session
+        self.patch = patch('swift_conductor.http.async_api_client.aiohttp', self.aiohttp)
+        self.patch.start()
+
+    def tearDown(self):
+        self.patch.stop()
+        logging.disable(logging.NOTSET)
+
+    def test_session_with_pool_configuration(self):
+        configuration = Configuration()
+        configuration.pool_maxsize = 32
+        configuration.keep_alive = False
+        configuration.connect_timeout = 3
+        configuration.read_timeout = 30
+
+        self.__call_api(configuration, '/tasks/{taskId}', 'GET', path_params={'taskId': 'task_id'})
+
+        self.aiohttp.TCPConnector.assert_called_once_with(ssl=True, limit_per_host=32, force_close=True)
+        self.aiohttp.ClientSession.assert_called_once_with(connector=self.aiohttp.TCPConnector.return_value)
+        self.aiohttp.ClientTimeout.assert_called_once_with(connect=3, sock_read=30)
+        self.assertIs(self.session.request.call_args.kwargs['timeout'], self.aiohttp.ClientTimeout.return_value)
+
+    def test_request_timeout(self):
+        self.__call_api(Configuration(), '/tasks', 'GET', _request_timeout=(1, 2))
+        self.aiohttp.ClientTimeout.assert_called_with(connect=1, sock_read=2)
+
+        self.__call_api(Configuration(), '/tasks', 'GET', _request_timeout=5)
+        self.aiohttp.ClientTimeout.assert_called_with(total=5)
+
+    def test_path_and_query_params(self):
+        self.__call_api(
+            Configuration(), '/tasks/poll/{tasktype}', 'GET',
+            path_params={'tasktype': 'task type/1'},
+            query_params=[('workerid', 'worker'), ('count', 2), ('enabled', True), ('archived', False)],
+        )
+        args, kwargs = self.session.request.call_args
+        self.assertEqual(args, ('GET', Configuration().host + '/tasks/poll/task%20type%2F1'))
+        self.assertEqual(
+            kwargs['params'],
+            [('workerid', 'worker'), ('count', '2'), ('enabled', 'true'), ('archived', 'false')]
+        )
+        self.assertEqual(kwargs['headers']['Accept'], 'application/json')
+
+    def test_deserialize_response(self):
+        self.response.text.return_value = '{"taskId": "task_id", "status": "IN_PROGRESS"}'
+        task = self.__call_api(Configuration(), '/tasks/poll/{tasktype}', 'GET', path_params={'tasktype': 'task'}, response_type='Task')
+        self.assertEqual(task, Task(task_id='task_id', status='IN_PROGRESS'))
+
+    def test_empty_response(self):
+        self.response.status = 204
+        self.response.reason = 'No Content'
+        task = self.__call_api(Configuration(), '/tasks/poll/{tasktype}', 'GET', path_params={'tasktype': 'task'}, response_type='Task')
+        self.assertIsNone(task)
+
+    def test_plain_text_response(self):
+        self.response.text.return_value = 'task_id'
+        response = self.__call_api(Configuration(), '/tasks', 'POST', body={'taskId': 'task_id'}, response_type='str')
+        self.assertEqual(response, 'task_id')
+        self.assertEqual(json.loads(self.session.request.call_args.kwargs['data']), {'taskId': 'task_id'})
+
+    def test_update_task_accepts_plain_text(self):
+        async def update_task():
+            async with AsyncApiClient(Configuration()) as api_client:
+                return await AsyncTaskResourceApi(api_client).update_task(body=TaskResult(task_id='task_id'))
+
+        self.response.text.return_value = 'task_id'
+        self.assertEqual(asyncio.run(update_task()), 'task_id')
+        args, kwargs = self.session.request.call_args
+        self.assertEqual(args, ('POST', Configuration().host + '/task'))
+        self.assertEqual(kwargs['headers']['Accept'], 'text/plain')
+
+    def test_update_task_accepts_plain_text_without_aiohttp(self):
+        with patch('swift_conductor.http.async_api_client.aiohttp', None):
+            with patch.object(ApiClient, 'call_api', return_value='task_id') as mock_call_api:
+                async def update_task():
+                    async with AsyncApiClient(Configuration()) as api_client:
+                        return await AsyncTaskResourceApi(api_client).update_task(body=TaskResult(task_id='task_id'))
+
+                self.assertEqual(asyncio.run(update_task()), 'task_id')
+        self.assertEqual(mock_call_api.call_args.kwargs['header_params'], {'Accept': 'text/plain'})
+
+    def test_error_response(self):
+        self.response.status = 404
+        self.response.reason = 'Not Found'
+        self.response.text.return_value = '{"message": "task not found"}'
+        with self.assertRaises(ApiException) as context:
+            self.__call_api(Configuration(), '/tasks/{taskId}', 'GET', path_params={'taskId': 'task_id'}, response_type='Task')
+        self.assertEqual(context.exception.status, 404)
+        self.assertEqual(context.exception.reason, 'Not Found')
+        self.assertEqual(context.exception.body, '{"message": "task not found"}')
+
+    def test_connection_error(self):
+        self.session.request.side_effect = OSError('connection refused')
+        with self.assertRaises(ApiException) as context:
+            self.__call_api(Configuration(), '/tasks', 'GET')
+        self.assertEqual(context.exception.status, 0)
+
+    def __call_api(self, configuration, *args, **kwargs):
+        async def call_api():
+            async with AsyncApiClient(configuration) as api_client:
+                return await api_client.call_api(*args, **kwargs)
+
+        return asyncio.run(call_api())
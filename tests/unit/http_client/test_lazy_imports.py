@@ -0,0 +1,53 @@
+from swift_conductor.http.api.task_resource_api import TaskResourceApi
+from swift_conductor.http.models.task import Task
+import os
+import subprocess
+import sys
+import swift_conductor
+import swift_conductor.http.api as http_api
+import swift_conductor.http.models as http_models
+import unittest
+
+
+def _loaded_modules_after(statement: str) -> list:
+    """Returns the swift_conductor.http modules loaded by a new interpreter
+    after running the statement."""
+    src_path = os.path.dirname(os.path.dirname(swift_conductor.__file__))
+    code = (
+        f'{statement}\n'
+        'import sys\n'
+        'print(" ".join(m for m in sys.modules if m.startswith("swift_conductor.http.")))'
+    )
+    env = dict(os.environ, PYTHONPATH=src_path)
+    output = subprocess.check_output([sys.executable, '-c', code], env=env, text=True)
+    return output.split()
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_models_package_imports_no_models(self):
+        modules = _loaded_modules_after('import swift_conductor.http.models')
+        self.assertEqual(modules, ['swift_conductor.http.models'])
+
+    def test_importing_a_model_imports_its_module_only(self):
+        modules = _loaded_modules_after('from swift_conductor.http.models import TaskDef')
+        self.assertEqual(
+            sorted(modules),
+            ['swift_conductor.http.models', 'swift_conductor.http.models.task_def']
+        )
+
+    def test_api_client_imports_no_models(self):
+        modules = _loaded_modules_after('import swift_conductor.http.api_client')
+        self.assertFalse(any(m.startswith('swift_conductor.http.models.') for m in modules))
+
+    def test_model_attribute(self):
+        self.assertIs(getattr(http_models, 'Task'), Task)
+        self.assertIn('Task', dir(http_models))
+
+    def test_api_attribute(self):
+        self.assertIs(http_api.TaskResourceApi, TaskResourceApi)
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            getattr(http_models, 'UnknownModel')
+        with self.assertRaises(AttributeError):
+            http_api.UnknownApi
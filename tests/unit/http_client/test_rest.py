@@ -0,0 +1,62 @@
+from swift_conductor.configuration import Configuration
+from swift_conductor.http.api_client import ApiClient
+from swift_conductor.http.rest import KeepAliveHTTPAdapter, RESTClientObject
+from requests.adapters import HTTPAdapter
+from unittest.mock import Mock
+import socket
+import unittest
+
+
+class TestRESTClientObject(unittest.TestCase):
+    def test_default_session(self):
+        rest_client = RESTClientObject()
+        adapter = rest_client.connection.get_adapter('https://localhost:8080/api')
+        self.assertIsInstance(adapter, KeepAliveHTTPAdapter)
+        self.assertEqual(rest_client.timeout, (45, 45))
+        self.assertEqual(rest_client.connection.headers['Connection'], 'keep-alive')
+
+    def test_session_with_pool_configuration(self):
+        configuration = Configuration()
+        configuration.pool_connections = 4
+        configuration.pool_maxsize = 32
+        configuration.pool_block = True
+        configuration.keep_alive = False
+        configuration.connect_timeout = 3
+        configuration.read_timeout = 30
+
+        rest_client = ApiClient(configuration).rest_client
+
+        adapter = rest_client.connection.get_adapter('http://localhost:8080/api')
+        self.assertNotIsInstance(adapter, KeepAliveHTTPAdapter)
+        self.assertIsInstance(adapter, HTTPAdapter)
+        self.assertEqual(adapter._pool_connections, 4)
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertTrue(adapter._pool_block)
+        self.assertEqual(rest_client.connection.headers['Connection'], 'close')
+        self.assertEqual(rest_client.timeout, (3, 30))
+
+    def test_request_uses_configured_timeout(self):
+        configuration = Configuration()
+        configuration.connect_timeout = 3
+        configuration.read_timeout = 30
+        connection = Mock()
+        connection.request.return_value = Mock(status_code=200, reason='OK', headers={})
+
+        rest_client = RESTClientObject(connection=connection, configuration=configuration)
+        rest_client.GET('http://localhost:8080/api/metadata/taskdefs')
+
+        self.assertEqual(connection.request.call_args.kwargs['timeout'], (3, 30))
+
+    def test_serialized_body_sent_as_is(self):
+        connection = Mock()
+        connection.request.return_value = Mock(status_code=200, reason='OK', headers={})
+
+        rest_client = RESTClientObject(connection=connection)
+        rest_client.POST('http://localhost:8080/api/tasks', body=b'{"taskId":"task_id"}')
+
+        self.assertEqual(connection.request.call_args.kwargs['data'], b'{"taskId":"task_id"}')
+
+    def test_keep_alive_socket_options(self):
+        adapter = KeepAliveHTTPAdapter()
+        socket_options = adapter.poolmanager.connection_pool_kw['socket_options']
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), socket_options)
@@ -14,6 +14,7 @@ class TestMetricsCollection(unittest.TestCase):
         metrics_settings = MetricsSettings()
         self.assertEqual(metrics_settings.file_name, 'metrics.log')
         self.assertEqual(metrics_settings.update_interval, 0.1)
+        self.assertIsNone(metrics_settings.http_port)
 
     def test_default_initialization_with_parameters(self):
         expected_directory = '/a/b'
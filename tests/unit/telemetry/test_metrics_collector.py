@@ -0,0 +1,167 @@
+from swift_conductor.settings.metrics_settings import MetricsSettings
+from swift_conductor.telemetry.metrics_collector import MetricsCollector
+from prometheus_client import CollectorRegistry
+from prometheus_client import values
+from prometheus_client.multiprocess import MultiProcessCollector
+from unittest.mock import Mock, patch
+import logging
+import os
+import tempfile
+import threading
+import unittest
+import urllib.request
+
+
+class TestMetricsCollector(unittest.TestCase):
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+        self.directory = tempfile.TemporaryDirectory()
+        self.patches = [
+            patch.dict(os.environ),
+            patch.object(values, 'ValueClass', values.ValueClass),
+            patch.object(MetricsCollector, 'counters', {}),
+            patch.object(MetricsCollector, 'gauges', {}),
+            patch.object(MetricsCollector, 'histograms', {}),
+            patch.object(MetricsCollector, 'registry', CollectorRegistry()),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+        self.directory.cleanup()
+        logging.disable(logging.NOTSET)
+
+    def test_latency_histograms_aggregated_across_processes(self):
+        metrics_collector = MetricsCollector(
+            MetricsSettings(directory=self.directory.name, latency_buckets=[0.1, 1.0])
+        )
+        metrics_collector.record_task_poll_time('task', 0.05)
+        metrics_collector.record_task_poll_time('task', 0.5)
+        metrics_collector.record_task_update_time('task', 2.0)
+        metrics_collector.record_task_execute_time('task', 3.0)
+        metrics_collector.record_task_end_to_end_time('task', 3.5)
+
+        samples = self.__collect_samples()
+
+        self.assertEqual(samples[('task_poll_latency_seconds_bucket', '0.1')], 1)
+        self.assertEqual(samples[('task_poll_latency_seconds_bucket', '1.0')], 2)
+        self.assertEqual(samples[('task_poll_latency_seconds_bucket', '+Inf')], 2)
+        self.assertEqual(samples[('task_update_latency_seconds_bucket', '+Inf')], 1)
+        self.assertEqual(samples[('task_update_latency_seconds_bucket', '1.0')], 0)
+        self.assertEqual(samples[('task_execute_latency_seconds_bucket', '5.0')], 1)
+        self.assertEqual(samples[('task_end_to_end_latency_seconds_bucket', '2.5')], 0)
+        self.assertEqual(samples[('task_end_to_end_latency_seconds_count', None)], 1)
+
+    def test_task_metrics_bound_once_per_task_type(self):
+        metrics_collector = MetricsCollector(MetricsSettings(directory=self.directory.name))
+        task_metrics = metrics_collector.get_task_metrics('task')
+        self.assertIs(metrics_collector.get_task_metrics('task'), task_metrics)
+        self.assertIsNot(metrics_collector.get_task_metrics('other'), task_metrics)
+
+        task_metrics.increment_task_poll()
+        metrics_collector.increment_task_poll('task')
+        task_metrics.record_task_update_time(0.5)
+
+        samples = self.__collect_samples()
+
+        self.assertEqual(samples[('task_poll_total', None)], 2)
+        self.assertEqual(samples[('task_update_latency_seconds_count', None)], 1)
+
+    def test_mark_process_dead(self):
+        metrics_collector = MetricsCollector(MetricsSettings(directory=self.directory.name))
+        metrics_collector.record_task_poll_interval('task', 0.5)
+        metrics_collector.record_task_poll_time('task', 0.05)
+        metrics_collector.record_worker_drain_time(1.5)
+        samples = self.__collect_samples()
+        self.assertEqual(samples[('task_poll_interval', None)], 0.5)
+        self.assertEqual(samples[('task_poll_time', None)], 0.05)
+
+        metrics_collector.mark_process_dead(os.getpid())
+
+        samples = self.__collect_samples()
+        self.assertNotIn(('task_poll_interval', None), samples)
+        self.assertNotIn(('task_poll_time', None), samples)
+        # Counters and histograms of the process are still aggregated
+        self.assertEqual(samples[('task_poll_latency_seconds_count', None)], 1)
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry, path=self.directory.name)
+        self.assertEqual(registry.get_sample_value('worker_drain_time', {'pid': str(os.getpid())}), 1.5)
+
+    def test_bind_task_metrics(self):
+        metrics_collector = MetricsCollector(MetricsSettings(directory=self.directory.name))
+        metrics_collector.bind_task_metrics(['task', 'other'])
+        metrics_collector.bind_task_metrics('single')
+        self.assertEqual(set(metrics_collector.task_metrics), {'task', 'other', 'single'})
+
+    def test_task_result_payload_serialized_once(self):
+        metrics_collector = MetricsCollector(MetricsSettings(directory=self.directory.name, input_size_sample_rate=1.0))
+        serialize = Mock(return_value=b'{"outputData": {}}')
+        body = metrics_collector.measure_task_result_payload('task', 'TASK_RESULT', serialize)
+        metrics_collector.measure_task_input_payload('task', {'a': 1}, Mock(return_value=b'{"a": 1}'))
+
+        samples = self.__collect_samples()
+
+        self.assertEqual(body, b'{"outputData": {}}')
+        serialize.assert_called_once_with('TASK_RESULT')
+        self.assertEqual(samples[('task_result_size', None)], 18)
+        self.assertEqual(samples[('task_input_size', None)], 8)
+
+    def test_task_payload_not_sampled(self):
+        metrics_collector = MetricsCollector(
+            MetricsSettings(directory=self.directory.name, payload_size_sample_rate=0.0, input_size_sample_rate=0.0)
+        )
+        serialize = Mock()
+        body = metrics_collector.measure_task_result_payload('task', 'TASK_RESULT', serialize)
+        metrics_collector.measure_task_input_payload('task', {'a': 1}, serialize)
+        self.assertEqual(body, 'TASK_RESULT')
+        serialize.assert_not_called()
+
+    def test_task_input_payload_sampled_by_default(self):
+        metrics_collector = MetricsCollector(MetricsSettings(directory=self.directory.name))
+        serialize = Mock(return_value=b'{"a": 1}')
+        with patch('random.random', return_value=0.5):
+            metrics_collector.measure_task_input_payload('task', {'a': 1}, serialize)
+        serialize.assert_not_called()
+
+    def test_task_result_payload_not_serializable(self):
+        metrics_collector = MetricsCollector(MetricsSettings(directory=self.directory.name))
+        body = metrics_collector.measure_task_result_payload('task', 'TASK_RESULT', Mock(side_effect=TypeError()))
+        self.assertEqual(body, 'TASK_RESULT')
+
+    def test_metrics_disabled_without_settings(self):
+        metrics_collector = MetricsCollector(None)
+        metrics_collector.record_task_execute_time('task', 3.0)
+        metrics_collector.get_task_metrics('task').increment_task_poll()
+        serialize = Mock()
+        self.assertEqual(metrics_collector.measure_task_result_payload('task', 'TASK_RESULT', serialize), 'TASK_RESULT')
+        serialize.assert_not_called()
+        self.assertEqual(MetricsCollector.histograms, {})
+        self.assertEqual(MetricsCollector.counters, {})
+
+    def test_metrics_server_aggregates_on_scrape(self):
+        settings = MetricsSettings(directory=self.directory.name, http_port=0, http_address='127.0.0.1')
+        metrics_collector = MetricsCollector(settings)
+        server = MetricsCollector.create_metrics_server(settings)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            metrics_collector.record_task_update_time('task', 0.5)
+            url = f'http://127.0.0.1:{server.server_port}/metrics'
+            with urllib.request.urlopen(url, timeout=5) as response:
+                body = response.read().decode('utf-8')
+        finally:
+            server.shutdown()
+            server.server_close()
+        self.assertIn('task_update_latency_seconds_count{taskType="task"} 1.0', body)
+
+    def __collect_samples(self) -> dict:
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry, path=self.directory.name)
+        samples = {}
+        for metric in registry.collect():
+            for sample in metric.samples:
+                if sample.labels.get('taskType') != 'task':
+                    continue
+                samples[(sample.name, sample.labels.get('le'))] = sample.value
+        return samples
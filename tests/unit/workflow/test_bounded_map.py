@@ -0,0 +1,35 @@
+import itertools
+import time
+import unittest
+
+from swift_conductor.workflow.bounded_map import bounded_map
+
+
+class TestBoundedMap(unittest.TestCase):
+    def test_results_in_order(self):
+        def square(i):
+            time.sleep(0.01 * (5 - i))
+            return i * i
+
+        self.assertEqual(list(bounded_map(square, range(5), max_workers=3)), [(i, i * i) for i in range(5)])
+
+    def test_reads_items_as_threads_become_free(self):
+        read = itertools.count()
+
+        def items():
+            for i in range(100):
+                next(read)
+                yield i
+
+        results = bounded_map(lambda i: i, items(), max_workers=2)
+        self.assertEqual(next(results), (0, 0))
+        # Up to max_workers * 2 calls are pending when the first result is returned
+        self.assertEqual(next(read), 5)
+        self.assertEqual(len(list(results)), 99)
+
+    def test_error(self):
+        def fail(i):
+            raise ValueError(i)
+
+        with self.assertRaises(ValueError):
+            list(bounded_map(fail, range(3), max_workers=2))
@@ -0,0 +1,24 @@
+import time
+import unittest
+
+from swift_conductor.workflow.rate_limiter import RateLimiter
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_burst_does_not_wait(self):
+        rate_limiter = RateLimiter(rate=1, burst=3)
+        start_time = time.monotonic()
+        for _ in range(3):
+            rate_limiter.acquire()
+        self.assertLess(time.monotonic() - start_time, 0.5)
+
+    def test_waits_for_tokens(self):
+        rate_limiter = RateLimiter(rate=20)
+        start_time = time.monotonic()
+        for _ in range(3):
+            rate_limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start_time, 0.09)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=0)
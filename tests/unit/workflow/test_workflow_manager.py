@@ -0,0 +1,118 @@
+import logging
+import time
+import unittest
+
+from unittest.mock import patch, call
+from swift_conductor.configuration import Configuration
+from swift_conductor.http.api.workflow_resource_api import WorkflowResourceApi
+from swift_conductor.http.models.start_workflow_request import StartWorkflowRequest
+from swift_conductor.http.models.scrollable_search_result_workflow_summary import ScrollableSearchResultWorkflowSummary
+from swift_conductor.http.models.workflow_summary import WorkflowSummary
+from swift_conductor.http.rest import ApiException
+from swift_conductor.workflow.workflow_manager import WorkflowManager
+
+QUERY = 'workflowType IN (ut_wf)'
+QUERY_ID = 'ut_query_id'
+
+
+def search_page(start, count, query_id=QUERY_ID):
+    return ScrollableSearchResultWorkflowSummary(
+        results=[WorkflowSummary(workflow_id=f'wf_{i}') for i in range(start, start + count)],
+        query_id=query_id
+    )
+
+
+class TestWorkflowManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        configuration = Configuration("http://localhost:8080/api")
+        cls.workflow_manager = WorkflowManager(configuration)
+
+    def setUp(self):
+        logging.disable(logging.CRITICAL)
+
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+
+    @patch.object(WorkflowResourceApi, 'search')
+    def test_iter_search(self, mock):
+        mock.side_effect = [search_page(0, 2), search_page(2, 2), search_page(4, 1)]
+        workflow_ids = [w.workflow_id for w in self.workflow_manager.iter_search(query=QUERY, page_size=2)]
+        self.assertEqual(workflow_ids, ['wf_0', 'wf_1', 'wf_2', 'wf_3', 'wf_4'])
+        self.assertEqual(mock.call_args_list, [
+            call(start=0, size=2, query=QUERY),
+            call(start=2, query_id=QUERY_ID, size=2, query=QUERY),
+            call(start=4, query_id=QUERY_ID, size=2, query=QUERY),
+        ])
+
+    @patch.object(WorkflowResourceApi, 'search')
+    def test_iter_search_without_query_id(self, mock):
+        mock.side_effect = [search_page(0, 2, None), search_page(2, 0, None)]
+        workflow_ids = [w.workflow_id for w in self.workflow_manager.iter_search(page_size=2, prefetch=False)]
+        self.assertEqual(workflow_ids, ['wf_0', 'wf_1'])
+        self.assertEqual(mock.call_args_list, [call(start=0, size=2), call(start=2, size=2)])
+
+    @patch.object(WorkflowResourceApi, 'search')
+    def test_iter_search_with_page_size_capped_by_server(self, mock):
+        mock.side_effect = [search_page(0, 3), search_page(3, 3), search_page(6, 1)]
+        workflow_ids = [w.workflow_id for w in self.workflow_manager.iter_search(page_size=5, prefetch=False)]
+        self.assertEqual(workflow_ids, [f'wf_{i}' for i in range(7)])
+        self.assertEqual(mock.call_count, 3)
+
+    @patch.object(WorkflowResourceApi, 'search')
+    def test_iter_search_until_empty_page(self, mock):
+        mock.side_effect = [search_page(0, 3), search_page(3, 0)]
+        workflow_ids = [w.workflow_id for w in self.workflow_manager.iter_search(page_size=5)]
+        self.assertEqual(workflow_ids, ['wf_0', 'wf_1', 'wf_2'])
+        self.assertEqual(mock.call_count, 2)
+
+    @patch.object(WorkflowResourceApi, 'search')
+    def test_iter_search_prefetches_next_page(self, mock):
+        mock.side_effect = [search_page(0, 2), search_page(2, 2), search_page(4, 0)]
+        iterator = self.workflow_manager.iter_search(page_size=2)
+        self.assertEqual(next(iterator).workflow_id, 'wf_0')
+        for _ in range(100):
+            if mock.call_count == 2:
+                break
+            time.sleep(0.01)
+        self.assertEqual(mock.call_count, 2)
+        iterator.close()
+
+    @patch.object(WorkflowResourceApi, 'search')
+    def test_iter_search_error(self, mock):
+        mock.side_effect = [search_page(0, 2), ApiException(status=500)]
+        iterator = self.workflow_manager.iter_search(page_size=2)
+        self.assertEqual([next(iterator).workflow_id, next(iterator).workflow_id], ['wf_0', 'wf_1'])
+        with self.assertRaises(ApiException):
+            next(iterator)
+
+
+    @patch.object(WorkflowResourceApi, 'start_workflow')
+    def test_bulk_start_workflows(self, mock):
+        def start_workflow(body):
+            if body.name == 'wf_3':
+                raise ApiException(status=500)
+            time.sleep(0.01 * (10 - int(body.name[3:])))
+            return body.name + '_id'
+        mock.side_effect = start_workflow
+
+        requests = (StartWorkflowRequest(name=f'wf_{i}') for i in range(10))
+        results = self.workflow_manager.bulk_start_workflows(requests, max_workers=4)
+
+        self.assertEqual(len(results), 10)
+        self.assertEqual([r.request.name for r in results], [f'wf_{i}' for i in range(10)])
+        self.assertEqual(results[0].workflow_id, 'wf_0_id')
+        self.assertTrue(results[0].succeeded)
+        self.assertFalse(results[3].succeeded)
+        self.assertIsInstance(results[3].error, ApiException)
+        self.assertEqual(sum(r.succeeded for r in results), 9)
+
+    @patch.object(WorkflowResourceApi, 'start_workflow', return_value='wf_id')
+    def test_bulk_start_workflows_rate_limit(self, mock):
+        start_time = time.monotonic()
+        results = self.workflow_manager.bulk_start_workflows(
+            [StartWorkflowRequest(name='wf')] * 6, max_workers=6, rate_limit=50
+        )
+        self.assertGreaterEqual(time.monotonic() - start_time, 0.09)
+        self.assertEqual([r.workflow_id for r in results], ['wf_id'] * 6)